@@ -0,0 +1,6 @@
+"""성능 벤치마크 스위트
+
+- `workloads`: 시드 고정 합성 작업 생성기
+- `run`: 실행기 + 기준선 비교 (`python -m benchmarks.run`)
+- `scaling`: 조각 수 / 크기 종류 / 원판 종류 스윕 + 복잡도 지수 (`python -m benchmarks.scaling`)
+"""
@@ -0,0 +1,239 @@
+"""벤치마크 실행기 + 기준선(baseline) 비교
+
+실행:
+    uv run python -m benchmarks.run                          # quick 스위트 → stdout 요약
+    uv run python -m benchmarks.run --suite standard --out bench.json
+    uv run python -m benchmarks.run --baseline benchmarks/baseline.json --time-tolerance 0.3
+
+작업 × 패커마다 다음을 기록한다:
+    seconds      벽시계 시간 (--repeat 회 중 최소)
+    peak_kib     tracemalloc 피크 메모리 (시간 측정과 별도 1회 실행 — tracemalloc은 느리다)
+    plates       사용 원판 수
+    utilization  사용 원판 면적 대비 배치 조각 면적
+    placed / unplaced
+    nodes        SearchStats 카운터 (백트래킹/shelf 노드, 가지치기, memo 적중 ...)
+    phases       PackProfile 단계별 초
+
+기준선과 비교해 시간/메모리가 허용 비율 이상 늘거나, 판 수가 늘거나, 이용률이
+허용치 이상 떨어지면 회귀로 보고 종료 코드 1을 반환한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from woodcut.strategies import PackProfile, RegionBasedPacker
+from woodcut.strategies.region_based_split import RegionBasedPackerWithSplit
+
+from .workloads import SUITES, Workload, suite
+
+PACKERS = {
+    'region_based': RegionBasedPacker,
+    'region_based_split': RegionBasedPackerWithSplit,
+}
+
+DEFAULT_THRESHOLDS = {
+    'time': 0.25,          # 25% 이상 느려지면 회귀
+    'memory': 0.25,        # 피크 메모리 25% 이상 증가
+    'utilization': 0.005,  # 이용률 0.5%p 이상 하락
+    'min_seconds': 0.01,   # 이보다 짧은 측정은 시간 비교 생략 (잡음)
+}
+
+
+def _pack_once(packer_cls, wl: Workload, profile: PackProfile | None = None):
+    packer = packer_cls(wl.stocks, wl.kerf, wl.allow_rotation)
+    plates, unplaced = packer.pack(wl.pieces, profile=profile)
+    return packer, plates, unplaced
+
+
+def run_case(packer_name: str, wl: Workload, repeat: int = 1, memory: bool = True) -> dict:
+    """작업 1건 × 패커 1개 측정. 솔버 예외도 결과 항목(`error`)으로 남긴다."""
+    packer_cls = PACKERS[packer_name]
+    record: dict = {
+        'workload': wl.name,
+        'packer': packer_name,
+        'family': wl.family,
+        'inventory': wl.inventory,
+        'pieces': wl.total_pieces,
+        'distinct_sizes': len(wl.pieces),
+        'stock_types': len(wl.stocks),
+    }
+
+    best = float('inf')
+    profile = PackProfile()
+    try:
+        for _ in range(max(1, repeat)):
+            profile = PackProfile()
+            started = time.perf_counter()
+            packer, plates, unplaced = _pack_once(packer_cls, wl, profile)
+            best = min(best, time.perf_counter() - started)
+        if memory:
+            tracemalloc.start()
+            try:
+                _pack_once(packer_cls, wl)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            record['peak_kib'] = round(peak / 1024, 1)
+    except Exception as e:  # 회귀 탐지 대상 — 스위트 전체를 멈추지 않는다
+        record['error'] = f"{type(e).__name__}: {e}"
+        return record
+
+    stock_area = sum(p['width'] * p['height'] for p in plates)
+    placed_area = sum(
+        p.get('placed_w', p['width']) * p.get('placed_h', p['height'])
+        for plate in plates for p in plate['pieces']
+    )
+    record.update({
+        'seconds': best,
+        'plates': len(plates),
+        'utilization': placed_area / stock_area if stock_area else 0.0,
+        'placed': wl.total_pieces - len(unplaced),
+        'unplaced': len(unplaced),
+        'nodes': packer.stats.as_dict(),
+        'phases': profile.as_dict()['phases'],
+    })
+    return record
+
+
+def run_suite(
+    workloads: list[Workload],
+    packers: list[str],
+    repeat: int = 1,
+    memory: bool = True,
+    progress=None,
+) -> dict:
+    """스위트 실행 → {'meta', 'results'}"""
+    results = []
+    for wl in workloads:
+        for name in packers:
+            rec = run_case(name, wl, repeat=repeat, memory=memory)
+            results.append(rec)
+            if progress:
+                progress(rec)
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, thresholds: dict | None = None) -> list[dict]:
+    """기준선 대비 회귀 목록
+
+    (workload, packer)가 양쪽에 모두 있는 항목만 비교한다.
+
+    Returns:
+        [{'workload', 'packer', 'metric', 'baseline', 'current', 'limit'}, ...]
+    """
+    th = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    base_index = {(r['workload'], r['packer']): r for r in baseline.get('results', [])}
+    regressions = []
+
+    def add(rec, metric, base_v, cur_v, limit):
+        regressions.append({
+            'workload': rec['workload'], 'packer': rec['packer'], 'metric': metric,
+            'baseline': base_v, 'current': cur_v, 'limit': limit,
+        })
+
+    for rec in current.get('results', []):
+        base = base_index.get((rec['workload'], rec['packer']))
+        if base is None:
+            continue
+        if 'error' in rec:
+            if 'error' not in base:
+                add(rec, 'error', None, rec['error'], None)
+            continue
+        if 'error' in base:
+            continue
+
+        if max(base['seconds'], rec['seconds']) >= th['min_seconds']:
+            limit = base['seconds'] * (1 + th['time'])
+            if rec['seconds'] > limit:
+                add(rec, 'seconds', base['seconds'], rec['seconds'], limit)
+        if 'peak_kib' in base and 'peak_kib' in rec:
+            limit = base['peak_kib'] * (1 + th['memory'])
+            if rec['peak_kib'] > limit:
+                add(rec, 'peak_kib', base['peak_kib'], rec['peak_kib'], limit)
+        if rec['plates'] > base['plates']:
+            add(rec, 'plates', base['plates'], rec['plates'], base['plates'])
+        if rec['unplaced'] > base['unplaced']:
+            add(rec, 'unplaced', base['unplaced'], rec['unplaced'], base['unplaced'])
+        limit = base['utilization'] - th['utilization']
+        if rec['utilization'] < limit:
+            add(rec, 'utilization', base['utilization'], rec['utilization'], limit)
+    return regressions
+
+
+def format_row(rec: dict) -> str:
+    """요약 1줄"""
+    head = f"{rec['workload']:<32} {rec['packer']:<19}"
+    if 'error' in rec:
+        return f"{head} ERROR {rec['error']}"
+    mem = f"{rec['peak_kib']:>9.0f}KiB" if 'peak_kib' in rec else ' ' * 12
+    return (
+        f"{head} {rec['seconds']:>8.3f}s {mem} plates={rec['plates']:<3} "
+        f"util={rec['utilization']:.1%} nodes={rec['nodes']['backtrack_nodes']}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.split('\n')[0])
+    parser.add_argument('--suite', default='quick', choices=sorted(SUITES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--packer', action='append', choices=sorted(PACKERS),
+                        help='측정할 패커 (반복 지정 가능, 기본: 전부)')
+    parser.add_argument('--repeat', type=int, default=3, help='시간 측정 반복 수 (최소값 채택)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 측정 생략')
+    parser.add_argument('--out', help='결과 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 기준선 JSON 경로')
+    parser.add_argument('--time-tolerance', type=float, default=DEFAULT_THRESHOLDS['time'])
+    parser.add_argument('--memory-tolerance', type=float, default=DEFAULT_THRESHOLDS['memory'])
+    parser.add_argument('--util-tolerance', type=float, default=DEFAULT_THRESHOLDS['utilization'])
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        suite(args.suite, seed=args.seed),
+        args.packer or list(PACKERS),
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        progress=lambda rec: print(format_row(rec), flush=True),
+    )
+    report['meta']['suite'] = args.suite
+    report['meta']['seed'] = args.seed
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"→ {args.out}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, {
+        'time': args.time_tolerance,
+        'memory': args.memory_tolerance,
+        'utilization': args.util_tolerance,
+    })
+    if not regressions:
+        print(f"기준선 대비 회귀 없음 ({args.baseline})")
+        return 0
+    print(f"\n❌ 회귀 {len(regressions)}건 ({args.baseline})")
+    for r in regressions:
+        print(f"  {r['workload']} [{r['packer']}] {r['metric']}: {r['baseline']} → {r['current']}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""스케일링 하니스 — 조각 수 / 서로 다른 크기 수 / 원판 종류 수 스윕
+
+실행:
+    uv run python -m benchmarks.scaling --csv scaling.csv
+    uv run python -m benchmarks.scaling --axes distinct --budget 60 --no-rotation
+
+기준점(기본 pieces=30, distinct=5, stocks=1)에서 한 축씩 바꿔 가며 측정한다
+(회전 허용/불가 각각). 각 점은 별도 프로세스에서 돌고 `--budget`초를 넘기면
+끊는다. 한 축에서 시간 초과가 나면 그 축의 더 큰 값은 건너뛴다.
+
+측정값:
+    pack_s      pack() 전체
+    anchor_s    `_allocate_anchor_backtrack` 누적 (PackProfile 'anchor_backtrack')
+    strip_s     `_pack_strip_shelves` 누적 (PackProfile 'strip_shelves')
+    rss_kib     pack() 동안 늘어난 최대 RSS (resource 모듈 없으면 빈 값)
+    nodes       앵커 백트래킹 노드 수
+
+출력: 표(stdout) + CSV + 축별 log-log 기울기(복잡도 지수)와 무릎 지점 —
+인접한 두 점 사이 국소 지수가 `--knee-exponent`를 넘거나 시간 초과가 난 첫 구간.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import multiprocessing as mp
+import sys
+import time
+
+from woodcut.strategies import PackProfile
+from woodcut.strategies.region_based import RegionBasedPacker
+
+from .workloads import generate_sized
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+AXES = {
+    'pieces': [10, 30, 100, 300, 1000, 3000, 10000, 50000],
+    'distinct': [1, 2, 5, 10, 20, 30, 50, 100, 200],
+    'stocks': [1, 2, 4, 8],
+}
+# 기준점 — 앵커 백트래킹이 조각 수·크기 종류 모두에 초선형이라 작은 값에서 출발해야
+# 각 축의 무릎이 보인다
+CENTER = {'pieces': 30, 'distinct': 5, 'stocks': 1}
+
+COLUMNS = [
+    'axis', 'rotation', 'pieces', 'distinct', 'stocks', 'status',
+    'pack_s', 'anchor_s', 'strip_s', 'rss_kib', 'nodes', 'plates', 'unplaced',
+]
+
+
+def _rss_kib() -> int | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KiB
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def measure_point(pieces: int, distinct: int, stocks: int, rotation: bool, seed: int = 0) -> dict:
+    """점 1개 측정 (현재 프로세스에서)"""
+    wl = generate_sized(pieces, distinct, stocks, seed=seed, allow_rotation=rotation)
+    packer = RegionBasedPacker(wl.stocks, wl.kerf, wl.allow_rotation)
+    profile = PackProfile()
+    rss_before = _rss_kib()
+    started = time.perf_counter()
+    plates, unplaced = packer.pack(wl.pieces, profile=profile)
+    elapsed = time.perf_counter() - started
+    rss_after = _rss_kib()
+    return {
+        'status': 'ok',
+        'pack_s': elapsed,
+        'anchor_s': profile.phases.get('anchor_backtrack', 0.0),
+        'strip_s': profile.phases.get('strip_shelves', 0.0),
+        'rss_kib': rss_after - rss_before if rss_before is not None else None,
+        'nodes': packer.stats.backtrack_nodes,
+        'plates': len(plates),
+        'unplaced': len(unplaced),
+    }
+
+
+def _child(conn, args) -> None:
+    try:
+        conn.send(measure_point(*args))
+    except Exception as e:
+        conn.send({'status': f"error: {type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def run_point(pieces: int, distinct: int, stocks: int, rotation: bool,
+              budget: float, seed: int = 0) -> dict:
+    """점 1개를 자식 프로세스에서 측정 — budget초 초과 시 강제 종료"""
+    parent, child = mp.Pipe(duplex=False)
+    proc = mp.Process(target=_child, args=(child, (pieces, distinct, stocks, rotation, seed)))
+    proc.start()
+    child.close()
+    try:
+        if parent.poll(budget):
+            return parent.recv()
+        return {'status': 'timeout'}
+    except EOFError:
+        return {'status': f'crashed (exit {proc.exitcode})'}
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        parent.close()
+
+
+def sweep(axes: list[str], rotations: list[bool], budget: float, seed: int = 0,
+          center: dict | None = None, values: dict | None = None, progress=None) -> list[dict]:
+    """축별 스윕 — 한 축에서 시간 초과가 나면 그 축 나머지는 'skipped'"""
+    center = {**CENTER, **(center or {})}
+    values = {**AXES, **(values or {})}
+    rows = []
+    for axis in axes:
+        for rotation in rotations:
+            exhausted = False
+            for v in values[axis]:
+                point = {**center, axis: v}
+                row = {'axis': axis, 'rotation': rotation, **point}
+                if exhausted:
+                    row['status'] = 'skipped'
+                else:
+                    row.update(run_point(
+                        point['pieces'], point['distinct'], point['stocks'],
+                        rotation, budget, seed,
+                    ))
+                    exhausted = row['status'] != 'ok'
+                rows.append(row)
+                if progress:
+                    progress(row)
+    return rows
+
+
+def fit_exponent(xs: list[float], ys: list[float]) -> float | None:
+    """log-log 최소제곱 기울기 (y ∝ x^k 의 k). 유효 점 2개 미만이면 None."""
+    pts = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y and y > 0]
+    if len(pts) < 2 or len({p[0] for p in pts}) < 2:
+        return None
+    mx = sum(p[0] for p in pts) / len(pts)
+    my = sum(p[1] for p in pts) / len(pts)
+    sxx = sum((p[0] - mx) ** 2 for p in pts)
+    sxy = sum((p[0] - mx) * (p[1] - my) for p in pts)
+    return sxy / sxx
+
+
+def analyze(rows: list[dict], knee_exponent: float = 2.0, min_seconds: float = 1e-3) -> list[dict]:
+    """(축, 회전)별 복잡도 지수와 무릎 지점"""
+    out = []
+    groups: dict[tuple, list[dict]] = {}
+    for r in rows:
+        groups.setdefault((r['axis'], r['rotation']), []).append(r)
+    for (axis, rotation), rs in groups.items():
+        ok = [r for r in rs if r['status'] == 'ok']
+        summary = {'axis': axis, 'rotation': rotation}
+        for metric in ('pack_s', 'anchor_s', 'strip_s', 'rss_kib'):
+            pts = [(r[axis], r[metric]) for r in ok
+                   if r.get(metric) is not None and (metric == 'rss_kib' or r[metric] >= min_seconds)]
+            summary[metric] = fit_exponent([p[0] for p in pts], [p[1] for p in pts])
+
+        knee = None
+        if rs and rs[0]['status'] != 'ok':
+            knee = (None, rs[0][axis], rs[0]['status'])
+        for prev, cur in zip(rs, rs[1:]):
+            if prev['status'] != 'ok':
+                break
+            if cur['status'] != 'ok':
+                knee = (prev[axis], cur[axis], cur['status'])
+                break
+            if prev['pack_s'] >= min_seconds:
+                k = fit_exponent([prev[axis], cur[axis]], [prev['pack_s'], cur['pack_s']])
+                if k is not None and k > knee_exponent:
+                    knee = (prev[axis], cur[axis], f"k={k:.1f}")
+                    break
+        summary['knee'] = knee
+        out.append(summary)
+    return out
+
+
+def _fmt(v, spec: str) -> str:
+    return format(v, spec) if isinstance(v, (int, float)) else '-'
+
+
+def format_row(row: dict) -> str:
+    head = (f"{row['axis']:<9}{'rot' if row['rotation'] else 'norot':<6}"
+            f"n={row['pieces']:<6}d={row['distinct']:<4}k={row['stocks']:<2}")
+    if row['status'] != 'ok':
+        return f"{head} {row['status']}"
+    return (f"{head} pack={_fmt(row['pack_s'], '.4f')}s anchor={_fmt(row['anchor_s'], '.4f')}s "
+            f"strip={_fmt(row['strip_s'], '.4f')}s rss=+{_fmt(row['rss_kib'], 'd')}KiB "
+            f"nodes={row['nodes']} plates={row['plates']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.scaling', description=__doc__.split('\n')[0])
+    parser.add_argument('--axes', default=','.join(AXES), help=f"스윕할 축 (기본: {','.join(AXES)})")
+    parser.add_argument('--budget', type=float, default=30.0, help='점 1개 시간 예산(초)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-rotation', action='store_true', help='회전 불가만 측정')
+    parser.add_argument('--rotation-only', action='store_true', help='회전 허용만 측정')
+    parser.add_argument('--knee-exponent', type=float, default=2.0)
+    parser.add_argument('--csv', help='CSV 출력 경로')
+    args = parser.parse_args(argv)
+
+    axes = [a.strip() for a in args.axes.split(',') if a.strip()]
+    unknown = set(axes) - set(AXES)
+    if unknown:
+        parser.error(f"알 수 없는 축: {', '.join(sorted(unknown))}")
+    rotations = [True, False]
+    if args.no_rotation:
+        rotations = [False]
+    elif args.rotation_only:
+        rotations = [True]
+
+    rows = sweep(axes, rotations, args.budget, args.seed,
+                 progress=lambda r: print(format_row(r), flush=True))
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"→ {args.csv}")
+
+    print("\n복잡도 지수 (log-log 기울기) / 무릎")
+    for s in analyze(rows, args.knee_exponent):
+        knee = f"{s['knee'][0]}→{s['knee'][1]} ({s['knee'][2]})" if s['knee'] else '-'
+        print(f"  {s['axis']:<9}{'rot' if s['rotation'] else 'norot':<6}"
+              f"pack={_fmt(s['pack_s'], '.2f')} anchor={_fmt(s['anchor_s'], '.2f')} "
+              f"strip={_fmt(s['strip_s'], '.2f')} rss={_fmt(s['rss_kib'], '.2f')}  knee={knee}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""시드 고정 합성 작업(workload) 생성기
+
+같은 (family, n_pieces, seed)면 항상 같은 조각/원판 목록을 만든다. 분포:
+
+- cabinet: 캐비닛 세트 — 측판/상하판/선반/뒷판 (깊이·높이가 몇 가지 규격으로 반복)
+- door_drawer: 문짝 + 서랍 전판/측판 혼합 (높이 규격이 적고 폭이 다양)
+- uniform: 100~1200 × 100~1000 균등 난수
+- heavy_tailed: 파레토 분포 — 작은 조각 다수 + 원판에 가까운 큰 조각 소수
+
+원판 재고:
+- one: 2440×1220 한 종류
+- many: 2440×1220, 1830×915, 2440×610, 1220×1220 등 여러 종류
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+FAMILIES = ('cabinet', 'door_drawer', 'uniform', 'heavy_tailed')
+INVENTORIES = ('one', 'many')
+
+# 표준 원판 (width, height)
+_STOCK_SIZES = [
+    (2440, 1220), (1830, 915), (2440, 610), (1220, 1220),
+    (2100, 900), (3050, 1525), (2800, 2070), (1220, 610),
+]
+
+# 조각 최대 크기 — 가장 작은 원판 짧은 변보다 작게 잡아 대부분 배치 가능하게
+_MAX_LONG = 2400
+_MAX_SHORT = 1200
+
+
+@dataclass
+class Workload:
+    """벤치마크 작업 1건 — `pack()`에 그대로 넘길 수 있는 형태"""
+    name: str
+    family: str
+    inventory: str
+    seed: int
+    pieces: list[tuple[int, int, int]]
+    stocks: list[tuple[int, int, int]]
+    kerf: int = 5
+    allow_rotation: bool = True
+
+    @property
+    def total_pieces(self) -> int:
+        return sum(c for _, _, c in self.pieces)
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'family': self.family,
+            'inventory': self.inventory,
+            'seed': self.seed,
+            'kerf': self.kerf,
+            'allow_rotation': self.allow_rotation,
+            'pieces': [list(p) for p in self.pieces],
+            'stocks': [list(s) for s in self.stocks],
+        }
+
+
+def _merge(sizes: list[tuple[int, int]]) -> list[tuple[int, int, int]]:
+    """(w, h) 나열 → 같은 크기 합친 (w, h, count), 처음 등장 순서 유지"""
+    counts: dict[tuple[int, int], int] = {}
+    for s in sizes:
+        counts[s] = counts.get(s, 0) + 1
+    return [(w, h, c) for (w, h), c in counts.items()]
+
+
+def _cabinet(rng: random.Random, n: int) -> list[tuple[int, int]]:
+    depths = [560, 300, 350]
+    heights = [720, 870, 2100]
+    out: list[tuple[int, int]] = []
+    while len(out) < n:
+        width = rng.choice([300, 400, 450, 500, 600, 800, 900])
+        depth = rng.choice(depths)
+        height = rng.choice(heights)
+        inner = width - 36
+        parts = [(depth, height), (depth, height), (inner, depth), (inner, depth)]
+        parts += [(inner, depth - 20)] * rng.randint(0, 3)   # 선반
+        if rng.random() < 0.6:
+            parts.append((width - 4, height - 4))             # 뒷판
+        out.extend(parts)
+    return out[:n]
+
+
+def _door_drawer(rng: random.Random, n: int) -> list[tuple[int, int]]:
+    out: list[tuple[int, int]] = []
+    while len(out) < n:
+        width = rng.choice([296, 396, 446, 496, 596, 796])
+        if rng.random() < 0.5:
+            out.append((width, rng.choice([716, 866, 2096])))  # 문짝
+        else:
+            front_h = rng.choice([140, 180, 280])
+            out.append((width, front_h))                       # 서랍 전판
+            out.extend([(500, front_h - 30)] * 2)              # 서랍 측판
+            out.append((width - 60, front_h - 30))             # 서랍 뒷판
+    return out[:n]
+
+
+def _uniform(rng: random.Random, n: int) -> list[tuple[int, int]]:
+    return [(rng.randint(100, 1200), rng.randint(100, 1000)) for _ in range(n)]
+
+
+def _heavy_tailed(rng: random.Random, n: int) -> list[tuple[int, int]]:
+    out = []
+    for _ in range(n):
+        long = min(_MAX_LONG, int(80 * rng.paretovariate(1.2)))
+        short = min(_MAX_SHORT, long, int(60 * rng.paretovariate(1.4)))
+        # 규격 재사용 효과 — 10mm 단위로 반올림해 같은 크기가 반복되게
+        out.append((max(50, round(long, -1)), max(50, round(short, -1))))
+    return out
+
+
+_GENERATORS = {
+    'cabinet': _cabinet,
+    'door_drawer': _door_drawer,
+    'uniform': _uniform,
+    'heavy_tailed': _heavy_tailed,
+}
+
+
+def make_stocks(
+    inventory: str, pieces: list[tuple[int, int, int]], rng: random.Random,
+    n_types: int | None = None,
+) -> list[tuple[int, int, int]]:
+    """조각 면적 합을 넉넉히 덮는 원판 재고 생성
+
+    Args:
+        inventory: 'one' 또는 'many'
+        n_types: many일 때 원판 종류 수 (None이면 2~4 난수)
+    """
+    need = sum(w * h * c for w, h, c in pieces)
+    if inventory == 'one':
+        sizes = _STOCK_SIZES[:1]
+    elif inventory == 'many':
+        k = n_types if n_types is not None else rng.randint(2, 4)
+        sizes = _STOCK_SIZES[:max(1, min(k, len(_STOCK_SIZES)))]
+    else:
+        raise ValueError(f"알 수 없는 재고 유형: {inventory!r}")
+    # 각 종류가 혼자서도 전체를 (이용률 50% 가정으로) 덮을 만큼
+    return [(w, h, max(1, -(-2 * need // (w * h)))) for w, h in sizes]
+
+
+def generate(
+    family: str,
+    n_pieces: int,
+    seed: int = 0,
+    inventory: str = 'one',
+    allow_rotation: bool = True,
+    n_stock_types: int | None = None,
+) -> Workload:
+    """작업 1건 생성 — 같은 인자면 항상 같은 결과"""
+    if family not in _GENERATORS:
+        raise ValueError(f"알 수 없는 분포: {family!r} (가능: {', '.join(FAMILIES)})")
+    rng = random.Random(f"{family}:{n_pieces}:{seed}:{inventory}")
+    pieces = _merge(_GENERATORS[family](rng, n_pieces))
+    stocks = make_stocks(inventory, pieces, rng, n_stock_types)
+    name = f"{family}-{inventory}-n{n_pieces}-s{seed}"
+    if not allow_rotation:
+        name += "-norot"
+    return Workload(
+        name=name, family=family, inventory=inventory, seed=seed,
+        pieces=pieces, stocks=stocks, allow_rotation=allow_rotation,
+    )
+
+
+def generate_sized(
+    n_pieces: int,
+    n_distinct: int,
+    n_stock_types: int = 1,
+    seed: int = 0,
+    allow_rotation: bool = True,
+) -> Workload:
+    """조각 수 / 서로 다른 크기 수 / 원판 종류 수를 직접 지정한 균등 분포 작업
+
+    scaling 하니스용. 크기 n_distinct종을 뽑고 n_pieces개를 나눠 가진다
+    (n_pieces ≥ n_distinct면 종류마다 최소 1개).
+    """
+    rng = random.Random(f"sized:{n_pieces}:{n_distinct}:{n_stock_types}:{seed}")
+    n_distinct = max(1, min(n_distinct, n_pieces))
+    sizes: list[tuple[int, int]] = []
+    seen: set[tuple[int, int]] = set()
+    while len(sizes) < n_distinct:
+        size = (rng.randint(100, 1200), rng.randint(100, 1000))
+        if size not in seen:
+            seen.add(size)
+            sizes.append(size)
+    counts = [1] * n_distinct
+    for _ in range(n_pieces - n_distinct):
+        counts[rng.randrange(n_distinct)] += 1
+    pieces = [(w, h, c) for (w, h), c in zip(sizes, counts)]
+    inventory = 'one' if n_stock_types == 1 else 'many'
+    stocks = make_stocks(inventory, pieces, rng, n_stock_types)
+    name = f"sized-n{n_pieces}-d{n_distinct}-k{n_stock_types}-s{seed}"
+    if not allow_rotation:
+        name += "-norot"
+    return Workload(
+        name=name, family='sized', inventory=inventory, seed=seed,
+        pieces=pieces, stocks=stocks, allow_rotation=allow_rotation,
+    )
+
+
+# 스위트: (family, n_pieces, inventory, allow_rotation) 목록.
+# 앵커 백트래킹은 서로 다른 크기 수에 지수적으로 민감해서(20종 전후가 무릎)
+# 스위트는 수 초 안에 끝나는 크기로 잡는다. 더 큰 규모는 scaling 하니스에서 다룬다.
+SUITES = {
+    'quick': [
+        ('cabinet', 24, 'one', True),
+        ('door_drawer', 20, 'many', True),
+        ('uniform', 16, 'one', True),
+        ('heavy_tailed', 20, 'many', True),
+    ],
+    'standard': [
+        ('cabinet', 24, 'one', True),
+        ('cabinet', 24, 'one', False),
+        ('cabinet', 40, 'many', True),
+        ('cabinet', 60, 'one', True),
+        ('door_drawer', 20, 'many', True),
+        ('door_drawer', 24, 'many', True),
+        ('uniform', 16, 'one', True),
+        ('uniform', 16, 'one', False),
+        ('uniform', 20, 'many', True),
+        ('heavy_tailed', 20, 'many', True),
+        ('heavy_tailed', 22, 'many', True),
+    ],
+}
+
+
+def suite(name: str, seed: int = 0) -> list[Workload]:
+    """이름 있는 스위트의 작업 목록"""
+    if name not in SUITES:
+        raise ValueError(f"알 수 없는 스위트: {name!r} (가능: {', '.join(SUITES)})")
+    return [generate(f, n, seed, inv, rot) for f, n, inv, rot in SUITES[name]]
@@ -1,9 +1,18 @@
 """Woodcut - 목재 재단 최적화
 
 Guillotine Cut 알고리즘 기반 목재 재단 최적화 도구
+
+`visualize_solution`은 matplotlib을 끌어오므로 첫 접근 때 불러온다
+(`import woodcut`만으로는 matplotlib을 import 하지 않는다).
 """
 
 from .strategies import RegionBasedPacker
-from .visualizer import visualize_solution
 
 __all__ = ['RegionBasedPacker', 'visualize_solution']
+
+
+def __getattr__(name):
+    if name == 'visualize_solution':
+        from .visualizer import visualize_solution
+        return visualize_solution
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,198 @@
+"""`woodcut solve` — 작업 파일들을 비대화형으로 풀어 JSONL로 출력
+
+    woodcut solve jobs/ --jobs 8 > results.jsonl
+    cat orders.jsonl | woodcut solve - --summary
+    woodcut solve cabinet.csv --stock 2440x1220x10 --kerf 3
+
+입력 형식은 `woodcut.jobs` 참고. 작업마다 결과 한 줄을 바로 흘려보낸다 — 형태는
+배치 API 스트림과 같다: `{"index", "name", "ok", "result", "error"}`.
+
+메모리: 입력은 지연 읽기, 워커 풀에는 최대 `2 × --jobs`개만 올려 두고 하나가
+끝나야 다음 작업을 읽는다. 작업 수와 무관하게 메모리에 있는 작업/결과 수가
+일정하다. 기본은 입력 순서대로 출력(앞 작업이 길면 뒤 작업 결과가 기다린다),
+`--unordered`면 끝나는 순서대로 출력.
+
+종료 코드:
+    0  모든 작업 성공, 모든 조각 배치
+    1  미배치 조각이 있는 작업이 있음
+    2  사용법/입력 경로 오류
+    3  실패한 작업(잘못된 작업 형식, 솔버 예외)이 있거나, `--validate`에서
+       위반이 나온 작업이 있음 — 1보다 우선
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from .jobs import iter_jobs
+from .service import PACKERS, solve_order
+
+EXIT_OK = 0
+EXIT_UNPLACED = 1
+EXIT_USAGE = 2
+EXIT_FAILED = 3
+
+
+def solve_item(index: int, name: str, order: dict, compact: bool = False,
+               summary: bool = False, validate: bool = False) -> dict:
+    """작업 1건 → 결과 줄 dict. 예외는 `ok: False` 항목으로 변환 (워커에서 실행)."""
+    try:
+        result = solve_order(order, compact, validate)
+    except Exception as e:
+        return {'index': index, 'name': name, 'ok': False, 'result': None,
+                'error': f"{type(e).__name__}: {e}"}
+    if summary:
+        for key in ('plates', 'unplaced_pieces', 'format', 'piece_types'):
+            result.pop(key, None)
+    return {'index': index, 'name': name, 'ok': True, 'result': result, 'error': None}
+
+
+def _failed(index: int, name: str, error: str) -> dict:
+    return {'index': index, 'name': name, 'ok': False, 'result': None, 'error': error}
+
+
+def run_batch(jobs_iter, write, workers: int = 1, compact: bool = False,
+              summary: bool = False, ordered: bool = True, window: int | None = None,
+              validate: bool = False) -> dict:
+    """작업들을 풀어 결과 줄마다 `write(item)` 호출
+
+    Args:
+        jobs_iter: `iter_jobs()` 형태의 (name, order, error) 이터레이터
+        write: 결과 dict 1개를 받는 callable
+        workers: 1이면 현재 프로세스에서 차례로, 아니면 프로세스 풀
+        ordered: True면 입력 순서대로 write
+        window: 풀에 동시에 올려 둘 최대 작업 수 (기본 2 × workers)
+        validate: True면 워커에서 결과를 검증해 'violations'를 붙인다
+
+    Returns:
+        {'jobs', 'failed', 'unplaced_jobs', 'invalid_jobs'} 집계
+    """
+    totals = {'jobs': 0, 'failed': 0, 'unplaced_jobs': 0, 'invalid_jobs': 0}
+
+    def emit(item: dict) -> None:
+        totals['jobs'] += 1
+        if not item['ok']:
+            totals['failed'] += 1
+        else:
+            if item['result'].get('violations'):
+                totals['invalid_jobs'] += 1
+            if not item['result']['success']:
+                totals['unplaced_jobs'] += 1
+        write(item)
+
+    if workers <= 1:
+        for index, (name, order, error) in enumerate(jobs_iter):
+            emit(_failed(index, name, error) if error else
+                 solve_item(index, name, order, compact, summary, validate))
+        return totals
+
+    window = window or 2 * workers
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+
+        def drain(block_all: bool) -> None:
+            # 창이 찰 때는 하나 이상, 입력이 끝나면 전부 내보낸다
+            while pending and (block_all or len(pending) >= window):
+                if ordered:
+                    emit(pending.popleft().result())
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in [f for f in pending if f in done]:
+                    pending.remove(fut)
+                    emit(fut.result())
+
+        for index, (name, order, error) in enumerate(jobs_iter):
+            if error:
+                fut: Future = Future()
+                fut.set_result(_failed(index, name, error))
+            else:
+                fut = pool.submit(solve_item, index, name, order, compact, summary, validate)
+            pending.append(fut)
+            drain(block_all=False)
+        drain(block_all=True)
+    return totals
+
+
+def _parse_stock(text: str) -> tuple[int, int, int]:
+    """'2440x1220x3' / '2440x1220' → (w, h, count)"""
+    parts = text.lower().replace('×', 'x').split('x')
+    try:
+        nums = [int(p) for p in parts]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"원판 형식은 WxH 또는 WxHxN: {text!r}") from None
+    if len(nums) == 2:
+        nums.append(1)
+    if len(nums) != 3 or min(nums) <= 0:
+        raise argparse.ArgumentTypeError(f"원판 형식은 WxH 또는 WxHxN: {text!r}")
+    return tuple(nums)
+
+
+def main(argv: list[str] | None = None, stdin=None, stdout=None) -> int:
+    """`woodcut solve` 진입점 — 종료 코드는 모듈 docstring 참고"""
+    parser = argparse.ArgumentParser(prog='woodcut solve', description=__doc__.split('\n')[0].strip('` '))
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help='작업 파일(.json/.jsonl/.csv), 디렉터리, 또는 - (stdin JSONL). 기본: -')
+    parser.add_argument('-j', '--jobs', type=int, default=0, help='워커 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('-o', '--out', help='결과 JSONL 경로 (기본: stdout)')
+    parser.add_argument('--unordered', action='store_true', help='끝나는 순서대로 출력')
+    parser.add_argument('--summary', action='store_true', help='판/조각 상세 없이 개수만 출력')
+    parser.add_argument('--compact', action='store_true', help='판/조각을 컴팩트 인코딩으로 출력')
+    parser.add_argument('--validate', action='store_true',
+                        help='결과마다 겹침/커프/Guillotine 검증 결과(violations)를 붙임')
+    # 작업에 값이 없을 때의 기본값
+    parser.add_argument('--stock', action='append', type=_parse_stock, metavar='WxH[xN]',
+                        help='작업에 원판이 없을 때 쓸 원판 (반복 지정 가능)')
+    parser.add_argument('--kerf', type=int, help='톱날 두께 기본값 (mm, 작업에 없을 때)')
+    parser.add_argument('--no-rotation', action='store_true', help='작업에 없을 때 회전 금지')
+    parser.add_argument('--strategy', choices=sorted(PACKERS), help='전략 기본값')
+    args = parser.parse_args(argv)
+
+    defaults: dict = {}
+    if args.stock:
+        defaults['stocks'] = args.stock
+    if args.kerf is not None:
+        defaults['kerf'] = args.kerf
+    if args.no_rotation:
+        defaults['allow_rotation'] = False
+    if args.strategy:
+        defaults['strategy'] = args.strategy
+
+    missing = [src for src in args.inputs if src != '-' and not os.path.exists(src)]
+    if missing:
+        print(f"❌ 입력을 찾을 수 없습니다: {', '.join(missing)}", file=sys.stderr)
+        return EXIT_USAGE
+
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    out = open(args.out, 'w', encoding='utf-8') if args.out else (stdout or sys.stdout)
+
+    def write(item: dict) -> None:
+        out.write(json.dumps(item, ensure_ascii=False) + '\n')
+        out.flush()
+
+    try:
+        totals = run_batch(
+            iter_jobs(args.inputs, defaults, stdin=stdin), write, workers,
+            compact=args.compact, summary=args.summary, ordered=not args.unordered,
+            validate=args.validate,
+        )
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_USAGE
+    finally:
+        if args.out:
+            out.close()
+
+    print(f"작업 {totals['jobs']}건: 실패 {totals['failed']}, "
+          f"미배치 있음 {totals['unplaced_jobs']}", file=sys.stderr)
+    if totals['invalid_jobs']:
+        print(f"❌ 검증 위반 작업 {totals['invalid_jobs']}건", file=sys.stderr)
+    if totals['failed'] or totals['invalid_jobs']:
+        return EXIT_FAILED
+    if totals['unplaced_jobs']:
+        return EXIT_UNPLACED
+    return EXIT_OK
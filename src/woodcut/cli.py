@@ -3,6 +3,8 @@
 
 import sys
 
+from .trace import TRACE_INFO, configure_trace_from_env
+
 
 def main():
     """CLI 진입점
@@ -10,11 +12,31 @@ def main():
     서브커맨드:
     - (없음): 대화형 재단 계획
     - web: 웹 서버 시작
+    - solve <입력...>: 작업 파일 일괄 처리 → JSONL (`woodcut.batch`)
+    - render <결과 파일>: 결과를 SVG/PDF 도면으로 (`woodcut.render`)
+    - profile <job.json>: 작업 1건 프로파일링 (`woodcut.profiling`)
+
+    솔버 진행 로그는 trace 이벤트로 나온다 (`woodcut.trace`). 대화형 모드는
+    INFO(원판별 stock 선택)까지 콘솔에 출력하고, 웹 서버는 기본 무출력.
+    WOODCUT_TRACE=debug|info|warning|off, WOODCUT_TRACE_FILE=경로.jsonl로 조정.
     """
     if len(sys.argv) > 1 and sys.argv[1] == "web":
+        configure_trace_from_env()
         from .web import run_server
         run_server()
+    elif len(sys.argv) > 1 and sys.argv[1] == "solve":
+        configure_trace_from_env()
+        from .batch import main as solve_main
+        sys.exit(solve_main(sys.argv[2:]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "render":
+        from .render import main as render_main
+        sys.exit(render_main(sys.argv[2:]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "profile":
+        configure_trace_from_env()
+        from .profiling import main as profile_main
+        sys.exit(profile_main(sys.argv[2:]))
     else:
+        configure_trace_from_env(TRACE_INFO)
         from .interactive import run_interactive
         run_interactive()
 
@@ -0,0 +1,137 @@
+"""컴팩트 열 지향(columnar) 결과 인코딩
+
+기본 응답은 조각·절단선마다 `width`, `height`, `original`, `placed_w`,
+`region_x` 같은 키를 반복하는 중첩 dict라서 판 수십 장이면 JSON이 수 MB가 된다.
+컴팩트 인코딩은 조각 종류 표 1개 + 판마다 정수 배열 2개로 같은 정보를 담는다.
+
+    {
+        'format': 'woodcut.compact/1',
+        'piece_types': [[w, h], ...],            # type_id = 인덱스
+        'plates': [{
+            'width': W, 'height': H,
+            'stock_index': i,                    # 있을 때만 (pack() 결과는 항상)
+            'remnant_id': r,                     # 잔재를 쓴 원판만
+            'pieces': [x, y, type_id, rotated, ...],     # 조각당 4칸
+            'cuts': [direction, position, start, end, ...],  # 절단선당 4칸
+        }, ...],
+        'unplaced_pieces': [type_id, ...],
+    }
+
+- `rotated`: 0/1. `placed_w/h`는 type과 rotated로 복원된다 (조각은 항상 정확한
+  크기로 재단되므로 별도 저장 불필요).
+- `direction`: 0 = 'H', 1 = 'V'. 절단 순서(`order`)는 배열 순서 그대로.
+- `stock_index`/`remnant_id`: 어느 stock·잔재를 썼는지 — 같은 치수 stock이
+  여럿이어도 `incremental.repack()`이 원래 stock을 찾는다. 없는 판은 키를 뺀다.
+
+서버(`/api/cut?format=compact`)와 Pyodide 경로가 같은 모듈을 공유한다.
+Pyodide는 모든 모듈을 한 globals에서 실행하므로 이 파일은 다른 모듈을 import 하지 않는다.
+"""
+
+COMPACT_FORMAT = 'woodcut.compact/1'
+COMPACT_MEDIA_TYPE = 'application/vnd.woodcut.compact+json'
+
+PIECE_STRIDE = 4
+CUT_STRIDE = 4
+
+_CUT_DIR_CODE = {'H': 0, 'V': 1}
+_CUT_DIR_NAME = ('H', 'V')
+
+# 판 레코드에 그대로 옮기는 선택 키
+_PLATE_TAGS = ('stock_index', 'remnant_id')
+
+
+def encode_compact(plates: list[dict], unplaced: list[dict]) -> dict:
+    """plates/unplaced 리스트를 컴팩트 인코딩으로 변환.
+
+    Args:
+        plates: 패커가 반환한 판 dict 리스트
+        unplaced: 미배치 조각 dict 리스트
+
+    Returns:
+        {'format', 'piece_types', 'plates', 'unplaced_pieces'}
+    """
+    type_ids: dict[tuple[int, int], int] = {}
+    piece_types: list[list[int]] = []
+
+    def type_of(piece: dict) -> int:
+        key = (piece['width'], piece['height'])
+        tid = type_ids.get(key)
+        if tid is None:
+            tid = type_ids[key] = len(piece_types)
+            piece_types.append([key[0], key[1]])
+        return tid
+
+    out_plates = []
+    for plate in plates:
+        pieces_arr: list[int] = []
+        for p in plate['pieces']:
+            pieces_arr += (p['x'], p['y'], type_of(p), 1 if p.get('rotated') else 0)
+        cuts_arr: list[int] = []
+        for c in plate['cuts']:
+            cuts_arr += (_CUT_DIR_CODE[c['direction']], c['position'], c['start'], c['end'])
+        out = {'width': plate['width'], 'height': plate['height']}
+        for key in _PLATE_TAGS:
+            if plate.get(key) is not None:
+                out[key] = plate[key]
+        out['pieces'] = pieces_arr
+        out['cuts'] = cuts_arr
+        out_plates.append(out)
+
+    return {
+        'format': COMPACT_FORMAT,
+        'piece_types': piece_types,
+        'plates': out_plates,
+        'unplaced_pieces': [type_of(p) for p in unplaced],
+    }
+
+
+def decode_compact(data: dict) -> tuple[list[dict], list[dict]]:
+    """컴팩트 인코딩을 기본 스키마의 (plates, unplaced)로 복원.
+
+    복원된 조각은 `width`, `height`, `x`, `y`, `rotated`, `placed_w`, `placed_h`,
+    `original`을, 절단선은 `order`, `direction`, `position`, `start`, `end`를 가진다.
+    판은 인코딩에 있던 `stock_index`/`remnant_id`를 그대로 가진다.
+    """
+    if data.get('format') != COMPACT_FORMAT:
+        raise ValueError(f"지원하지 않는 인코딩: {data.get('format')!r}")
+    types = [tuple(t) for t in data['piece_types']]
+
+    plates = []
+    for cp in data['plates']:
+        pieces = []
+        arr = cp['pieces']
+        for i in range(0, len(arr), PIECE_STRIDE):
+            x, y, tid, rot = arr[i:i + PIECE_STRIDE]
+            w, h = types[tid]
+            pieces.append({
+                'width': w, 'height': h,
+                'x': x, 'y': y,
+                'rotated': bool(rot),
+                'placed_w': h if rot else w,
+                'placed_h': w if rot else h,
+                'original': (w, h),
+            })
+        cuts = []
+        arr = cp['cuts']
+        for i in range(0, len(arr), CUT_STRIDE):
+            d, pos, start, end = arr[i:i + CUT_STRIDE]
+            cuts.append({
+                'order': i // CUT_STRIDE + 1,
+                'direction': _CUT_DIR_NAME[d],
+                'position': pos,
+                'start': start,
+                'end': end,
+            })
+        plate = {'width': cp['width'], 'height': cp['height']}
+        for key in _PLATE_TAGS:
+            if key in cp:
+                plate[key] = cp[key]
+        plate['pieces'] = pieces
+        plate['cuts'] = cuts
+        plates.append(plate)
+
+    unplaced = []
+    for tid in data['unplaced_pieces']:
+        w, h = types[tid]
+        unplaced.append({'width': w, 'height': h, 'original': (w, h)})
+    return plates, unplaced
@@ -0,0 +1,139 @@
+"""주문 수정 후 증분 재계산 — 이전 결과의 원판을 최대한 유지
+
+고객이 조각 몇 개를 더하거나 빼면 pack()을 처음부터 다시 돌리는 대신:
+
+1. 이전 원판을 순서대로 보면서, 조각이 모두 수정된 주문에 아직 필요하면 그대로
+   유지한다 (필요 수량에서 차감). 빠진 조각이 있는 원판은 다시 푼다.
+2. 조각이 추가됐으면 유지 원판 중 마지막 것도 다시 연다 — pack()은 앞 원판부터
+   꽉 채우므로 마지막 원판이 보통 덜 찼고, 추가 조각을 새 원판 하나에 따로
+   두는 것보다 낫다.
+3. 남은 필요 조각(= 다시 푼 원판의 조각 + 추가분)만 유지 원판이 쓰고 남은 stock
+   재고로 pack() 한다.
+
+탐색은 다시 푼 원판 몇 장 분량의 조각에만 돈다 — 작은 수정은 원판 1~2장 시뮬레이션.
+결과는 처음부터 푼 것과 다를 수 있다 (유지 원판 배치는 고정).
+
+    result = repack(prev_plates, stocks, edited_pieces, kerf=5)
+    result.plates, result.kept, result.removed, result.added
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+from .strategies import RegionBasedPacker
+
+
+@dataclass
+class IncrementalResult:
+    """증분 재계산 결과 + 이전 결과 대비 diff
+
+    Attributes:
+        plates: 새 원판 리스트 (유지 원판이 앞, 새로 푼 원판이 뒤)
+        unplaced: 배치 못 한 조각 dict 리스트
+        kept: 그대로 유지한 이전 원판 index (이전 결과 기준)
+        removed: 버리고 다시 푼 이전 원판 index
+        added: 새로 만든 원판 index (plates 기준)
+    """
+    plates: list[dict]
+    unplaced: list[dict]
+    kept: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    added: list[int] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        """JSON 직렬화용 diff 요약 (원판 본문 제외)"""
+        return {
+            'kept': list(self.kept),
+            'removed': list(self.removed),
+            'added': list(self.added),
+            'plates_used': len(self.plates),
+            'unplaced': len(self.unplaced),
+        }
+
+
+def _stock_index(plate: dict, stocks: list[tuple[int, int, int]]) -> int | None:
+    """원판이 쓴 stock index — 'stock_index'가 없으면 같은 치수의 첫 stock"""
+    idx = plate.get('stock_index')
+    if idx is not None:
+        return idx
+    for i, (w, h, _count) in enumerate(stocks):
+        if (w, h) == (plate['width'], plate['height']):
+            return i
+    return None
+
+
+def repack(
+    plates: list[dict],
+    stocks: list[tuple[int, int, int]],
+    pieces: list[tuple[int, int, int]],
+    kerf: int = 5,
+    allow_rotation: bool = True,
+    packer_cls: type[RegionBasedPacker] = RegionBasedPacker,
+    reopen_last: bool = True,
+) -> IncrementalResult:
+    """이전 결과 plates를 수정된 주문 pieces에 맞게 증분 재계산
+
+    Args:
+        plates: 이전 pack() 결과 원판 (같은 stocks로 푼 것)
+        stocks: 전체 원판 재고 [(width, height, count), ...]
+        pieces: 수정된 주문 조각 [(width, height, count), ...]
+        reopen_last: 조각이 추가됐을 때 마지막 유지 원판도 다시 풀지
+
+    Returns:
+        IncrementalResult — 원판마다 'stock_index'가 붙는다.
+
+    Raises:
+        ValueError: 이전 원판의 stock을 stocks에서 찾을 수 없는 경우
+    """
+    required = Counter()
+    for w, h, c in pieces:
+        required[(w, h)] += c
+    need = required.copy()
+
+    kept: list[int] = []
+    removed: list[int] = []
+    for i, plate in enumerate(plates):
+        sizes = Counter((p['width'], p['height']) for p in plate['pieces'])
+        if plate['pieces'] and all(need[s] >= c for s, c in sizes.items()):
+            need.subtract(sizes)
+            kept.append(i)
+        else:
+            removed.append(i)
+
+    # 이전 결과에 없던 조각(추가분, 이전 미배치 포함)이 있는지
+    before = Counter((p['width'], p['height']) for plate in plates for p in plate['pieces'])
+    grew = any(c > before[s] for s, c in required.items())
+    if reopen_last and kept and grew:
+        last = kept.pop()
+        need.update((p['width'], p['height']) for p in plates[last]['pieces'])
+        removed.append(last)
+        removed.sort()
+
+    counts = [c for _, _, c in stocks]
+    for i in kept:
+        idx = _stock_index(plates[i], stocks)
+        if idx is None:
+            raise ValueError(f"원판 {i} ({plates[i]['width']}×{plates[i]['height']})의 stock을 찾을 수 없음")
+        plates[i]['stock_index'] = idx
+        counts[idx] -= 1
+
+    result = IncrementalResult(plates=[plates[i] for i in kept], unplaced=[], kept=kept, removed=removed)
+    delta = [(w, h, c) for (w, h), c in need.items() if c > 0]
+    if not delta:
+        return result
+
+    # 남은 재고만으로 푼다 — 새 원판의 stock_index는 원래 stocks 기준으로 되돌린다
+    available = [i for i, c in enumerate(counts) if c > 0]
+    if not available:
+        packer = packer_cls(stocks, kerf, allow_rotation)
+        result.unplaced = packer.expand_pieces(delta)
+        return result
+    packer = packer_cls([(*stocks[i][:2], counts[i]) for i in available], kerf, allow_rotation)
+    new_plates, result.unplaced = packer.pack(delta)
+    for plate in new_plates:
+        plate['stock_index'] = available[plate['stock_index']]
+        result.added.append(len(result.plates))
+        result.plates.append(plate)
+    return result
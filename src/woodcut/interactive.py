@@ -4,7 +4,9 @@
 from collections import Counter
 
 from .strategies import RegionBasedPacker
-from .visualizer import visualize_solution
+
+# 원판이 이보다 많으면 PNG를 이 장수씩 페이지로 나눈다
+PLATES_PER_PAGE = 4
 
 
 def get_positive_int_input(prompt: str, default: int | None = None) -> int | None:
@@ -134,5 +136,7 @@ def run_interactive():
             print(f"   - {w}×{h}mm × {n}개")
         print("   → 원판 수량을 늘리거나 조각 크기를 확인하세요.")
 
-    # 시각화
-    visualize_solution(plates, pieces, strategy_name)
+    # 시각화 (matplotlib은 여기서 처음 import). 원판이 많으면 페이지로 나눠 병렬 렌더링
+    from .visualizer import visualize_solution
+    per_page = PLATES_PER_PAGE if len(plates) > PLATES_PER_PAGE else None
+    visualize_solution(plates, pieces, strategy_name, per_page=per_page)
@@ -0,0 +1,187 @@
+"""작업(job) 파일 로더 — 비대화형 CLI(`profile`, `solve`)가 공유
+
+작업 1건은 웹 API의 CuttingRequest와 같은 dict다:
+
+    {"stocks": [[2440, 1220, 3]], "pieces": [[800, 310, 2], ...],
+     "kerf": 5, "allow_rotation": true, "strategy": "region_based"}
+
+stocks/pieces는 `{'width', 'height', 'count'}` dict 또는 `[w, h, c]` 배열.
+`benchmarks.workloads.Workload.to_dict()` 결과도 그대로 작업 파일로 쓸 수 있다.
+
+입력 형식 (`iter_jobs`):
+- `.json`: 작업 객체 1개, 작업 배열, 또는 배치 API 형태 `{"orders": [...]}`
+- `.jsonl` / `.ndjson` / `-`(stdin): 한 줄에 작업 1개
+- `.csv`: 작업 1개 — 헤더 `type,width,height,count`, type은 stock 또는 piece
+- 디렉터리: 안의 위 형식 파일들을 이름순으로 (하위 디렉터리는 보지 않음)
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .service import _as_triples
+
+
+JOB_SUFFIXES = ('.json', '.jsonl', '.ndjson', '.csv')
+
+
+def normalize_job(data: dict, name: str = '', defaults: dict | None = None) -> dict:
+    """작업 dict 검증 + 정규화 → `service.solve_order`에 넘길 수 있는 주문 dict
+
+    Args:
+        data: 작업 dict
+        name: 작업에 name/id가 없을 때 쓸 이름
+        defaults: 작업에 없는 키의 기본값 (CLI 옵션 — kerf, stocks 등)
+
+    Returns:
+        {'name', 'stocks', 'pieces', 'kerf', 'allow_rotation', 'strategy'}
+        — stocks/pieces는 (width, height, count) 튜플 리스트
+
+    Raises:
+        ValueError: 필수 항목이 없거나 값이 잘못된 경우
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"작업은 JSON 객체여야 합니다: {type(data).__name__}")
+    if defaults:
+        data = {**defaults, **{k: v for k, v in data.items() if v is not None}}
+    try:
+        pieces = _as_triples(data.get('pieces') or [], '조각')
+        stocks = _as_triples(data.get('stocks') or [], '원판')
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"조각/원판 형식 오류: {e}") from e
+    try:
+        kerf = int(data.get('kerf', 5))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"kerf 형식 오류: {data.get('kerf')!r}") from e
+    return {
+        'name': str(data.get('name') or data.get('id') or name),
+        'stocks': stocks,
+        'pieces': pieces,
+        'kerf': kerf,
+        'allow_rotation': bool(data.get('allow_rotation', True)),
+        'strategy': data.get('strategy', 'region_based'),
+    }
+
+
+def load_job(path: str | Path, defaults: dict | None = None) -> dict:
+    """작업 파일 1개 로드 (.json 작업 객체 또는 .csv). 이름 기본값은 파일명."""
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        return normalize_job(_read_csv(path), name=path.stem, defaults=defaults)
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: JSON 파싱 실패: {e}") from e
+    return normalize_job(data, name=path.stem, defaults=defaults)
+
+
+def _read_csv(path: Path) -> dict:
+    """CSV 작업 파일 → {'stocks', 'pieces'} (행 순서 유지)"""
+    data: dict[str, list] = {'stocks': [], 'pieces': []}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        missing = {'type', 'width', 'height'} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: CSV 헤더에 {', '.join(sorted(missing))} 열이 없습니다")
+        for line_no, row in enumerate(reader, 2):
+            kind = (row['type'] or '').strip().lower()
+            if kind not in ('stock', 'piece'):
+                raise ValueError(f"{path}:{line_no}: type은 stock 또는 piece여야 합니다: {kind!r}")
+            try:
+                item = (int(row['width']), int(row['height']), int(row.get('count') or 1))
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_no}: 숫자가 아닙니다: {e}") from e
+            data['stocks' if kind == 'stock' else 'pieces'].append(item)
+    if not data['stocks']:
+        del data['stocks']  # CLI 기본 원판(--stock)을 쓰도록
+    return data
+
+
+def _json_items(data, name: str) -> Iterator[tuple[str, object]]:
+    """.json 내용 → (이름, 작업 dict) — 객체/배열/{'orders': [...]}"""
+    if isinstance(data, dict) and 'orders' in data:
+        data = data['orders']
+    if isinstance(data, list):
+        for i, item in enumerate(data):
+            yield f"{name}[{i}]", item
+    else:
+        yield name, data
+
+
+def _jsonl_items(lines: Iterable[str], name: str) -> Iterator[tuple[str, object]]:
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        item_name = f"{name}:{line_no}"
+        try:
+            yield item_name, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield item_name, ValueError(f"JSON 파싱 실패: {e}")
+
+
+def _expand(source: str) -> Iterator[Path | str]:
+    if source == '-':
+        yield source
+        return
+    path = Path(source)
+    if path.is_dir():
+        yield from sorted(p for p in path.iterdir()
+                          if p.is_file() and p.suffix.lower() in JOB_SUFFIXES)
+    elif path.exists():
+        yield path
+    else:
+        raise FileNotFoundError(f"입력을 찾을 수 없습니다: {source}")
+
+
+def iter_jobs(
+    sources: Iterable[str], defaults: dict | None = None, stdin=None,
+) -> Iterator[tuple[str, dict | None, str | None]]:
+    """입력들을 작업 단위로 차례차례 읽는다 (.jsonl/stdin은 한 줄씩, 나머지는 파일 1개씩)
+
+    잘못된 작업 하나가 전체를 멈추지 않도록 작업 단위 오류는 값으로 돌려준다.
+
+    Yields:
+        (name, order, error): 성공이면 error=None, 실패면 order=None
+
+    Raises:
+        FileNotFoundError: 입력 경로가 없는 경우 (해당 입력 차례에서)
+    """
+    for source in sources:
+        for path in _expand(source):
+            if path == '-':
+                items = _jsonl_items(stdin or sys.stdin, 'stdin')
+            else:
+                items = _file_items(path)
+            for name, item in items:
+                if isinstance(item, Exception):
+                    yield name, None, str(item)
+                    continue
+                try:
+                    order = normalize_job(item, name=name, defaults=defaults)
+                except (ValueError, TypeError) as e:
+                    yield name, None, str(e)
+                    continue
+                yield order['name'], order, None
+
+
+def _file_items(path: Path) -> Iterator[tuple[str, object]]:
+    suffix = path.suffix.lower()
+    if suffix in ('.jsonl', '.ndjson'):
+        with open(path, encoding='utf-8') as f:
+            yield from _jsonl_items(f, path.stem)
+        return
+    try:
+        if suffix == '.csv':
+            data = _read_csv(path)
+        else:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+    except (OSError, ValueError) as e:  # JSONDecodeError ⊂ ValueError
+        yield path.stem, ValueError(f"{path}: {e}")
+        return
+    yield from _json_items(data, path.stem)
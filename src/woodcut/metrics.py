@@ -0,0 +1,183 @@
+"""Prometheus 텍스트 형식 메트릭 (외부 의존 없음)
+
+요청 경로의 갱신은 dict 조회 + 정수 덧셈뿐이고, 텍스트 직렬화는 스크레이프
+(`render()`) 때만 일어난다 — 아무도 `/metrics`를 읽지 않으면 비용이 거의 없다.
+
+갱신은 서버 이벤트 루프 스레드에서만 일어난다고 가정하므로 잠금을 두지 않는다.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 재단 1건 지연 시간(초) — 수 ms(작은 주문)부터 수십 초(대형 배치 주문)까지
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 요청당 판/조각 수
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = '') -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨 조합별 값을 가진 메트릭 공통부"""
+
+    kind = ''
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names = labels
+        self._values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict[str, str] | None) -> tuple[str, ...]:
+        if not self.label_names:
+            return ()
+        labels = labels or {}
+        return tuple(str(labels.get(n, '')) for n in self.label_names)
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}']
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        return [
+            f'{self.name}{_format_labels(self.label_names, key)} {_format_value(v)}'
+            for key, v in self._values.items()
+        ]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, labels: dict[str, str] | None = None) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, labels: dict[str, str] | None = None) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """증감 가능한 현재값"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, labels: dict[str, str] | None = None) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, labels: dict[str, str] | None = None) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, labels: dict[str, str] | None = None) -> None:
+        self.inc(-amount, labels)
+
+    def value(self, labels: dict[str, str] | None = None) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램
+
+    관측은 bisect 한 번 + 버킷 하나 증가. 누적(cumulative) 합산은 render 때 한다.
+    """
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: dict[str, str] | None = None) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # [버킷별 개수..., +Inf 개수], 합계
+            state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def count(self, labels: dict[str, str] | None = None) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+
+    def _samples(self) -> list[str]:
+        lines = []
+        bounds = self.buckets + (float('inf'),)
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, n in zip(bounds, counts):
+                cumulative += n
+                le = _format_labels(self.label_names, key, f'le="{_format_value(bound)}"')
+                lines.append(f'{self.name}_bucket{le} {cumulative}')
+            labels = _format_labels(self.label_names, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+
+class Registry:
+    """메트릭 모음 — 등록 순서대로 렌더링"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def get(self, name: str) -> _Metric:
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
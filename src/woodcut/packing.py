@@ -2,15 +2,19 @@
 기본 클래스 모듈
 - Region: 절단으로 생긴 영역
 - FreeSpace: 자유 공간 사각형
+- FreeSpaceIndex: FreeSpace 집합 (너비/높이/x 정렬 버킷 + 정렬 좌표)
 - PackingStrategy: 패킹 전략 베이스 클래스 (Guillotine Cut 알고리즘 포함)
 """
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
 
 
 class Region:
     """절단으로 생긴 영역"""
+    __slots__ = ('x', 'y', 'width', 'height', 'pieces', 'children', 'cut', 'required_cuts')
+
     def __init__(self, x, y, width, height):
         self.x = x
         self.y = y
@@ -24,6 +28,8 @@ class Region:
 
 class FreeSpace:
     """자유 공간 사각형"""
+    __slots__ = ('x', 'y', 'width', 'height')
+
     def __init__(self, x, y, width, height):
         self.x = x
         self.y = y
@@ -31,6 +37,166 @@ class FreeSpace:
         self.height = height
 
 
+class FreeSpaceIndex:
+    """FreeSpace 집합 관리자
+
+    공간을 (너비, seq) / (높이, seq) / (x, seq) 정렬 리스트에 나눠 담아
+    "w×h가 들어가는 공간" 조회를 bisect로 시작하고, 제거도 bisect 위치 삭제로 한다
+    (list.remove의 선형 탐색·동등 비교 없음). seq는 삽입 순서 — 반복 순서와
+    동점 처리가 예전 리스트(append/remove)와 같다.
+
+    existing_x/existing_y는 정렬 좌표 집합. 배치마다 note_piece()로 증분 갱신해
+    조회 때마다 배치된 조각 전체에서 다시 만들지 않는다.
+
+    columns(선택)는 같은 공간을 열 배열로 들고 있는 저장소
+    (strategies.scoring.SpaceColumns) — 적합 후보가 columns.min_rows 이상이면
+    best_fit()이 그쪽 벡터 연산으로 넘어간다. 이 모듈은 numpy에 의존하지 않는다.
+    """
+    __slots__ = ('kerf', 'existing_x', 'existing_y', '_seq', '_spaces', '_key',
+                 '_by_w', '_by_h', '_by_x', '_columns')
+
+    def __init__(self, kerf, spaces=(), origin=None, columns=None):
+        """
+        Args:
+            kerf: 톱날 두께 — 조각 w×h는 (w+kerf)×(h+kerf) 공간을 요구
+            spaces: 초기 FreeSpace들
+            origin: (x, y) — 정렬 좌표의 기준점 (영역 시작 좌표)
+            columns: 선택적 열 저장소 (add/remove/best, min_rows)
+        """
+        self.kerf = kerf
+        self.existing_x = set()
+        self.existing_y = set()
+        if origin is not None:
+            self.existing_x.add(origin[0])
+            self.existing_y.add(origin[1])
+        self._seq = 0
+        self._spaces = {}  # seq → FreeSpace (삽입 순서)
+        self._key = {}  # id(space) → seq
+        self._by_w = []  # (width, seq, space)
+        self._by_h = []  # (height, seq, space)
+        self._by_x = []  # (x, seq, space)
+        self._columns = columns
+        for space in spaces:
+            self.add(space)
+
+    def __len__(self):
+        return len(self._spaces)
+
+    def __iter__(self):
+        return iter(list(self._spaces.values()))
+
+    def add(self, space):
+        seq = self._seq
+        self._seq += 1
+        self._spaces[seq] = space
+        self._key[id(space)] = seq
+        insort(self._by_w, (space.width, seq, space))
+        insort(self._by_h, (space.height, seq, space))
+        insort(self._by_x, (space.x, seq, space))
+        if self._columns is not None:
+            self._columns.add(seq, space.x, space.y, space.width, space.height,
+                              space.x in self.existing_x, space.y in self.existing_y)
+
+    def remove(self, space):
+        seq = self._key.pop(id(space))
+        del self._spaces[seq]
+        for bucket, value in ((self._by_w, space.width), (self._by_h, space.height),
+                              (self._by_x, space.x)):
+            del bucket[bisect_left(bucket, (value, seq))]
+        if self._columns is not None:
+            self._columns.remove(seq)
+
+    def seq(self, space):
+        """삽입 순서 — 예전 리스트에서의 상대 위치와 같은 순서"""
+        return self._key[id(space)]
+
+    def note_piece(self, x, y, w, h):
+        """배치된 조각 (x, y, w, h)의 정렬 좌표 추가"""
+        xs = (x, x + w + self.kerf)
+        ys = (y, y + h + self.kerf)
+        if self._columns is not None:
+            self._columns.note([v for v in xs if v not in self.existing_x],
+                               [v for v in ys if v not in self.existing_y])
+        self.existing_x.update(xs)
+        self.existing_y.update(ys)
+
+    def split(self, space, x, y, w, h):
+        """space의 (x, y) 모서리에 w×h 배치 — L자형 분할 (우측 + 상단)"""
+        k = self.kerf
+        self.remove(space)
+        if space.width > w + k:
+            self.add(FreeSpace(x + w + k, y, space.width - w - k, h + k))
+        if space.height > h + k:
+            self.add(FreeSpace(x, y + h + k, space.width, space.height - h - k))
+        self.note_piece(x, y, w, h)
+
+    def _tail(self, need_w, need_h):
+        """너비/높이 버킷 중 bisect 뒤 꼬리가 짧은 쪽 — (bucket, start, axis)"""
+        iw = bisect_left(self._by_w, (need_w,))
+        ih = bisect_left(self._by_h, (need_h,))
+        if len(self._by_w) - iw <= len(self._by_h) - ih:
+            return self._by_w, iw, 'w'
+        return self._by_h, ih, 'h'
+
+    def fitting(self, w, h):
+        """(w+kerf)×(h+kerf)가 들어가는 공간을 (slack축, 공간) 순으로
+
+        꼬리가 짧은 버킷을 그 축 오름차순으로 돌고, 다른 축은 걸러낸다.
+        slack축은 'w'/'h' — 호출 측 가지치기용.
+        """
+        need_w, need_h = w + self.kerf, h + self.kerf
+        bucket, start, axis = self._tail(need_w, need_h)
+        for i in range(start, len(bucket)):
+            space = bucket[i][2]
+            if space.width >= need_w and space.height >= need_h:
+                yield axis, space
+
+    def best_fit(self, w, h, prefer=None):
+        """w×h가 들어가는 공간 중 최선 하나 — (정렬 점수, 낭비, seq, space) 또는 None
+
+        prefer가 None이면 낭비 (sw-w)·(sh-h) 최소, 동점은 삽입 순서.
+        prefer=(rx, ry, rw, rh)이면 그 영역 안에서 시작하는 공간만 보고
+        정렬 점수(space.x ∈ existing_x, space.y ∈ existing_y) 최대 → 낭비 최소.
+
+        버킷이 한 축 오름차순이라 그 축 낭비 하한 (s-w)·kerf가 현재 최선을
+        넘으면(정렬 점수가 이미 최대일 때) 나머지는 볼 필요가 없다.
+        """
+        k = self.kerf
+        ex, ey = self.existing_x, self.existing_y
+        columns = self._columns
+        if columns is not None:
+            bucket, start, _ = self._tail(w + k, h + k)
+            if len(bucket) - start >= columns.min_rows:
+                found = columns.best(w + k, h + k, w, h, prefer)
+                return None if found is None else (*found, self._spaces[found[2]])
+        best = None
+        for axis, space in self.fitting(w, h):
+            slack = space.width - w if axis == 'w' else space.height - h
+            if best is not None and best[0] == -2 and slack * k > best[1]:
+                break
+            if prefer is not None:
+                rx, ry, rw, rh = prefer
+                if not (rx <= space.x < rx + rw and ry <= space.y < ry + rh):
+                    continue
+                align = -((space.x in ex) + (space.y in ey))
+            else:
+                align = -2
+            key = (align, (space.width - w) * (space.height - h), self._key[id(space)], space)
+            if best is None or key[:3] < best[:3]:
+                best = key
+        return best
+
+    def overlapping(self, x1, y1, x2, y2):
+        """(x1, y1)-(x2, y2)와 양의 면적으로 겹치는 공간들 (삽입 순서)"""
+        hits = []
+        for i in range(bisect_left(self._by_x, (x2,))):
+            _, seq, space = self._by_x[i]
+            if space.x + space.width > x1 and space.y < y2 and space.y + space.height > y1:
+                hits.append((seq, space))
+        hits.sort(key=lambda t: t[0])
+        return [space for _, space in hits]
+
+
 class PackingStrategy(ABC):
     """패킹 전략 베이스 클래스"""
 
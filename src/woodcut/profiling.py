@@ -0,0 +1,225 @@
+"""`woodcut profile <job.json>` — 작업 1건을 프로파일러 아래에서 실행
+
+현장에서 보고된 성능 회귀를 명령 하나로 재현하기 위한 도구. 같은 작업을 세 번
+돌린다 (프로파일러끼리 서로의 측정을 왜곡하지 않도록):
+
+1. 스택 샘플링 + `PackProfile` — 오버헤드가 가장 작은 실행. 단계별 표는 이 실행
+   기준이고, 샘플은 flamegraph 도구(flamegraph.pl, speedscope, inferno)가 읽는
+   collapsed 형식(`frame;frame;frame count`)으로 저장한다.
+2. cProfile → `.pstats` (`python -m pstats`, snakeviz 등으로 열람)
+3. tracemalloc → 피크 메모리 + 할당 위치 상위 N개 보고서 (`--no-memory`로 생략)
+
+출력 파일 (`--out` 디렉터리, 기본 현재 디렉터리):
+    <job>.pstats, <job>.collapsed.txt, <job>.alloc.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import linecache
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+
+from .jobs import load_job
+from .service import make_packer
+from .strategies import PackProfile
+
+
+def _run_pack(order: dict, profile: PackProfile | None = None):
+    """프로파일 대상 — 샘플러는 이 프레임 아래만 스택으로 기록한다"""
+    packer, pieces = make_packer(order)
+    plates, unplaced = packer.pack(pieces, profile=profile)
+    return packer, plates, unplaced
+
+
+_STOP_CODE = _run_pack.__code__
+
+
+def _frame_label(code) -> str:
+    # collapsed 형식은 ';'로 프레임을, 마지막 공백으로 샘플 수를 나눈다
+    label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label.replace(';', ':')
+
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 찍는 샘플링 프로파일러
+
+    `sys._current_frames()`로 대상 스레드의 현재 프레임을 읽고 `_run_pack`까지
+    거슬러 올라간 경로를 센다. 샘플러 스레드는 GIL을 잠깐씩만 잡으므로 대상
+    실행 시간에 주는 영향이 작다. GIL 전환 간격(기본 5ms)이 샘플 간격보다 길면
+    샘플이 성기게 찍히므로 샘플링 동안만 전환 간격을 샘플 간격으로 줄인다.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: int | None = None) -> None:
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._switch_interval = sys.getswitchinterval()
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame.f_code))
+            if frame.f_code is _STOP_CODE:
+                break
+            frame = frame.f_back
+        else:
+            return  # 아직 _run_pack 진입 전이거나 이미 빠져나옴
+        self.stacks[tuple(reversed(stack))] += 1
+        self.samples += 1
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> 'StackSampler':
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._loop, name='woodcut-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def write_collapsed(self, path: str | Path) -> None:
+        """flamegraph collapsed 형식으로 저장 (많이 찍힌 스택 순)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+
+def format_alloc_report(snapshot: tracemalloc.Snapshot, peak: int, top: int = 25) -> str:
+    """tracemalloc 스냅샷 → 할당 위치 상위 N개 보고서"""
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+    stats = snapshot.statistics('lineno')
+    total = sum(s.size for s in stats)
+    lines = [
+        f"peak traced memory: {peak / 1024:.1f} KiB",
+        f"live at end of pack(): {total / 1024:.1f} KiB in {sum(s.count for s in stats)} blocks",
+        '',
+        f"{'#':>3} {'KiB':>10} {'blocks':>8}  location",
+    ]
+    for i, stat in enumerate(stats[:top], 1):
+        tb = stat.traceback[0]
+        lines.append(f"{i:>3} {stat.size / 1024:>10.1f} {stat.count:>8}  {tb.filename}:{tb.lineno}")
+        source = linecache.getline(tb.filename, tb.lineno).strip()
+        if source:
+            lines.append(f"{'':>25}{source}")
+    return '\n'.join(lines) + '\n'
+
+
+def profile_job(
+    order: dict,
+    out_dir: str | Path = '.',
+    stem: str | None = None,
+    top: int = 25,
+    interval: float = 0.001,
+    memory: bool = True,
+) -> dict:
+    """작업 1건 프로파일링 → 파일 기록 후 요약 반환
+
+    Returns:
+        {'profile': PackProfile, 'plates', 'unplaced', 'samples',
+         'pstats', 'collapsed', 'alloc'(memory=False면 None), 'peak_kib'}
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = stem or order.get('name') or 'job'
+
+    # 1) 샘플링 + 단계별 시간
+    profile = PackProfile()
+    with StackSampler(interval) as sampler:
+        _, plates, unplaced = _run_pack(order, profile)
+    collapsed = out_dir / f"{stem}.collapsed.txt"
+    sampler.write_collapsed(collapsed)
+
+    # 2) cProfile
+    pstats_path = out_dir / f"{stem}.pstats"
+    prof = cProfile.Profile()
+    prof.runcall(_run_pack, order)
+    prof.dump_stats(pstats_path)
+
+    # 3) tracemalloc
+    alloc_path = None
+    peak_kib = None
+    if memory:
+        tracemalloc.start(1)
+        try:
+            result = _run_pack(order)  # 결과를 붙잡아 두어 스냅샷에 남긴다
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        alloc_path = out_dir / f"{stem}.alloc.txt"
+        alloc_path.write_text(format_alloc_report(snapshot, peak, top), encoding='utf-8')
+        peak_kib = peak / 1024
+
+    return {
+        'profile': profile,
+        'plates': len(plates),
+        'unplaced': len(unplaced),
+        'samples': sampler.samples,
+        'pstats': pstats_path,
+        'collapsed': collapsed,
+        'alloc': alloc_path,
+        'peak_kib': peak_kib,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """`woodcut profile` 진입점. 종료 코드: 0 성공, 2 작업 파일 오류."""
+    parser = argparse.ArgumentParser(
+        prog='woodcut profile', description=__doc__.split('\n')[0].strip('` '),
+    )
+    parser.add_argument('job', help='작업 JSON 파일 (stocks, pieces, kerf, allow_rotation, strategy)')
+    parser.add_argument('--out', default='.', help='출력 디렉터리 (기본: 현재 디렉터리)')
+    parser.add_argument('--top', type=int, default=25, help='할당 보고서 항목 수')
+    parser.add_argument('--interval', type=float, default=1.0, help='스택 샘플링 간격 (ms)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 실행 생략')
+    args = parser.parse_args(argv)
+
+    try:
+        order = load_job(args.job)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"❌ 작업 파일 오류: {e}", file=sys.stderr)
+        return 2
+
+    started = perf_counter()
+    report = profile_job(
+        order, args.out, top=args.top, interval=args.interval / 1000, memory=not args.no_memory,
+    )
+    elapsed = perf_counter() - started
+
+    pieces = sum(c for _, _, c in order['pieces'])
+    print(f"작업: {order['name']} — 조각 {pieces}개, 원판 {len(order['stocks'])}종, "
+          f"전략 {order['strategy']}")
+    print(f"결과: 판 {report['plates']}장, 미배치 {report['unplaced']}개\n")
+    print(report['profile'].format_table())
+    search = report['profile'].search
+    if search:
+        print('\n' + ' '.join(f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}"
+                               for k, v in search.items()))
+    print(f"\n샘플 {report['samples']}개 → {report['collapsed']}")
+    print(f"cProfile → {report['pstats']}")
+    if report['alloc']:
+        print(f"할당 상위 {args.top}개 (피크 {report['peak_kib']:.1f} KiB) → {report['alloc']}")
+    print(f"(프로파일링 총 {elapsed:.2f}s)")
+    return 0
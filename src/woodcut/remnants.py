@@ -0,0 +1,314 @@
+"""잔재(offcut) 재고 — 작업 사이에 남는 자투리를 다음 작업의 stock으로
+
+원판 GNode 트리의 scrap leaf(앵커 백트래킹 상단 `scrap` 영역, region 안 빈
+칸)는 guillotine 컷만으로 떼어낼 수 있는 직사각형이다. 그중 `min_side` 이상인
+것을 SQLite에 기록해 두고, 다음 작업이 조각을 담을 수 있는 잔재만 꺼내
+`RegionBasedPacker`의 추가 stocks 항목으로 넣는다.
+
+2차원 지배 질의: 잔재 (w, h)가 조각 (pw, ph)를 담으려면 w ≥ pw, h ≥ ph
+(회전 허용이면 짧은 변 ≥ 짧은 변, 긴 변 ≥ 긴 변). (short, long) / (width,
+height) 복합 인덱스로 첫 변은 B-tree 범위, 둘째 변은 인덱스 안에서 거른다.
+조각 여러 종이면 지배 관계의 극소 조각(Pareto 극소) 조건만 OR로 묻는다 —
+그보다 큰 조각을 담는 잔재는 이미 극소 조각 조건에 걸린다.
+
+`lease()`는 꺼낸 잔재 행에 임대 토큰(leased_by)을 한 쓰기 트랜잭션(BEGIN
+IMMEDIATE) 안에서 찍는다. 같은 DB 파일을 여는 다른 작업은 임대 중인 잔재를 보지
+못하므로 같은 잔재를 두 작업이 자르지 않는다. 조각 N개짜리 작업은 원판을 많아야
+N장 쓰므로 임대도 작은 것부터 N장까지만 — 동시에 도는 다른 작업에 나머지 잔재가
+남는다. `settle()`은 쓴 잔재를 지우고 안 쓴 잔재의 임대를 푼다. 작업이 중간에
+실패하면 `release()`, 프로세스가 죽어 남은 임대는 `expire_leases()`로 되돌린다.
+
+같은 치수 잔재는 (w, h, count) stock 하나로 묶는다. 잔재가 수천 개여도 치수
+종류만큼만 stock이 늘고, pack()의 같은 치수 병합·상한 가지치기가 그중 못
+이기는 후보의 시뮬레이션을 건너뛴다.
+
+    with RemnantStore('remnants.db') as store:
+        plates, unplaced = pack_with_remnants(store, stocks, pieces, kerf=5, source='job-17')
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from .strategies import RegionBasedPacker
+
+# 이보다 짧은 변이 있는 scrap은 기록하지 않는다 (mm)
+MIN_REMNANT_SIDE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS remnants (
+    id INTEGER PRIMARY KEY,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    short_side INTEGER NOT NULL,
+    long_side INTEGER NOT NULL,
+    area INTEGER NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL,
+    leased_by TEXT,
+    leased_at REAL
+);
+CREATE INDEX IF NOT EXISTS remnants_sides ON remnants (short_side, long_side);
+CREATE INDEX IF NOT EXISTS remnants_dims ON remnants (width, height);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Remnant:
+    """잔재 1장"""
+    id: int
+    width: int
+    height: int
+    source: str = ''
+
+
+@dataclass(slots=True)
+class RemnantLease:
+    """작업 1건에 빌려준 잔재 — `RemnantStore.settle`로 정산 (`release`로 취소)
+
+    Attributes:
+        token: 잔재 행의 leased_by에 찍힌 임대 토큰
+        stocks: 원래 stocks 뒤에 잔재 stock을 붙인 목록 (패커에 그대로 넘긴다)
+        base: 첫 잔재 stock의 index (= 원래 stocks 길이)
+        ids: 잔재 stock별 잔재 id 리스트 — stocks[base + k]의 count == len(ids[k])
+    """
+    token: str
+    stocks: list[tuple[int, int, int]]
+    base: int
+    ids: list[list[int]] = field(default_factory=list)
+
+    def assign(self, plates: list[dict]) -> list[int]:
+        """잔재 stock을 쓴 원판에 'remnant_id'를 붙이고 쓴 잔재 id 리스트 반환"""
+        taken = [0] * len(self.ids)
+        used = []
+        for plate in plates:
+            k = plate['stock_index'] - self.base
+            if k >= 0:
+                plate['remnant_id'] = self.ids[k][taken[k]]
+                taken[k] += 1
+                used.append(plate['remnant_id'])
+        return used
+
+
+def minimal_sizes(sizes, allow_rotation: bool = True) -> list[tuple[int, int]]:
+    """지배 관계의 극소 (w, h) — 다른 크기를 담는 크기는 뺀다
+
+    회전 허용이면 (짧은 변, 긴 변)으로 맞춘 뒤 비교한다. 짧은 변 오름차순으로
+    보면서 긴 변이 지금까지 최소보다 작을 때만 남긴다 (계단).
+    """
+    norm = {(min(w, h), max(w, h)) if allow_rotation else (w, h) for w, h in sizes}
+    result = []
+    best_second = None
+    for a, b in sorted(norm):
+        if best_second is None or b < best_second:
+            result.append((a, b))
+            best_second = b
+    return result
+
+
+def plate_remnants(plate: dict, min_side: int = MIN_REMNANT_SIDE) -> list[tuple[int, int]]:
+    """원판 트리의 scrap leaf 중 두 변이 min_side 이상인 것의 (w, h)
+
+    `_tree_root`가 없는 원판(service 응답처럼 트리를 뗀 결과)은 빈 리스트.
+    """
+    root = plate.get('_tree_root')
+    if root is None:
+        return []
+    return [
+        (leaf.w, leaf.h) for leaf in root.leaves()
+        if leaf.piece is None and leaf.kind != 'kerf' and min(leaf.w, leaf.h) >= min_side
+    ]
+
+
+class RemnantStore:
+    """SQLite 잔재 재고
+
+    Args:
+        path: DB 파일 경로 (기본 ':memory:' — 프로세스 안에서만)
+        min_side: `record_plate`가 기록할 최소 변 길이
+    """
+
+    def __init__(self, path: str = ':memory:', min_side: int = MIN_REMNANT_SIDE) -> None:
+        self.min_side = min_side
+        # 트랜잭션은 _write()가 직접 연다 (sqlite3 모듈의 암묵적 BEGIN DEFERRED 대신)
+        self._db = sqlite3.connect(str(path), isolation_level=None)
+        self._db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _write(self):
+        """쓰기 트랜잭션 — BEGIN IMMEDIATE로 시작부터 쓰기 잠금을 잡는다
+
+        조회 후 갱신(lease의 SELECT → UPDATE) 사이에 다른 연결이 끼어들지 못한다.
+        """
+        self._db.execute('BEGIN IMMEDIATE')
+        try:
+            yield self._db
+        except BaseException:
+            self._db.execute('ROLLBACK')
+            raise
+        self._db.execute('COMMIT')
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'RemnantStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """임대 중인 것을 포함한 잔재 수"""
+        return self._db.execute('SELECT COUNT(*) FROM remnants').fetchone()[0]
+
+    def add(self, width: int, height: int, source: str = '') -> int:
+        """잔재 1장 추가 → id"""
+        return self.add_many([(width, height)], source)[0]
+
+    def add_many(self, sizes, source: str = '') -> list[int]:
+        """[(w, h), ...] 추가 → id 리스트 (한 트랜잭션)"""
+        with self._write() as db:
+            return self._insert(db, sizes, source)
+
+    def _insert(self, db, sizes, source: str) -> list[int]:
+        now = time.time()
+        ids = []
+        for w, h in sizes:
+            if w <= 0 or h <= 0:
+                raise ValueError(f"잔재 ({w}, {h}): 모든 값은 양수여야 함")
+            cur = db.execute(
+                'INSERT INTO remnants (width, height, short_side, long_side, area, source, created)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (w, h, min(w, h), max(w, h), w * h, source, now),
+            )
+            ids.append(cur.lastrowid)
+        return ids
+
+    def remove(self, ids) -> int:
+        """id들을 재고에서 뺀다 → 실제로 지운 수"""
+        with self._write() as db:
+            return db.executemany('DELETE FROM remnants WHERE id = ?', [(i,) for i in ids]).rowcount
+
+    def _where(self, sizes, allow_rotation: bool) -> tuple[str, list[int]]:
+        """극소 크기 중 하나라도 담는 잔재 조건절"""
+        cols = ('short_side', 'long_side') if allow_rotation else ('width', 'height')
+        mins = minimal_sizes(sizes, allow_rotation)
+        clause = ' OR '.join(f'({cols[0]} >= ? AND {cols[1]} >= ?)' for _ in mins)
+        return clause, [v for m in mins for v in m]
+
+    def fits(self, width: int, height: int, allow_rotation: bool = True,
+             limit: int | None = None) -> list[Remnant]:
+        """width×height 조각을 담을 수 있는 잔재 — 면적 오름차순 (작은 것부터)"""
+        return self.fitting([(width, height)], allow_rotation, limit)
+
+    def fitting(self, sizes, allow_rotation: bool = True, limit: int | None = None) -> list[Remnant]:
+        """sizes 중 하나라도 담을 수 있는 잔재 (임대 중 제외) — 면적 오름차순, 같으면 id 순"""
+        sizes = list(sizes)
+        if not sizes:
+            return []
+        clause, params = self._where(sizes, allow_rotation)
+        sql = f'SELECT id, width, height, source FROM remnants WHERE leased_by IS NULL AND ({clause}) ORDER BY area, id'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return [Remnant(*row) for row in self._db.execute(sql, params)]
+
+    def lease(self, stocks: list[tuple[int, int, int]], pieces: list[tuple[int, int, int]],
+              allow_rotation: bool = True) -> RemnantLease:
+        """pieces 중 하나라도 담는 잔재를 임대하고 같은 치수끼리 묶어 stocks 뒤에 붙인다
+
+        조회와 임대 표시가 한 쓰기 트랜잭션이라 동시에 임대한 다른 작업과 잔재가
+        겹치지 않는다. 잔재 stock은 면적 오름차순 — 원래 stocks의 index는 그대로다.
+        조각 수(Σcount)보다 많은 원판은 쓸 일이 없으므로 면적 오름차순으로
+        Σcount장까지만 임대한다 (치수별 묶음도 자연히 그 이하).
+        """
+        token = uuid.uuid4().hex
+        groups: dict[tuple[int, int], list[int]] = {}
+        with self._write() as db:
+            remnants = self.fitting([(w, h) for w, h, _ in pieces], allow_rotation,
+                                    limit=sum(c for _, _, c in pieces))
+            db.executemany(
+                'UPDATE remnants SET leased_by = ?, leased_at = ? WHERE id = ?',
+                [(token, time.time(), r.id) for r in remnants],
+            )
+        for r in remnants:
+            groups.setdefault((r.width, r.height), []).append(r.id)
+        extra = [(w, h, len(ids)) for (w, h), ids in groups.items()]
+        return RemnantLease(token=token, stocks=list(stocks) + extra, base=len(stocks),
+                            ids=list(groups.values()))
+
+    def release(self, lease: RemnantLease) -> int:
+        """임대를 통째로 취소 (작업 실패 시) → 되돌린 잔재 수"""
+        with self._write() as db:
+            return db.execute(
+                'UPDATE remnants SET leased_by = NULL, leased_at = NULL WHERE leased_by = ?',
+                (lease.token,),
+            ).rowcount
+
+    def expire_leases(self, max_age: float) -> int:
+        """max_age초보다 오래된 임대를 푼다 (정산 전에 죽은 작업) → 되돌린 잔재 수"""
+        with self._write() as db:
+            return db.execute(
+                'UPDATE remnants SET leased_by = NULL, leased_at = NULL'
+                ' WHERE leased_by IS NOT NULL AND leased_at < ?',
+                (time.time() - max_age,),
+            ).rowcount
+
+    def record_plate(self, plate: dict, source: str = '') -> list[int]:
+        """원판의 쓸 만한 scrap leaf를 잔재로 기록 → id 리스트"""
+        return self.add_many(plate_remnants(plate, self.min_side), source)
+
+    def settle(self, lease: RemnantLease, plates: list[dict], source: str = '') -> list[int]:
+        """작업 결과 정산 — 쓴 잔재는 빼고, 안 쓴 잔재의 임대는 풀고, 모든 원판의
+        새 scrap은 기록 → 새 id 리스트 (한 트랜잭션)
+
+        plates는 `pack()` 결과 그대로여야 한다 (`stock_index`, `_tree_root` 필요).
+        잔재를 쓴 원판에는 'remnant_id'가 붙는다.
+
+        Raises:
+            RuntimeError: 쓴 잔재가 이 임대에 묶여 있지 않은 경우 (만료 후 다른
+                작업이 가져감) — 아무것도 바꾸지 않는다
+        """
+        used = lease.assign(plates)
+        sizes = [size for plate in plates for size in plate_remnants(plate, self.min_side)]
+        with self._write() as db:
+            deleted = db.executemany(
+                'DELETE FROM remnants WHERE id = ? AND leased_by = ?',
+                [(i, lease.token) for i in used],
+            ).rowcount
+            if deleted != len(used):
+                raise RuntimeError(f"임대 {lease.token}: 쓴 잔재 {len(used)}장 중 {deleted}장만 임대 중")
+            db.execute(
+                'UPDATE remnants SET leased_by = NULL, leased_at = NULL WHERE leased_by = ?',
+                (lease.token,),
+            )
+            return self._insert(db, sizes, source)
+
+
+def pack_with_remnants(
+    store: RemnantStore,
+    stocks: list[tuple[int, int, int]],
+    pieces: list[tuple[int, int, int]],
+    kerf: int = 5,
+    allow_rotation: bool = True,
+    source: str = '',
+    packer_cls: type[RegionBasedPacker] = RegionBasedPacker,
+) -> tuple[list[dict], list[dict]]:
+    """재고 잔재를 추가 stock으로 넣어 pack() 하고 잔재 재고를 정산
+
+    Returns:
+        pack()과 같은 (plates, unplaced). 잔재를 쓴 원판은 'remnant_id' 키가 붙는다.
+    """
+    lease = store.lease(stocks, pieces, allow_rotation)
+    try:
+        packer = packer_cls(lease.stocks, kerf, allow_rotation)
+        plates, unplaced = packer.pack(pieces)
+    except BaseException:
+        store.release(lease)
+        raise
+    store.settle(lease, plates, source)
+    return plates, unplaced
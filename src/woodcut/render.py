@@ -0,0 +1,383 @@
+"""재단 도면 벡터 렌더러 — SVG / 다중 페이지 PDF (외부 의존성 없음)
+
+`visualize_solution`은 모든 원판을 matplotlib figure 하나(`10 × 원판 수` 인치)에
+그려서 원판이 50장을 넘으면 메모리 수 GB, 수십 초가 든다. 여기서는 원판 dict를
+하나씩 받아 바로 파일에 쓴다 — 메모리에는 원판 1장 분량만 올라간다.
+
+    write_svg(plates, 'out/', stem='order42')     # out/order42_p001.svg, ...
+    write_pdf(plates, 'order42.pdf')              # 원판 1장 = 1페이지
+
+plates는 리스트가 아니어도 된다 (제너레이터 가능). 조각은 `pieces`, 절단선은
+`cuts`를 쓰고, `cuts`가 없으면 `_tree_root`(GNode 트리)에서 `emit_cuts`로 만든다.
+
+좌표는 웹 캔버스/matplotlib 도면과 같이 원점이 왼쪽 아래다. PDF 표준 글꼴
+(Helvetica)은 한글이 없어 PDF 라벨은 ASCII로만 쓴다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .strategies.gnode import emit_cuts
+
+# matplotlib Set3 팔레트 — 기존 PNG 도면과 비슷한 색감
+_PALETTE = (
+    (141, 211, 199), (255, 255, 179), (190, 186, 218), (251, 128, 114),
+    (128, 177, 211), (253, 180, 98), (179, 222, 105), (252, 205, 229),
+    (217, 217, 217), (188, 128, 189), (204, 235, 197), (255, 237, 111),
+)
+_CUT_COLORS = {'H': (220, 30, 30), 'V': (30, 60, 220)}
+
+
+def _piece_color(piece: dict) -> tuple[int, int, int]:
+    """조각 원래 크기별 고정 색 — 원판을 하나씩 흘려보내도 페이지 간 색이 같다"""
+    w, h = piece.get('original') or (piece['width'], piece['height'])
+    return _PALETTE[zlib.crc32(f"{w}x{h}".encode()) % len(_PALETTE)]
+
+
+def _placed_size(piece: dict) -> tuple[int, int]:
+    if 'placed_w' in piece and 'placed_h' in piece:
+        return piece['placed_w'], piece['placed_h']
+    if piece.get('rotated'):
+        return piece['height'], piece['width']
+    return piece['width'], piece['height']
+
+
+def _plate_cuts(plate: dict) -> list[dict]:
+    cuts = plate.get('cuts')
+    if cuts is None and plate.get('_tree_root') is not None:
+        cuts = emit_cuts(plate['_tree_root'])
+    return cuts or []
+
+
+def _plate_usage(plate: dict) -> float:
+    area = sum(w * h for w, h in map(_placed_size, plate['pieces']))
+    return area / (plate['width'] * plate['height']) if plate['width'] * plate['height'] else 0.0
+
+
+def _type_label(piece: dict) -> str:
+    w, h = piece.get('original') or (piece['width'], piece['height'])
+    return f"{w}x{h}"
+
+
+# ---------------- SVG ----------------
+
+
+def _esc(text: str) -> str:
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+
+
+def _rgb(c: tuple[int, int, int]) -> str:
+    return f"rgb({c[0]},{c[1]},{c[2]})"
+
+
+def render_svg(plate: dict, index: int = 1, title: str | None = None, width_px: int = 1200) -> str:
+    """원판 1장 → SVG 문서 문자열 (단위: mm 좌표를 viewBox로)"""
+    W, H = plate['width'], plate['height']
+    fs = max(W, H) / 90                  # 기본 글자 크기 (mm)
+    m = fs * 2                           # 여백
+    top = fs * 4                         # 제목 + 범례 줄
+    vb_w, vb_h = W + 2 * m, H + 2 * m + top
+    height_px = round(width_px * vb_h / vb_w)
+
+    def Y(y: float, h: float = 0) -> float:  # 왼쪽 아래 원점 → SVG(왼쪽 위)
+        return top + m + (H - y - h)
+
+    cuts = _plate_cuts(plate)
+    usage = _plate_usage(plate)
+    title = title or f"원판 {index} ({W}×{H})"
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width_px}" height="{height_px}" '
+        f'viewBox="{-m:.1f} 0 {vb_w:.1f} {vb_h:.1f}" font-family="sans-serif">',
+        f'<text x="0" y="{fs * 1.5:.1f}" font-size="{fs * 1.3:.1f}" font-weight="bold">'
+        f'{_esc(title)} — 사용률 {usage:.1%} | 절단 {len(cuts)}회</text>',
+    ]
+
+    # 범례 (이 원판에 있는 조각 종류)
+    types: dict[str, tuple[int, int, int]] = {}
+    for p in plate['pieces']:
+        types.setdefault(_type_label(p), _piece_color(p))
+    lx = 0.0
+    for label, color in sorted(types.items()):
+        out.append(f'<rect x="{lx:.1f}" y="{fs * 2.3:.1f}" width="{fs:.1f}" height="{fs:.1f}" '
+                   f'fill="{_rgb(color)}" stroke="black" stroke-width="{fs / 20:.2f}"/>')
+        out.append(f'<text x="{lx + fs * 1.3:.1f}" y="{fs * 3.15:.1f}" font-size="{fs:.1f}">{label}</text>')
+        lx += fs * (1.8 + 0.6 * len(label))
+
+    out.append(f'<rect x="0" y="{Y(0, H):.1f}" width="{W}" height="{H}" fill="white" '
+               f'stroke="black" stroke-width="{fs / 6:.2f}"/>')
+    for p in plate['pieces']:
+        w, h = _placed_size(p)
+        x, y = p['x'], p['y']
+        out.append(f'<rect x="{x}" y="{Y(y, h):.1f}" width="{w}" height="{h}" '
+                   f'fill="{_rgb(_piece_color(p))}" fill-opacity="0.8" stroke="black" '
+                   f'stroke-width="{fs / 12:.2f}"/>')
+        lfs = min(fs, min(w, h) / 3)
+        cx, cy = x + w / 2, Y(y + h / 2)
+        label = f'{w}×{h}'
+        if p.get('rotated'):
+            out.append(f'<text x="{cx:.1f}" y="{cy:.1f}" font-size="{lfs:.1f}" text-anchor="middle" '
+                       f'font-weight="bold"><tspan x="{cx:.1f}" dy="-0.1em">{label}</tspan>'
+                       f'<tspan x="{cx:.1f}" dy="1.1em" font-weight="normal">(회전)</tspan></text>')
+        else:
+            out.append(f'<text x="{cx:.1f}" y="{cy:.1f}" font-size="{lfs:.1f}" text-anchor="middle" '
+                       f'dominant-baseline="middle" font-weight="bold">{label}</text>')
+
+    r = fs * 0.8
+    for cut in cuts:
+        color = _rgb(_CUT_COLORS[cut['direction']])
+        if cut['direction'] == 'H':
+            x1, y1, x2, y2 = cut['start'], Y(cut['position']), cut['end'], Y(cut['position'])
+        else:
+            x1, y1, x2, y2 = cut['position'], Y(cut['start']), cut['position'], Y(cut['end'])
+        out.append(f'<line x1="{x1}" y1="{y1:.1f}" x2="{x2}" y2="{y2:.1f}" stroke="{color}" '
+                   f'stroke-width="{fs / 4:.2f}" stroke-opacity="0.85"/>')
+        mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+        out.append(f'<circle cx="{mx:.1f}" cy="{my:.1f}" r="{r:.1f}" fill="white" stroke="{color}" '
+                   f'stroke-width="{fs / 8:.2f}"/>')
+        out.append(f'<text x="{mx:.1f}" y="{my:.1f}" font-size="{fs:.1f}" fill="{color}" '
+                   f'text-anchor="middle" dominant-baseline="central" font-weight="bold">'
+                   f'{cut["order"]}</text>')
+    out.append('</svg>\n')
+    return '\n'.join(out)
+
+
+def write_svg(plates: Iterable[dict], out_dir: str | Path, stem: str = 'plate') -> list[Path]:
+    """원판마다 SVG 파일 1개 (`<stem>_p001.svg` ...) — 경로 목록 반환"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, plate in enumerate(plates, 1):
+        path = out_dir / f"{stem}_p{i:03d}.svg"
+        path.write_text(render_svg(plate, i), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+# ---------------- PDF ----------------
+
+_BEZIER_K = 0.5523  # 4분할 베지어 원 근사 상수
+
+
+def _pdf_text(text: str) -> str:
+    ascii_text = text.encode('ascii', 'replace').decode('ascii')
+    return ascii_text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _pdf_rgb(c: tuple[int, int, int]) -> str:
+    return f"{c[0] / 255:.3f} {c[1] / 255:.3f} {c[2] / 255:.3f}"
+
+
+class PdfWriter:
+    """페이지를 하나씩 파일에 바로 쓰는 최소 PDF 작성기
+
+    객체를 쓰는 즉시 바이트 오프셋만 기록하고, 페이지 트리(/Pages)와 xref는
+    `close()`에서 쓴다. 메모리에는 페이지 객체 번호와 오프셋(정수)만 남는다.
+    """
+
+    _CATALOG, _PAGES, _FONT, _FONT_BOLD = 1, 2, 3, 4
+
+    def __init__(self, file) -> None:
+        self._file = file
+        self._pos = 0
+        self._offsets: dict[int, int] = {}
+        self._page_ids: list[int] = []
+        self._next_id = 5
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self._object(self._FONT, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+        self._object(self._FONT_BOLD, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>')
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._pos += len(data)
+
+    def _object(self, num: int, body: bytes) -> None:
+        self._offsets[num] = self._pos
+        self._write(f"{num} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    def _new_id(self) -> int:
+        num = self._next_id
+        self._next_id += 1
+        return num
+
+    @property
+    def pages(self) -> int:
+        return len(self._page_ids)
+
+    def add_page(self, width: float, height: float, content: str) -> None:
+        """그리기 명령(content stream) 1페이지 추가"""
+        data = zlib.compress(content.encode('latin-1'))
+        content_id, page_id = self._new_id(), self._new_id()
+        self._object(content_id, f"<< /Length {len(data)} /Filter /FlateDecode >>\nstream\n".encode()
+                     + data + b"\nendstream")
+        self._object(page_id, (
+            f"<< /Type /Page /Parent {self._PAGES} 0 R /MediaBox [0 0 {width:.0f} {height:.0f}] "
+            f"/Resources << /Font << /F1 {self._FONT} 0 R /F2 {self._FONT_BOLD} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>"
+        ).encode())
+        self._page_ids.append(page_id)
+
+    def add_plate(self, plate: dict, index: int = 1, title: str | None = None) -> None:
+        self.add_page(*_pdf_plate_page(plate, index, title))
+
+    def close(self) -> None:
+        kids = ' '.join(f"{p} 0 R" for p in self._page_ids)
+        self._object(self._PAGES, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>".encode())
+        self._object(self._CATALOG, f"<< /Type /Catalog /Pages {self._PAGES} 0 R >>".encode())
+        xref_pos = self._pos
+        size = self._next_id
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        lines += [f"{self._offsets[n]:010d} 00000 n \n" for n in range(1, size)]
+        lines.append(f"trailer\n<< /Size {size} /Root {self._CATALOG} 0 R >>\nstartxref\n{xref_pos}\n%%EOF\n")
+        self._write(''.join(lines).encode())
+
+    def __enter__(self) -> 'PdfWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is None:
+            self.close()
+
+
+def _pdf_plate_page(plate: dict, index: int, title: str | None) -> tuple[float, float, str]:
+    """원판 1장 → (페이지 폭 pt, 높이 pt, content stream). A4, 원판 방향에 맞춰 가로/세로."""
+    W, H = plate['width'], plate['height']
+    pw, ph = (842.0, 595.0) if W >= H else (595.0, 842.0)
+    margin, head = 28.0, 34.0
+    s = min((pw - 2 * margin) / W, (ph - 2 * margin - head) / H)
+    ox, oy = margin, margin
+
+    cuts = _plate_cuts(plate)
+    usage = _plate_usage(plate)
+    title = title or f"Plate {index} ({W}x{H})"
+    cmd = [
+        f"BT /F2 12 Tf {margin:.1f} {ph - margin - 12:.1f} Td "
+        f"({_pdf_text(f'{title} - usage {usage:.1%} | cuts {len(cuts)}')}) Tj ET",
+    ]
+
+    # 범례
+    types: dict[str, tuple[int, int, int]] = {}
+    for p in plate['pieces']:
+        types.setdefault(_type_label(p), _piece_color(p))
+    lx, ly = margin, ph - margin - 28
+    for label, color in sorted(types.items()):
+        cmd.append(f"{_pdf_rgb(color)} rg 0 0 0 RG 0.4 w {lx:.1f} {ly:.1f} 8 8 re B")
+        cmd.append(f"0 0 0 rg BT /F1 7 Tf {lx + 10:.1f} {ly + 1:.1f} Td ({_pdf_text(label)}) Tj ET")
+        lx += 14 + 4.2 * len(label)
+
+    cmd.append(f"1 1 1 rg 0 0 0 RG 1.2 w {ox:.2f} {oy:.2f} {W * s:.2f} {H * s:.2f} re B")
+    for p in plate['pieces']:
+        w, h = _placed_size(p)
+        x, y = ox + p['x'] * s, oy + p['y'] * s
+        cmd.append(f"{_pdf_rgb(_piece_color(p))} rg 0 0 0 RG 0.5 w {x:.2f} {y:.2f} {w * s:.2f} {h * s:.2f} re B")
+        label = f"{w}x{h}" + (" R" if p.get('rotated') else '')
+        size = min(8.0, min(w, h) * s / 3)
+        if size >= 3 and len(label) * size * 0.55 <= w * s:
+            tx = x + w * s / 2 - len(label) * size * 0.28
+            ty = y + h * s / 2 - size / 3
+            cmd.append(f"0 0 0 rg BT /F2 {size:.1f} Tf {tx:.2f} {ty:.2f} Td ({_pdf_text(label)}) Tj ET")
+
+    r = 5.5
+    k = r * _BEZIER_K
+    for cut in cuts:
+        color = _pdf_rgb(_CUT_COLORS[cut['direction']])
+        if cut['direction'] == 'H':
+            x1, y1 = ox + cut['start'] * s, oy + cut['position'] * s
+            x2, y2 = ox + cut['end'] * s, y1
+        else:
+            x1, y1 = ox + cut['position'] * s, oy + cut['start'] * s
+            x2, y2 = x1, oy + cut['end'] * s
+        cmd.append(f"{color} RG 1.5 w {x1:.2f} {y1:.2f} m {x2:.2f} {y2:.2f} l S")
+        mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+        cmd.append(
+            f"1 1 1 rg {color} RG 0.8 w {mx + r:.2f} {my:.2f} m "
+            f"{mx + r:.2f} {my + k:.2f} {mx + k:.2f} {my + r:.2f} {mx:.2f} {my + r:.2f} c "
+            f"{mx - k:.2f} {my + r:.2f} {mx - r:.2f} {my + k:.2f} {mx - r:.2f} {my:.2f} c "
+            f"{mx - r:.2f} {my - k:.2f} {mx - k:.2f} {my - r:.2f} {mx:.2f} {my - r:.2f} c "
+            f"{mx + k:.2f} {my - r:.2f} {mx + r:.2f} {my - k:.2f} {mx + r:.2f} {my:.2f} c B"
+        )
+        num = str(cut['order'])
+        cmd.append(f"{color} rg BT /F2 6 Tf {mx - len(num) * 1.7:.2f} {my - 2.1:.2f} Td ({num}) Tj ET")
+    return pw, ph, '\n'.join(cmd)
+
+
+def write_pdf(plates: Iterable[dict], path_or_file) -> int:
+    """원판마다 1페이지인 PDF 작성 — 페이지 수 반환"""
+    if isinstance(path_or_file, (str, Path)):
+        with open(path_or_file, 'wb') as f:
+            return write_pdf(plates, f)
+    with PdfWriter(path_or_file) as pdf:
+        for i, plate in enumerate(plates, 1):
+            pdf.add_plate(plate, i)
+    return pdf.pages
+
+
+# ---------------- CLI ----------------
+
+
+def iter_result_plates(path: str | Path) -> Iterator[tuple[str, int, dict]]:
+    """결과 파일 → (작업 이름, 원판 번호, 원판 dict)
+
+    `woodcut solve` JSONL(한 줄에 작업 1개) 또는 CuttingResponse JSON 1개.
+    컴팩트 인코딩 결과는 복원해서 넘긴다.
+    """
+    from .compact import decode_compact
+
+    path = Path(path)
+    with open(path, encoding='utf-8') as f:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = iter([json.load(f)])
+        for rec in records:
+            name = rec.get('name') or path.stem
+            result = rec['result'] if 'result' in rec else rec
+            if not result:  # 실패한 작업
+                continue
+            plates = decode_compact(result)[0] if 'format' in result else result.get('plates', [])
+            for i, plate in enumerate(plates, 1):
+                yield name, i, plate
+
+
+def main(argv: list[str] | None = None) -> int:
+    """`woodcut render` 진입점"""
+    parser = argparse.ArgumentParser(prog='woodcut render', description='재단 결과를 SVG/PDF 도면으로')
+    parser.add_argument('result', help='woodcut solve 출력(.jsonl) 또는 CuttingResponse JSON')
+    parser.add_argument('--svg', metavar='DIR', help='원판마다 SVG 파일을 쓸 디렉터리')
+    parser.add_argument('--pdf', metavar='FILE', help='원판 1장 = 1페이지 PDF 경로')
+    args = parser.parse_args(argv)
+    if not args.svg and not args.pdf:
+        parser.error('--svg 또는 --pdf 중 하나 이상 지정하세요')
+
+    svg_dir = Path(args.svg) if args.svg else None
+    if svg_dir:
+        svg_dir.mkdir(parents=True, exist_ok=True)
+    pdf_file = open(args.pdf, 'wb') if args.pdf else None
+    pdf = PdfWriter(pdf_file) if pdf_file else None
+    count = 0
+    try:
+        for name, i, plate in iter_result_plates(args.result):
+            title = f"{name} #{i} ({plate['width']}x{plate['height']})"
+            if svg_dir:
+                stem = re.sub(r'[^\w.-]', '_', name)
+                (svg_dir / f"{stem}_p{i:03d}.svg").write_text(
+                    render_svg(plate, i, title=title), encoding='utf-8')
+            if pdf:
+                pdf.add_plate(plate, i, title=title)
+            count += 1
+        if pdf:
+            pdf.close()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 결과 파일 오류: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if pdf_file:
+            pdf_file.close()
+    print(f"원판 {count}장 렌더링" + (f" → {svg_dir}/" if svg_dir else '') + (f" → {args.pdf}" if pdf else ''))
+    return 0
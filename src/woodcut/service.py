@@ -0,0 +1,106 @@
+"""재단 요청 처리 계층 — 웹 서버와 워커 프로세스가 공유
+
+`solve_order`는 FastAPI/pydantic에 의존하지 않는 순수 함수다. 워커 풀
+(`ProcessPoolExecutor`)로 pickle 되어 넘어가므로 워커 프로세스는 이 모듈과
+패커만 import 하면 되고, 웹 프레임워크 import 비용을 치르지 않는다.
+"""
+
+from __future__ import annotations
+
+import time
+
+from .compact import encode_compact
+from .strategies import RegionBasedPacker
+from .strategies.region_based_split import RegionBasedPackerWithSplit
+from .validate import validate_solution
+
+PACKERS = {
+    'region_based': RegionBasedPacker,
+    'region_based_split': RegionBasedPackerWithSplit,
+}
+
+
+def _as_triples(items: list, kind: str) -> list[tuple[int, int, int]]:
+    """[{'width', 'height', 'count'}, ...] 또는 [(w, h, c), ...]를 튜플 리스트로."""
+    triples = []
+    for item in items:
+        if isinstance(item, dict):
+            triples.append((int(item['width']), int(item['height']), int(item['count'])))
+        else:
+            w, h, c = item
+            triples.append((int(w), int(h), int(c)))
+    if not triples:
+        raise ValueError(f"{kind} 정보가 없습니다")
+    return triples
+
+
+def make_packer(order: dict) -> tuple[RegionBasedPacker, list[tuple[int, int, int]]]:
+    """주문 dict → (전략에 맞는 패커, 조각 튜플 리스트). 알 수 없는 전략은 region_based.
+
+    Raises:
+        ValueError: 조각/원판 정보가 비었거나 값이 잘못된 경우.
+    """
+    pieces = _as_triples(order.get('pieces') or [], '조각')
+    stocks = _as_triples(order.get('stocks') or [], '원판')
+    packer_cls = PACKERS.get(order.get('strategy', 'region_based'), RegionBasedPacker)
+    return packer_cls(stocks, order.get('kerf', 5), order.get('allow_rotation', True)), pieces
+
+
+def solve_order(order: dict, compact: bool = False, validate: bool = False) -> dict:
+    """CuttingRequest 형태의 dict 하나를 풀어 CuttingResponse 형태의 dict 반환.
+
+    `solve_order_instrumented`에서 탐색 통계를 뺀 것 — 인자/반환/예외는 같다.
+    """
+    return solve_order_instrumented(order, compact, validate)[0]
+
+
+def solve_order_instrumented(order: dict, compact: bool = False,
+                             validate: bool = False) -> tuple[dict, dict]:
+    """주문 1건을 풀고 결과와 탐색 통계를 함께 반환.
+
+    Args:
+        order: {'stocks', 'pieces', 'kerf', 'allow_rotation', 'strategy'}.
+            stocks/pieces는 dict 또는 (width, height, count) 튜플 리스트.
+        compact: True면 plates/unplaced_pieces를 `encode_compact` 형식으로 반환
+            (`format`, `piece_types` 키 추가). 워커 안에서 인코딩해 프로세스 간
+            전송량도 함께 줄인다.
+        validate: True면 `woodcut.validate.validate_solution`으로 결과를 검사해
+            'violations'(위반 dict 리스트, 비어 있으면 통과) 키를 추가한다.
+
+    Returns:
+        (result, stats):
+            result: {'success', 'total_pieces', 'placed_pieces', 'plates_used',
+                     'plates', 'unplaced_pieces'}
+            stats: 패커의 `SearchStats.as_dict()` + 'solve_seconds'(워커 내 실행 시간)
+
+    Raises:
+        ValueError: 조각/원판 정보가 비었거나 값이 잘못된 경우.
+    """
+    started = time.perf_counter()
+    packer, pieces = make_packer(order)
+    plates, unplaced = packer.pack(pieces)
+
+    # free_spaces는 FreeSpace 객체 포함 내부 상태, _tree_root는 디버그용 GNode 트리 —
+    # 둘 다 클라이언트 미사용이고 프로세스 경계를 넘길 이유가 없다.
+    for plate in plates:
+        plate.pop('free_spaces', None)
+        plate.pop('_tree_root', None)
+
+    total_pieces = sum(c for _, _, c in pieces)
+    result = {
+        'success': len(unplaced) == 0,
+        'total_pieces': total_pieces,
+        'placed_pieces': total_pieces - len(unplaced),
+        'plates_used': len(plates),
+        'plates': plates,
+        'unplaced_pieces': unplaced,
+    }
+    if validate:
+        violations = validate_solution(plates, packer.kerf, pieces, unplaced)
+        result['violations'] = [v.as_dict() for v in violations]
+    if compact:
+        result.update(encode_compact(plates, unplaced))
+
+    stats = packer.stats.as_dict()
+    stats['solve_seconds'] = time.perf_counter() - started
+    return result, stats
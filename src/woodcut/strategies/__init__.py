@@ -1,4 +1,5 @@
 """패킹 전략 모듈"""
-from .region_based import RegionBasedPacker
+from .region_based import RegionBasedPacker, ValidationPolicy
+from .stats import PackProfile
 
-__all__ = ['RegionBasedPacker']
+__all__ = ['RegionBasedPacker', 'PackProfile', 'ValidationPolicy']
@@ -15,17 +15,20 @@
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Literal, Optional
 
 CutDir = Literal['H', 'V']
 LeafKind = Literal['piece', 'scrap', 'kerf']
 
 
-@dataclass
+@dataclass(slots=True)
 class GNode:
     """Guillotine tree node.
 
+    원판 시뮬레이션마다 수백 개씩 만들고 버리므로 `__slots__`로 둔다 — 인스턴스
+    `__dict__`와 노드마다의 태그 dict가 없어 노드당 메모리가 약 40% 준다.
+
     Attributes
     ----------
     x, y, w, h
@@ -42,8 +45,11 @@ class GNode:
         leaf에 배치된 조각 dict (placed_w/h, rotated 포함). 스크랩이면 None.
     kind
         leaf 종류 힌트: 'piece' | 'scrap' | 'kerf'.
-    meta
-        시각화·디버깅 태그. cut emit시 type 필드로 전달할 수 있음.
+    tag
+        internal 노드 컷의 종류 (예: 'region_boundary'). cut emit 때 `type`
+        필드로 나간다. 없으면 'split'.
+    region_id
+        Phase A region 루트 노드의 id (예: 'R1') — 디버깅용.
     """
 
     x: int
@@ -58,7 +64,8 @@ class GNode:
 
     piece: Optional[dict[str, Any]] = None
     kind: Optional[LeafKind] = None
-    meta: dict[str, Any] = field(default_factory=dict)
+    tag: Optional[str] = None
+    region_id: Optional[str] = None
 
     # ---- 편의 프로퍼티 ----
 
@@ -76,18 +83,23 @@ class GNode:
 
     def leaves(self) -> list['GNode']:
         """모든 leaf 노드를 전위 순서로 반환."""
-        out: list[GNode] = []
-        _collect_leaves(self, out)
-        return out
+        return [node for node in iter_preorder(self) if node.is_leaf]
 
 
-def _collect_leaves(node: GNode, out: list[GNode]) -> None:
-    if node.is_leaf:
-        out.append(node)
-        return
-    assert node.first is not None and node.second is not None
-    _collect_leaves(node.first, out)
-    _collect_leaves(node.second, out)
+def iter_preorder(root: GNode):
+    """전위 순회 (명시적 스택) — 트리 깊이와 무관하게 재귀 한도에 걸리지 않는다.
+
+    second를 먼저 쌓아 first 서브트리가 먼저 나온다.
+    """
+    stack = [root]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node = pop()
+        yield node
+        if node.cut_dir is not None:
+            assert node.first is not None and node.second is not None
+            push(node.second)
+            push(node.first)
 
 
 # ---------------- 분할 ----------------
@@ -153,38 +165,32 @@ def emit_cuts(root: GNode) -> list[dict[str, Any]]:
     `sub_priority` (모두 채움. priority는 order와 동일한 값으로 뒤호환).
     """
     out: list[dict[str, Any]] = []
-    _emit(root, out)
-    for idx, c in enumerate(out):
-        c['order'] = idx + 1
-        c.setdefault('priority', idx + 1)
-        c.setdefault('sub_priority', 0)
+    for node in iter_preorder(root):
+        if node.cut_dir is None:
+            continue
+        assert node.cut_pos is not None
+        if node.cut_dir == 'H':
+            start, end = node.x, node.x + node.w
+        else:
+            start, end = node.y, node.y + node.h
+        order = len(out) + 1
+        out.append({
+            'direction': node.cut_dir,
+            'position': node.cut_pos,
+            'start': start,
+            'end': end,
+            'type': node.tag or 'split',
+            'region_x': node.x,
+            'region_y': node.y,
+            'region_w': node.w,
+            'region_h': node.h,
+            'order': order,
+            'priority': order,
+            'sub_priority': 0,
+        })
     return out
 
 
-def _emit(node: GNode, out: list[dict[str, Any]]) -> None:
-    if node.is_leaf:
-        return
-    assert node.cut_dir is not None and node.cut_pos is not None
-    assert node.first is not None and node.second is not None
-    if node.cut_dir == 'H':
-        start, end = node.x, node.x + node.w
-    else:
-        start, end = node.y, node.y + node.h
-    out.append({
-        'direction': node.cut_dir,
-        'position': node.cut_pos,
-        'start': start,
-        'end': end,
-        'type': node.meta.get('type', 'split'),
-        'region_x': node.x,
-        'region_y': node.y,
-        'region_w': node.w,
-        'region_h': node.h,
-    })
-    _emit(node.first, out)
-    _emit(node.second, out)
-
-
 # ---------------- 불변식 검증 ----------------
 
 
@@ -201,7 +207,14 @@ def validate_guillotine(root: GNode, kerf: int, tol: int = 1) -> list[str]:
     6. 조각들 사이 물리적 겹침 없음 (leaf 단위로 자동 보장되므로 스캔만).
     """
     errors: list[str] = []
-    _validate_node(root, kerf, tol, errors, path='root')
+    # 명시적 스택 전위 순회 — 오류 순서는 재귀 버전과 같다
+    stack = [(root, 'root')]
+    while stack:
+        node, path = stack.pop()
+        children = _validate_node(node, kerf, tol, errors, path)
+        if children:
+            stack.append((node.second, f"{path}.second"))
+            stack.append((node.first, f"{path}.first"))
     return errors
 
 
@@ -211,10 +224,11 @@ def _validate_node(
     tol: int,
     errors: list[str],
     path: str,
-) -> None:
+) -> bool:
+    """노드 1개 검사 — 자식까지 내려가 검사해야 하면 True."""
     if node.w <= 0 or node.h <= 0:
         errors.append(f"{path}: non-positive size ({node.w}x{node.h})")
-        return
+        return False
 
     if node.is_leaf:
         if node.piece is not None:
@@ -224,7 +238,7 @@ def _validate_node(
             ph = node.piece.get('placed_h', node.piece.get('height'))
             if px is None or py is None or pw is None or ph is None:
                 errors.append(f"{path}: piece missing x/y/placed_w/h: {node.piece}")
-                return
+                return False
             if (
                 px < node.x - tol or py < node.y - tol or
                 px + pw > node.x2 + tol or py + ph > node.y2 + tol
@@ -233,15 +247,15 @@ def _validate_node(
                     f"{path}: piece rect ({px},{py},{pw}x{ph}) escapes node "
                     f"({node.x},{node.y},{node.w}x{node.h})"
                 )
-        return
+        return False
 
     # internal
     if node.cut_dir is None or node.cut_pos is None:
         errors.append(f"{path}: internal node missing cut_dir/pos")
-        return
+        return False
     if node.first is None or node.second is None:
         errors.append(f"{path}: internal node missing children")
-        return
+        return False
 
     cd, cp = node.cut_dir, node.cut_pos
     if cd == 'H':
@@ -260,8 +274,7 @@ def _validate_node(
         _expect_rect(node.first, exp_left, errors, f"{path}.first(left)")
         _expect_rect(node.second, exp_right, errors, f"{path}.second(right)")
 
-    _validate_node(node.first, kerf, tol, errors, f"{path}.first")
-    _validate_node(node.second, kerf, tol, errors, f"{path}.second")
+    return True
 
 
 def _expect_rect(
@@ -0,0 +1,194 @@
+"""원판/영역 점유 래스터 (선택적 numpy)
+
+점유 Rect들의 모서리 좌표로 압축한 격자 — 격자선이 모든 Rect 경계를 포함하므로
+각 칸은 통째로 비었거나 통째로 덮였다. 해상도가 원판 크기(mm)가 아니라 Rect 수에
+비례해서, gcd 해상도 격자보다 작고 좌표가 서로소여도 정확하다.
+
+칸별 덮인 횟수(cover)를 2D 차분 + 누적합으로 한 번에 만들고, 면적 가중
+summed-area table과 행/열 방향 누적합을 둔다. 임의 질의 사각형의 덮인 면적은
+경계 칸의 부분 폭/높이 보정까지 표 조회 몇 번 — bisect O(log n) + O(1).
+
+- is_free(x, y, w, h): 점유와 양의 면적으로 겹치지 않는지
+- covered_area(x, y, w, h): 질의 안의 점유 면적 (겹친 부분은 한 번)
+- overlap_area(x, y, w, h): 2개 이상 Rect가 겹친 면적 — 0이 아니면 겹침 버그
+- largest_free_rect(): 가장 큰 빈 직사각형 (x, y, w, h)
+
+Rect 추가는 버퍼에 쌓았다가 다음 질의 때 한 번 다시 만든다. numpy는
+occupancy_grid()가 Rect 수 임계값을 넘겼을 때 처음 import 하고, 없으면
+None을 돌려줘 호출 측은 Rect 리스트 교차 검사를 쓴다.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+
+from .rect import Rect
+from .scoring import _numpy
+
+# 점유 Rect가 이보다 적으면 격자 구성 비용이 Rect 리스트 직접 교차보다 비싸다
+OCCUPANCY_MIN_RECTS = 48
+
+
+class _AreaTable:
+    """칸 마스크의 면적 질의 표 — 2D 가중 SAT + 열/행 방향 가중 누적합"""
+    __slots__ = ('sat', 'col', 'row', 'cell')
+
+    def __init__(self, np, mask, cw, ch) -> None:
+        m = mask.astype(np.int64)
+        self.cell = m * ch[:, None] * cw[None, :]  # 칸 면적 (덮였으면)
+        ny, nx = m.shape
+        self.sat = np.zeros((ny + 1, nx + 1), dtype=np.int64)
+        self.sat[1:, 1:] = self.cell.cumsum(0).cumsum(1)
+        self.col = np.zeros((ny + 1, nx), dtype=np.int64)  # 열 i의 행 prefix Σ m·ch
+        self.col[1:] = (m * ch[:, None]).cumsum(0)
+        self.row = np.zeros((ny, nx + 1), dtype=np.int64)  # 행 j의 열 prefix Σ m·cw
+        self.row[:, 1:] = (m * cw[None, :]).cumsum(1)
+
+    def area(self, i1, i2, j1, j2, dx, dy) -> int:
+        """칸 [i1, i2)×[j1, j2) 안의 면적 — dx/dy: {칸: 잘려 나간 길이}
+
+        Σ m·(cw-dx)(ch-dy) = Σ m·cw·ch − Σ dx·Σ m·ch − Σ dy·Σ m·cw + Σ m·dx·dy
+        """
+        sat = self.sat
+        total = int(sat[j2, i2] - sat[j1, i2] - sat[j2, i1] + sat[j1, i1])
+        for i, d in dx.items():
+            total -= d * int(self.col[j2, i] - self.col[j1, i])
+        for j, d in dy.items():
+            total -= d * int(self.row[j, i2] - self.row[j, i1])
+        for i, di in dx.items():
+            for j, dj in dy.items():
+                if self.cell[j, i]:
+                    total += di * dj
+        return total
+
+
+class OccupancyGrid:
+    """width×height 판 위 점유 Rect들의 압축 좌표 래스터"""
+    __slots__ = ('width', 'height', '_np', '_rects', '_pending', '_xs', '_ys',
+                 '_cover', '_covered', '_overlap')
+
+    def __init__(self, width: int, height: int, rects=(), np=None) -> None:
+        self._np = np or _numpy()
+        self.width = width
+        self.height = height
+        self._rects: list[Rect] = []
+        self._pending: list[Rect] = list(rects)
+        self._xs: list[int] = []
+        self._ys: list[int] = []
+        self._cover = None
+        self._covered = None
+        self._overlap = None
+
+    def __len__(self) -> int:
+        return len(self._rects) + len(self._pending)
+
+    def add(self, rect: Rect) -> None:
+        self._pending.append(rect)
+
+    def _build(self) -> None:
+        np = self._np
+        self._rects.extend(self._pending)
+        self._pending = []
+        W, H = self.width, self.height
+        clipped = [(min(max(r.x, 0), W), min(max(r.x2, 0), W), min(max(r.y, 0), H), min(max(r.y2, 0), H))
+                   for r in self._rects]
+        clipped = [c for c in clipped if c[0] < c[1] and c[2] < c[3]]
+        xs = sorted({0, W}.union(*((c[0], c[1]) for c in clipped)))
+        ys = sorted({0, H}.union(*((c[2], c[3]) for c in clipped)))
+        xa = np.array(xs, dtype=np.int64)
+        ya = np.array(ys, dtype=np.int64)
+
+        diff = np.zeros((len(ys), len(xs)), dtype=np.int64)
+        if clipped:
+            c = np.array(clipped, dtype=np.int64)
+            i1, i2 = np.searchsorted(xa, c[:, 0]), np.searchsorted(xa, c[:, 1])
+            j1, j2 = np.searchsorted(ya, c[:, 2]), np.searchsorted(ya, c[:, 3])
+            np.add.at(diff, (j1, i1), 1)
+            np.add.at(diff, (j1, i2), -1)
+            np.add.at(diff, (j2, i1), -1)
+            np.add.at(diff, (j2, i2), 1)
+        cover = diff.cumsum(0).cumsum(1)[:-1, :-1]
+        cw, ch = np.diff(xa), np.diff(ya)
+
+        self._xs, self._ys = xs, ys
+        self._cover = cover
+        self._covered = _AreaTable(np, cover > 0, cw, ch)
+        self._overlap = _AreaTable(np, cover > 1, cw, ch)
+
+    def _ready(self) -> None:
+        if self._pending or self._cover is None:
+            self._build()
+
+    def _cells(self, x: int, y: int, w: int, h: int):
+        """질의 사각형 → (i1, i2, j1, j2, dx, dy) 또는 판 밖/빈 질의면 None"""
+        x1, x2 = max(x, 0), min(x + w, self.width)
+        y1, y2 = max(y, 0), min(y + h, self.height)
+        if x1 >= x2 or y1 >= y2:
+            return None
+        xs, ys = self._xs, self._ys
+        i1, i2 = bisect_right(xs, x1) - 1, bisect_left(xs, x2)
+        j1, j2 = bisect_right(ys, y1) - 1, bisect_left(ys, y2)
+        dx = {}
+        for i in {i1, i2 - 1}:
+            d = (xs[i + 1] - xs[i]) - (min(xs[i + 1], x2) - max(xs[i], x1))
+            if d:
+                dx[i] = d
+        dy = {}
+        for j in {j1, j2 - 1}:
+            d = (ys[j + 1] - ys[j]) - (min(ys[j + 1], y2) - max(ys[j], y1))
+            if d:
+                dy[j] = d
+        return i1, i2, j1, j2, dx, dy
+
+    def covered_area(self, x: int, y: int, w: int, h: int) -> int:
+        self._ready()
+        cells = self._cells(x, y, w, h)
+        return 0 if cells is None else self._covered.area(*cells)
+
+    def is_free(self, x: int, y: int, w: int, h: int) -> bool:
+        return self.covered_area(x, y, w, h) == 0
+
+    def overlap_area(self, x: int = 0, y: int = 0, w: int | None = None, h: int | None = None) -> int:
+        """2개 이상 Rect가 덮은 면적 (기본: 판 전체)"""
+        self._ready()
+        cells = self._cells(x, y, self.width if w is None else w, self.height if h is None else h)
+        return 0 if cells is None else self._overlap.area(*cells)
+
+    def largest_free_rect(self) -> tuple[int, int, int, int] | None:
+        """가장 큰 빈 직사각형 (x, y, w, h) — 없으면 None
+
+        빈 직사각형의 변은 항상 격자선 위에 있으므로 격자 칸 단위 히스토그램
+        스택(폭 가중)으로 정확하다. 동점은 아래→위, 왼→오 첫 번째.
+        """
+        self._ready()
+        xs, ys = self._xs, self._ys
+        cw = [xs[i + 1] - xs[i] for i in range(len(xs) - 1)]
+        free = (self._cover == 0).tolist()
+        heights = [0] * len(cw)
+        best = None
+        best_area = 0
+        for j, row in enumerate(free):
+            ch = ys[j + 1] - ys[j]
+            heights = [hh + ch if f else 0 for hh, f in zip(heights, row)]
+            stack: list[tuple[int, int]] = []  # (시작 칸, 높이)
+            for i, hh in enumerate(heights + [0]):
+                start = i
+                while stack and stack[-1][1] >= hh:
+                    start, sh = stack.pop()
+                    area = sh * (xs[i] - xs[start])
+                    if area > best_area:
+                        best_area = area
+                        best = (xs[start], ys[j + 1] - sh, xs[i] - xs[start], sh)
+                if hh:
+                    stack.append((start, hh))
+        return best
+
+
+def occupancy_grid(width: int, height: int, rects=(),
+                   min_rects: int | None = None) -> OccupancyGrid | None:
+    """numpy가 있고 Rect가 min_rects(기본 OCCUPANCY_MIN_RECTS)개 이상이면 OccupancyGrid"""
+    if min_rects is None:
+        min_rects = OCCUPANCY_MIN_RECTS
+    if len(rects) < min_rects:
+        return None
+    np = _numpy()
+    return OccupancyGrid(width, height, rects, np) if np is not None else None
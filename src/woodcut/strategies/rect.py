@@ -8,10 +8,11 @@ row-based abstraction failed to prevent for stacked groups.
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rect:
     x: int
     y: int
@@ -83,3 +84,75 @@ def split_guillotine(free: Rect, used: Rect) -> list[Rect]:
         Rect(free.x, used.y2, free.w, below_h),
         Rect(used.x2, free.y, right_w, used.h),
     ]
+
+
+class MaxRects:
+    """Maximal empty rectangles of a plate, updated incrementally.
+
+    `place(used)` carves `used` out of every free rect it touches (up to four
+    strips each) and drops only the *new* strips that are contained in another
+    free rect — untouched rects stay maximal, so pruning is O(new × free)
+    instead of re-deriving the whole set. `undo()` restores the state before
+    the last `place`, which is what a backtracking search needs.
+
+    `free` holds `(x, y, w, h)` tuples sorted by x then y: intersection queries
+    stop at the first rect starting right of `used.x2`, and iteration order is
+    canonical — the same occupied set yields the same list regardless of
+    placement order.
+    """
+
+    __slots__ = ('free', '_history')
+
+    def __init__(self, width: int, height: int) -> None:
+        self.free: list[tuple[int, int, int, int]] = (
+            [(0, 0, width, height)] if width > 0 and height > 0 else []
+        )
+        self._history: list[list[tuple[int, int, int, int]]] = []
+
+    def place(self, used: Rect) -> None:
+        self._history.append(self.free)
+        free = self.free
+        ux, uy, ux2, uy2 = used.x, used.y, used.x + used.w, used.y + used.h
+        end = bisect_left(free, (ux2,))
+        kept = free[end:]
+        strips = []
+        for f in free[:end]:
+            fx, fy, fw, fh = f
+            fx2, fy2 = fx + fw, fy + fh
+            if ux2 <= fx or fx2 <= ux or uy2 <= fy or fy2 <= uy:
+                kept.append(f)
+                continue
+            if ux > fx:
+                strips.append((fx, fy, ux - fx, fh))
+            if ux2 < fx2:
+                strips.append((ux2, fy, fx2 - ux2, fh))
+            if uy > fy:
+                strips.append((fx, fy, fw, uy - fy))
+            if uy2 < fy2:
+                strips.append((fx, uy2, fw, fy2 - uy2))
+
+        if strips:
+            # strips are sorted so identical ones are adjacent; keep the first
+            strips.sort()
+            new = []
+            prev = None
+            for r in strips:
+                if r == prev:
+                    continue
+                prev = r
+                rx, ry, rw, rh = r
+                rx2, ry2 = rx + rw, ry + rh
+                if any(ox <= rx and oy <= ry and rx2 <= ox + ow and ry2 <= oy + oh
+                       for ox, oy, ow, oh in kept):
+                    continue
+                if any(o != r and o[0] <= rx and o[1] <= ry
+                       and rx2 <= o[0] + o[2] and ry2 <= o[1] + o[3]
+                       for o in strips):
+                    continue
+                new.append(r)
+            kept.extend(new)
+            kept.sort()
+        self.free = kept
+
+    def undo(self) -> None:
+        self.free = self._history.pop()
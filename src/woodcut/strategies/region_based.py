@@ -8,9 +8,18 @@
 """
 
 from __future__ import annotations
-from ..packing import PackingStrategy, FreeSpace
+import os
+import random
+from bisect import bisect_right
+from operator import itemgetter
+from time import perf_counter
+from ..packing import PackingStrategy, FreeSpace, FreeSpaceIndex
+from ..trace import TRACER, TRACE_DEBUG, TRACE_INFO, TRACE_WARNING
 from .gnode import GNode, emit_cuts, split_h, split_v, validate_guillotine
-from .rect import Rect, intersects
+from .occupancy import occupancy_grid
+from .rect import MaxRects, Rect, intersects
+from .scoring import space_columns, variant_table
+from .stats import PackProfile, SearchStats
 
 
 def select_best_stock(
@@ -37,6 +46,214 @@ def select_best_stock(
     return best[0]
 
 
+def stock_upper_bound(
+    width: int, height: int, pieces: list[dict], allow_rotation: bool = True,
+) -> tuple[int, float]:
+    """width×height stock 1장의 (pieces_placed, utilization) 상한 — 시뮬레이션 없이.
+
+    pieces는 면적 오름차순이어야 한다. 원판에 (회전 허용 시 회전 포함) 들어가는
+    조각만 남기고, 작은 것부터 원판 면적이 찰 때까지 센 수가 조각 수 상한,
+    들어가는 조각 면적 합(원판 면적 이하로 자름)이 배치 면적 상한이다. 실제
+    배치는 서로 겹치지 않으므로 둘 다 넘을 수 없다 — kerf는 무시(느슨해도 안전).
+    utilization은 pack()과 같은 식(면적 / 원판 면적)이라 float 비교도 안전하다.
+    """
+    plate_area = width * height
+    if plate_area <= 0:
+        return 0, 0.0
+    count = 0
+    filled = 0
+    total = 0
+    for p in pieces:
+        w, h = p['width'], p['height']
+        if not (w <= width and h <= height) and not (allow_rotation and h <= width and w <= height):
+            continue
+        area = w * h
+        total += area
+        if filled + area <= plate_area:
+            filled += area
+            count += 1
+    return count, min(total, plate_area) / plate_area
+
+
+# `_allocate_recursive_2d` 상태 memo 최대 항목 수 — 배치 불가 그룹이 섞이면 탐색이
+# 지수적으로 커지므로 메모리 상한을 둔다 (넘으면 새 상태는 저장하지 않을 뿐 결과는 같다)
+RECURSIVE_2D_MEMO_LIMIT = 200_000
+
+
+def _find_split(
+    pieces: list[dict], pos_key: str, size_key: str, fallback_key: str,
+    lo: int, hi: int, kerf: int,
+) -> tuple[int, list[dict], list[dict]] | None:
+    """한 축에서 조각들을 둘로 가르는 가장 작은 guillotine 컷 (정렬 투영).
+
+    조각을 시작 좌표로 정렬하면 컷 c의 오른쪽(시작 ≥ c + kerf)은 접미사, 왼쪽은
+    접두사가 된다. 접두사 k개의 끝 좌표 최댓값이 정확히 c이고 k번째 조각이
+    c + kerf에서 시작하면 c로 가를 수 있다 — 후보 컷마다 조각 전체를 다시 훑던
+    O(n²)을 정렬 1번 + 선형 스캔으로 줄인다.
+
+    Args:
+        pos_key: 'x' 또는 'y'
+        size_key / fallback_key: 배치 크기 키 ('placed_w'/'width' 등)
+        lo, hi: 노드 구간 — 컷은 (lo, hi) 안쪽이어야 한다
+
+    Returns:
+        (컷 좌표, 앞쪽 조각, 뒤쪽 조각) 또는 None
+    """
+    ordered = sorted(pieces, key=itemgetter(pos_key))
+    reach = lo
+    for k, p in enumerate(ordered):
+        start = p[pos_key]
+        if k and reach == start - kerf and lo < reach < hi:
+            return reach, ordered[:k], ordered[k:]
+        end = start + p.get(size_key, p[fallback_key])
+        if end > reach:
+            reach = end
+    return None
+
+
+class TrimCandidatePool:
+    """`_optimize_trim_placement`의 trim 후보 풀 — 조각 높이 정렬 인덱스
+
+    예전에는 region × 그룹마다 이후 region 전부를 다시 훑어 후보 dict를 새로
+    만들었다(O(R²·G) + 루프 안 할당). 풀은 한 번 만들고, `_apply_shelf_result`가
+    후보 dict의 count를 제자리에서 줄인다. strip 질의는 높이 bisect로 범위를 자른 뒤
+    너비·region·남은 수로 거른다.
+
+    각 후보는 {region_idx, group_ref, original_size, rotated, piece_w, piece_h,
+    count, order}. group_ref는 원래 region의 group dict, order는 (region, 그룹)
+    순서 — 질의 결과는 예전 수집 순서와 같다.
+    """
+    __slots__ = ('_entries', '_heights', '_dead', '_floor', '_per_region')
+
+    def __init__(self, regions: list[dict]) -> None:
+        entries: list[dict] = []
+        for ridx, r in enumerate(regions):
+            if r.get('type') == 'scrap':
+                continue
+            rows = r.get('rows') or []
+            if not rows:
+                continue
+            for g in rows[0]['groups']:
+                if g.get('count', 0) <= 0:
+                    continue
+                ow, oh = g['original_size']
+                rot = g['rotated']
+                entries.append({
+                    'region_idx': ridx,
+                    'group_ref': g,
+                    'original_size': (ow, oh),
+                    'rotated': rot,
+                    'piece_w': oh if rot else ow,
+                    'piece_h': ow if rot else oh,
+                    'count': g['count'],
+                    'order': len(entries),
+                })
+        self._index(entries)
+
+    def _index(self, entries: list[dict], floor: int = -1) -> None:
+        entries.sort(key=itemgetter('piece_h', 'order'))
+        self._entries = entries
+        self._heights = [c['piece_h'] for c in entries]
+        self._dead = 0  # count가 0이 된 후보 수
+        self._floor = floor  # 이 region 이하 후보는 더 이상 질의되지 않음
+        self._per_region: dict[int, int] = {}
+        for c in entries:
+            self._per_region[c['region_idx']] = self._per_region.get(c['region_idx'], 0) + 1
+
+    def __len__(self) -> int:
+        return sum(1 for c in self._entries if c['count'] > 0)
+
+    def query(self, after_region: int, max_w: int, max_h: int) -> list[dict]:
+        """region `after_region` 이후의 남은 후보 중 max_w × max_h 안에 드는 것 (수집 순서)
+
+        `_optimize_trim_placement`는 region을 앞에서부터 돌므로 after_region은
+        줄지 않는다 — 지나간 region 후보와 다 쓴 후보가 절반을 넘으면 인덱스를 다시 만든다.
+        """
+        if after_region > self._floor:
+            passed = sum(n for r, n in self._per_region.items() if self._floor < r <= after_region)
+            self._dead += passed
+            self._floor = after_region
+        if self._dead * 2 > len(self._entries):
+            self._index([c for c in self._entries
+                         if c['count'] > 0 and c['region_idx'] > after_region], after_region)
+        entries = self._entries
+        found = []
+        for k in range(bisect_right(self._heights, max_h)):
+            c = entries[k]
+            if c['count'] > 0 and c['piece_w'] <= max_w and c['region_idx'] > after_region:
+                found.append(c)
+        found.sort(key=itemgetter('order'))
+        return found
+
+    def consume(self, cand: dict) -> None:
+        """후보 조각 1개 사용 — 후보와 원래 그룹 count를 함께 줄인다"""
+        cand['count'] -= 1
+        g = cand['group_ref']
+        g['count'] -= 1
+        if g['count'] < 0:
+            raise AssertionError(f"후보 count 음수: {g}")
+        if cand['count'] == 0:
+            self._dead += 1
+
+
+class ValidationPolicy:
+    """GNode 트리 불변식(`validate_guillotine`)을 어느 원판에 검사할지
+
+    stock 후보 시뮬레이션은 원판 1장마다 후보 수만큼 돌고 대부분 버려진다.
+    버려질 후보까지 검사하던 예전 `__debug__` 동작은 `always`로 남기고, 기본은
+    pack()이 실제로 채택한 원판만 검사한다.
+
+    모드:
+        off: 검사하지 않음
+        committed: 채택한 원판 전부 (기본)
+        sampled: 채택한 원판을 확률 `rate`로
+        always: 후보 시뮬레이션 원판까지 전부
+
+    `WOODCUT_VALIDATE` 환경변수로 기본값을 바꾼다 — `off`, `committed`, `always`,
+    `sampled:0.05`.
+    """
+
+    MODES = ('off', 'committed', 'sampled', 'always')
+    ENV_VAR = 'WOODCUT_VALIDATE'
+
+    def __init__(self, mode: str = 'committed', rate: float = 1.0, seed: int | None = None) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 검증 모드: {mode!r} ({', '.join(self.MODES)})")
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"검증 샘플 비율은 0~1: {rate}")
+        self.mode = mode
+        self.rate = rate
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, text: str) -> 'ValidationPolicy':
+        """`'committed'`, `'sampled:0.1'` 형태 문자열 → 정책"""
+        mode, _, rate = text.strip().lower().partition(':')
+        try:
+            return cls(mode, float(rate) if rate else 1.0)
+        except ValueError as e:
+            raise ValueError(f"{cls.ENV_VAR} 값 오류 {text!r}: {e}") from None
+
+    @classmethod
+    def from_env(cls) -> 'ValidationPolicy':
+        text = os.environ.get(cls.ENV_VAR, '')
+        return cls.parse(text) if text else cls()
+
+    def check_trial(self) -> bool:
+        """후보 시뮬레이션 원판을 검사할지"""
+        return self.mode == 'always'
+
+    def check_committed(self) -> bool:
+        """채택한 원판을 검사할지 (`always`는 시뮬레이션 때 이미 검사했다)"""
+        if self.mode == 'committed':
+            return True
+        return self.mode == 'sampled' and self._rng.random() < self.rate
+
+    def __repr__(self) -> str:
+        rate = f', rate={self.rate}' if self.mode == 'sampled' else ''
+        return f"ValidationPolicy({self.mode!r}{rate})"
+
+
 class RegionBasedPacker(PackingStrategy):
     """전략 6: 높이/너비 혼합 그룹화 패킹
 
@@ -47,52 +264,131 @@ class RegionBasedPacker(PackingStrategy):
     - 작업 편의성: 같은 높이/너비 조각들이 그룹화
     """
 
+    def __init__(
+        self,
+        stocks: list[tuple[int, int, int]],
+        kerf: int = 5,
+        allow_rotation: bool = True,
+        validation: ValidationPolicy | str | None = None,
+    ) -> None:
+        """
+        Args:
+            validation: 트리 불변식 검사 정책 (`ValidationPolicy` 또는
+                `ValidationPolicy.parse` 문자열). None이면 `WOODCUT_VALIDATE` 환경변수,
+                그것도 없으면 채택 원판만 검사.
+        """
+        super().__init__(stocks, kerf, allow_rotation)
+        if validation is None:
+            validation = ValidationPolicy.from_env()
+        elif isinstance(validation, str):
+            validation = ValidationPolicy.parse(validation)
+        self.validation = validation
+        # 탐색 카운터 / 단계별 시간 — pack() 호출마다 새로 만든다
+        self.stats = SearchStats()
+        self.profile = PackProfile()
+
     def pack(
-        self, pieces: list[tuple[int, int, int]]
+        self,
+        pieces: list[tuple[int, int, int]],
+        profile: PackProfile | None = None,
     ) -> tuple[list[dict], list[dict]]:
         """멀티 stock 패킹.
 
         매 iteration마다:
-          1. 각 남은 stock 종류에 대해 1장 시뮬레이션
+          1. 각 남은 stock 종류에 대해 1장 시뮬레이션 — 같은 치수 중복과
+             `stock_upper_bound`로 지금 최선을 못 이기는 stock은 건너뛴다
           2. (pieces_placed, utilization) 사전식 최고 stock 선택
           3. 해당 stock count 차감, 배치된 조각 제거
 
+        Args:
+            pieces: [(width, height, count), ...]
+            profile: 넘기면 단계별 시간, stock 후보별 시뮬레이션 시간, 탐색
+                카운터를 채운다. 반환값 형태는 그대로라 기존 호출자는 영향 없음.
+                넘기지 않아도 `self.profile`에 같은 정보가 남는다.
+
         Returns:
             (plates, unplaced):
-                plates: 배치된 판 리스트
+                plates: 배치된 판 리스트 — 각 판의 'stock_index'는 쓴 self.stocks 항목
                 unplaced: 재고 부족/크기 초과로 배치 못 한 조각 dict 리스트
         """
+        pack_started = perf_counter()
+        self.stats = SearchStats()
+        self.profile = prof = profile if profile is not None else PackProfile()
         all_pieces = self.expand_pieces(pieces)
         plates = []
         remaining_pieces = all_pieces[:]
         # stock count 가변 복사 (원본 self.stocks는 유지)
         stock_counts = [s[2] for s in self.stocks]
 
+        tr = TRACER
         plate_num = 1
         while remaining_pieces and any(c > 0 for c in stock_counts):
-            print(f"\n=== 원판 {plate_num}: stock 선택 시뮬레이션 ===")
+            if tr.info:
+                tr.emit(
+                    TRACE_INFO, 'pack.plate_start',
+                    f"\n=== 원판 {plate_num}: stock 선택 시뮬레이션 ===",
+                    plate=plate_num, remaining=len(remaining_pieces),
+                )
 
-            # 후보별 시뮬레이션
-            candidates = []  # (stock_index, pieces_placed, utilization, plate_dict)
+            # 후보별 시뮬레이션 — 같은 치수 stock은 남은 것 중 첫 index만 (결과가
+            # 같으므로 동점이면 작은 index를 고르는 선택과 같다). 상한이 큰 stock부터
+            # 돌려서, 상한으로도 지금 최선을 못 이기는 stock은 건너뛴다.
+            by_area = sorted(remaining_pieces, key=lambda p: p['width'] * p['height'])
+            seen_dims = set()
+            order = []  # (상한 조각 수, 상한 활용률, stock_index)
             for i, (w, h, _count) in enumerate(self.stocks):
                 if stock_counts[i] == 0:
                     continue
+                if (w, h) in seen_dims:
+                    self.stats.pruned_stocks += 1
+                    continue
+                seen_dims.add((w, h))
+                order.append((*stock_upper_bound(w, h, by_area, self.allow_rotation), i))
+            order.sort(key=lambda b: (-b[0], -b[1], b[2]))
+
+            candidates = []  # (stock_index, pieces_placed, utilization, plate_dict)
+            best_key = None  # 지금까지 최선의 (placed, util, -index) — select_best_stock 순서
+            for bound_placed, bound_util, i in order:
+                if best_key is not None and (bound_placed, bound_util, -i) < best_key:
+                    self.stats.pruned_stocks += 1
+                    continue
+                w, h, _count = self.stocks[i]
                 self.plate_width = w
                 self.plate_height = h
+                sim_started = perf_counter()
                 trial = self._pack_single_plate(remaining_pieces)
                 placed = len(trial['pieces'])
+                prof.stock_sims.append({
+                    'plate': plate_num,
+                    'stock_index': i,
+                    'width': w,
+                    'height': h,
+                    'seconds': perf_counter() - sim_started,
+                    'placed': placed,
+                })
                 total_placed_area = sum(
                     p.get('placed_w', p['width']) * p.get('placed_h', p['height'])
                     for p in trial['pieces']
                 )
                 util = total_placed_area / (w * h) if w * h else 0.0
                 candidates.append((i, placed, util, trial))
-                print(f"  후보 {i}: {w}×{h} → {placed}개, util={util:.2%}")
+                if best_key is None or (placed, util, -i) > best_key:
+                    best_key = (placed, util, -i)
+                if tr.info:
+                    tr.emit(
+                        TRACE_INFO, 'pack.stock_candidate',
+                        f"  후보 {i}: {w}×{h} → {placed}개, util={util:.2%}",
+                        plate=plate_num, stock_index=i, width=w, height=h,
+                        placed=placed, util=util,
+                    )
 
             if not candidates:
-                print("⚠️  사용 가능 stock 없음")
+                if tr.warning:
+                    tr.emit(TRACE_WARNING, 'pack.no_stock', "⚠️  사용 가능 stock 없음",
+                            plate=plate_num)
                 break
 
+            candidates.sort(key=itemgetter(0))
             scored = [(c[0], c[1], c[2]) for c in candidates]
             best_idx = select_best_stock(scored)
             best_candidate = next(c for c in candidates if c[0] == best_idx)
@@ -100,7 +396,9 @@ class RegionBasedPacker(PackingStrategy):
             best_w, best_h, _ = self.stocks[best_idx]
 
             if best_placed == 0:
-                print("⚠️  어느 stock에도 배치 실패 — 종료")
+                if tr.warning:
+                    tr.emit(TRACE_WARNING, 'pack.no_fit', "⚠️  어느 stock에도 배치 실패 — 종료",
+                            plate=plate_num, remaining=len(remaining_pieces))
                 break
 
             # 선택된 stock의 dimension으로 self 상태 복원
@@ -108,11 +406,17 @@ class RegionBasedPacker(PackingStrategy):
             self.plate_width = best_w
             self.plate_height = best_h
 
-            print(
-                f"✓ 선택: stock[{best_idx}] {best_w}×{best_h} "
-                f"({best_placed}개, {best_util:.2%})"
-            )
+            if tr.info:
+                tr.emit(
+                    TRACE_INFO, 'pack.stock_selected',
+                    f"✓ 선택: stock[{best_idx}] {best_w}×{best_h} "
+                    f"({best_placed}개, {best_util:.2%})",
+                    plate=plate_num, stock_index=best_idx, placed=best_placed, util=best_util,
+                )
 
+            if self.validation.check_committed():
+                self._check_tree(best_plate)
+            best_plate['stock_index'] = best_idx
             plates.append(best_plate)
             stock_counts[best_idx] -= 1
 
@@ -133,6 +437,8 @@ class RegionBasedPacker(PackingStrategy):
 
             plate_num += 1
 
+        prof.search = self.stats.as_dict()
+        prof.total_seconds = perf_counter() - pack_started
         return plates, remaining_pieces
 
     def _pack_single_plate(self, remaining_pieces: list[dict]) -> dict:
@@ -144,6 +450,9 @@ class RegionBasedPacker(PackingStrategy):
         Returns:
             plate dict: {'width', 'height', 'pieces', 'cuts', 'free_spaces'}
         """
+        prof = self.profile
+        t = perf_counter()
+
         # 1. 레벨 1: 정확히 같은 크기끼리 그룹화
         groups = self._group_by_exact_size(remaining_pieces)
 
@@ -152,18 +461,22 @@ class RegionBasedPacker(PackingStrategy):
 
         # 3. 회전 옵션 평면화
         all_variants = self._flatten_group_options(group_options)
+        t = prof.add('group_variants', t)
 
         # 4. 앵커 기반 백트래킹으로 최적 조합 찾기
         regions = self._allocate_anchor_backtrack(all_variants)
+        t = prof.add('anchor_backtrack', t)
 
         # occupancy 필드 초기화 (Phase A 결과물을 공간 모델로 명시화)
         # Phase B(trim 최적화)가 이 필드를 참조해 stacked 조각 위를 침범하지 않도록 한다.
         if regions:
             self._init_region_occupancy(regions)
+            t = prof.add('init_occupancy', t)
 
         # 영역 간 trim 최적화
         if regions:
             self._optimize_trim_placement(regions)
+            prof.add('trim_optimize', t)
 
         # 폴백: Phase A가 regions 생성에 실패하면 shelf packer로 안전 배치.
         # placed_w/h를 명시 설정해 trimming cut 경로를 타지 않도록 한다 (.solution/007)
@@ -212,7 +525,7 @@ class RegionBasedPacker(PackingStrategy):
                 break
             boundary = cursor
             region_node, cursor = split_h(boundary, cut_y=cut_y, kerf=self.kerf)
-            boundary.meta['type'] = (
+            boundary.tag = (
                 'scrap_boundary' if regions[i + 1]['type'] == 'scrap' else 'region_boundary'
             )
             region_nodes[i] = region_node
@@ -224,14 +537,17 @@ class RegionBasedPacker(PackingStrategy):
                 continue
             if regions[i]['type'] == 'scrap':
                 rn.kind = 'scrap'
-            rn.meta['region_id'] = f'R{i+1}'
+            rn.region_id = f'R{i+1}'
 
         # --- region별 배치 + 트리 흡수 ---
         for i, region in enumerate(regions):
             region['id'] = f'R{i+1}'
 
+        prof = self.profile
         for i, region in enumerate(regions):
+            t = perf_counter()
             placed = self._pack_multi_group_region(region)
+            t = prof.add('multi_group_region', t)
             if placed:
                 plate['pieces'].extend(placed)
 
@@ -240,7 +556,9 @@ class RegionBasedPacker(PackingStrategy):
             # 빈 region(scrap 또는 placed 없음)은 건너뛴다 — leaf 그대로.
             region_node = region_nodes[i] if i < len(region_nodes) else None
             if region_node is not None and placed:
-                if not self._build_region_subtree(region_node, placed, region):
+                absorbed = self._build_region_subtree(region_node, placed, region)
+                prof.add('region_subtree', t)
+                if not absorbed:
                     raise AssertionError(
                         f"region {region['id']}: "
                         f"_build_region_subtree failed — complex layout not absorbed by tree"
@@ -248,15 +566,9 @@ class RegionBasedPacker(PackingStrategy):
 
         # tree가 전위 순회 순서로 cut을 emit하므로 priority 기반 sort는 불필요.
         # 모든 cut은 GNode 트리에서 직접 유도 — start/end/order가 노드 직사각형 자동.
+        t = perf_counter()
         cuts = emit_cuts(plate_root)
-
-        # 불변식 assertion (.solution/011 11-10): tree 구조 자체 체크.
-        if __debug__:
-            errs = validate_guillotine(plate_root, kerf=self.kerf)
-            if errs:
-                raise AssertionError(
-                    f"Guillotine tree invariant violated: {errs[:3]}"
-                )
+        prof.add('emit_cuts', t)
 
         for idx, cut in enumerate(cuts):
             cut['order'] = idx + 1
@@ -267,8 +579,29 @@ class RegionBasedPacker(PackingStrategy):
                 cut['region_h'] = self.plate_height
         plate['cuts'] = cuts
         plate['_tree_root'] = plate_root
+        if self.validation.check_trial():
+            self._check_tree(plate)
         return plate
 
+    def _check_tree(self, plate: dict) -> None:
+        """원판 트리 불변식 검사 (.solution/011 11-10) — 시간은 stats/profile에 기록
+
+        Raises:
+            AssertionError: 트리가 guillotine 양분 불변식을 어김
+        """
+        root = plate.get('_tree_root')
+        if root is None:
+            return
+        t = perf_counter()
+        errs = validate_guillotine(root, kerf=self.kerf)
+        self.stats.validated_plates += 1
+        self.stats.validate_seconds += perf_counter() - t
+        self.profile.add('validate_guillotine', t)
+        if errs:
+            raise AssertionError(
+                f"Guillotine tree invariant violated: {errs[:3]}"
+            )
+
     def _pack_fallback_shelf(self, pieces: list[dict]) -> dict:
         """Phase A가 regions를 못 만들 때 쓰는 안전망 (NFDH shelf 배치).
 
@@ -277,6 +610,8 @@ class RegionBasedPacker(PackingStrategy):
         버그가 있었다 (.solution/007). 여기서는 각 조각을 원본 크기 그대로 두고
         `placed_w/h`를 명시 설정해 trim 경로를 차단한다.
         """
+        self.stats.fallback_shelf += 1
+        started = perf_counter()
         plate = {
             'width': self.plate_width,
             'height': self.plate_height,
@@ -358,6 +693,7 @@ class RegionBasedPacker(PackingStrategy):
             plate['pieces'].extend(shelf['pieces'])
 
         self._emit_fallback_cuts(plate, shelves)
+        self.profile.add('fallback_shelf', started)
         return plate
 
     def _fallback_orientations(self, w: int, h: int):
@@ -394,7 +730,7 @@ class RegionBasedPacker(PackingStrategy):
                 # 수행한 객체 자체 — split 후에도 같은 객체라 meta 태그 가능.
                 boundary_node = cursor
                 shelf_node, cursor = split_h(boundary_node, cut_y=shelf_top, kerf=self.kerf)
-                boundary_node.meta['type'] = 'shelf_boundary'
+                boundary_node.tag = 'shelf_boundary'
             else:
                 # shelf가 cursor 끝에 딱 맞음 — 상단 분할 불필요.
                 shelf_node = cursor
@@ -416,7 +752,7 @@ class RegionBasedPacker(PackingStrategy):
                     break
                 column_node = inner
                 piece_leaf, rest = split_v(column_node, cut_x=right_edge, kerf=self.kerf)
-                column_node.meta['type'] = 'shelf_column'
+                column_node.tag = 'shelf_column'
                 piece_leaf.piece = piece
                 piece_leaf.kind = 'piece'
                 inner = rest
@@ -584,7 +920,10 @@ class RegionBasedPacker(PackingStrategy):
                         'area': w * h * k,
                     })
 
-        # 중복 제거 (같은 (original_size, count, rotated, stacked)는 하나만 유지)
+        return self._dedupe_variants(variants)
+
+    def _dedupe_variants(self, variants: list[dict]) -> list[dict]:
+        """중복 제거 (같은 (original_size, count, rotated, stacked)는 처음 것만 유지)"""
         seen: set[tuple] = set()
         deduped: list[dict] = []
         for v in variants:
@@ -613,7 +952,7 @@ class RegionBasedPacker(PackingStrategy):
             k = k // 2
         return sorted(ks, reverse=True)
 
-    def _build_region_with_anchor(self, anchor, all_unused, remaining_counts):
+    def _build_region_with_anchor(self, anchor, all_unused, remaining_counts, table=None):
         """앵커를 기준으로 영역에 호환 그룹들 추가
 
         .solution/008: `already_used: set` → `remaining_counts: dict` 로 전환.
@@ -624,6 +963,8 @@ class RegionBasedPacker(PackingStrategy):
             anchor: 앵커 그룹 변형 (max_height 결정)
             all_unused: 소비 가능한(remaining 충분한) 모든 그룹 변형
             remaining_counts: dict[original_size, int] — 각 원본 크기의 남은 count
+            table: 전체 variant의 scoring.VariantTable (선택) — 있으면 호환 필터,
+                정렬, 그리디 선택을 table이 한다. all_unused는 그 부분집합이어야 한다.
 
         Returns:
             (groups_list, consumed)
@@ -644,6 +985,37 @@ class RegionBasedPacker(PackingStrategy):
         current_width = anchor['total_width']
 
         # 호환 가능한 그룹 찾기
+        if table is not None:
+            # 그리디가 실제로 추가할 variant만 돌아온다 — 아래 루프는 그대로 통과
+            compatible = table.greedy_fill(
+                remaining_counts, anchor['original_size'], max_height,
+                self.plate_width - current_width - self.kerf, self.kerf,
+            )
+        else:
+            compatible = self._compatible_variants(
+                all_unused, remaining_counts, used_sizes, max_height, current_width
+            )
+
+        # 그리디하게 추가
+        for v in compatible:
+            if v['original_size'] in used_sizes:
+                continue
+            needed_width = self.kerf + v['total_width']
+            if current_width + needed_width <= self.plate_width:
+                groups.append({
+                    'original_size': v['original_size'],
+                    'rotated': v['rotated'],
+                    'count': v['count'],
+                    'stacked': v.get('stacked', False)
+                })
+                used_sizes.add(v['original_size'])
+                consumed[v['original_size']] = v['count']
+                current_width += needed_width
+
+        return groups, consumed
+
+    def _compatible_variants(self, all_unused, remaining_counts, used_sizes, max_height, current_width):
+        """앵커 region에 들어갈 수 있는 variant를 추가 우선순위 순으로 (순수 파이썬 경로)"""
         compatible = []
         for v in all_unused:
             # 같은 region 내 동일 original_size 재사용 금지 (앵커 포함)
@@ -667,24 +1039,7 @@ class RegionBasedPacker(PackingStrategy):
         compatible.sort(
             key=lambda v: (abs(max_height - v['height']), -v['count'], -v['area'])
         )
-
-        # 그리디하게 추가
-        for v in compatible:
-            if v['original_size'] in used_sizes:
-                continue
-            needed_width = self.kerf + v['total_width']
-            if current_width + needed_width <= self.plate_width:
-                groups.append({
-                    'original_size': v['original_size'],
-                    'rotated': v['rotated'],
-                    'count': v['count'],
-                    'stacked': v.get('stacked', False)
-                })
-                used_sizes.add(v['original_size'])
-                consumed[v['original_size']] = v['count']
-                current_width += needed_width
-
-        return groups, consumed
+        return compatible
 
     def _allocate_anchor_backtrack(self, all_variants):
         """앵커 그룹 기반 백트래킹으로 최적 영역 배치 찾기
@@ -709,11 +1064,23 @@ class RegionBasedPacker(PackingStrategy):
 
         total_groups = len(initial_remaining)
         total_pieces = sum(initial_remaining.values())
+        # variant가 많으면 호환 필터를 numpy 열 연산으로 (없으면 None → 파이썬 경로)
+        table = variant_table(all_variants, list(initial_remaining))
+
+        tr = TRACER
+        if tr.debug:
+            tr.emit(
+                TRACE_DEBUG, 'anchor.start',
+                f"\n[앵커 백트래킹] 총 {total_groups}개 그룹, "
+                f"{total_pieces}개 조각, {len(all_variants)}개 변형 옵션",
+                groups=total_groups, pieces=total_pieces, variants=len(all_variants),
+            )
 
-        print(
-            f"\n[앵커 백트래킹] 총 {total_groups}개 그룹, "
-            f"{total_pieces}개 조각, {len(all_variants)}개 변형 옵션"
-        )
+        stats = self.stats
+        # 부분해 memo: 결과는 (remaining, y_offset)에만 의존한다. 앵커 순서만 다른
+        # 경로(A→B, B→A)가 같은 상태에 도달하므로 재탐색을 건너뛴다.
+        # remaining의 키 순서는 initial_remaining과 같아 values()만으로 키가 된다.
+        memo: dict[tuple, tuple[list, int]] = {}
 
         def backtrack(remaining: dict, y_offset: int):
             """재귀적 백트래킹
@@ -725,6 +1092,18 @@ class RegionBasedPacker(PackingStrategy):
             Returns:
                 (best_regions, best_count)
             """
+            key = (y_offset, tuple(remaining.values()))
+            cached = memo.get(key)
+            if cached is not None:
+                stats.cache_hits += 1
+                return cached
+            stats.backtrack_nodes += 1
+            result = expand(remaining, y_offset)
+            memo[key] = result
+            return result
+
+        def expand(remaining: dict, y_offset: int):
+            """backtrack의 memo 미스 시 실제 전개"""
             # 종료 조건: 모든 조각 배치 완료
             if not any(c > 0 for c in remaining.values()):
                 return [], 0
@@ -751,10 +1130,12 @@ class RegionBasedPacker(PackingStrategy):
                 # 앵커가 판재 높이를 초과하면 스킵
                 region_height = anchor['height'] + self.kerf
                 if y_offset + region_height > self.plate_height:
+                    stats.pruned_branches += 1
                     continue
 
                 # 앵커가 판재 너비를 초과하면 스킵
                 if anchor['total_width'] > self.plate_width:
+                    stats.pruned_branches += 1
                     continue
 
                 # 이 앵커로 영역 생성 + 호환 그룹 추가
@@ -762,6 +1143,7 @@ class RegionBasedPacker(PackingStrategy):
                     anchor,
                     unused_variants,
                     remaining,
+                    table,
                 )
 
                 if not region_groups:
@@ -815,9 +1197,19 @@ class RegionBasedPacker(PackingStrategy):
                     'rows': [{'groups': [], 'height': 0}]  # ★ rows 구조 (빈 행)
                 }
                 regions.append(scrap_region)
-                print(f"[자투리 영역 추가] y={scrap_region['y']}, height={remaining_height}mm")
+                if tr.debug:
+                    tr.emit(
+                        TRACE_DEBUG, 'anchor.scrap_region',
+                        f"[자투리 영역 추가] y={scrap_region['y']}, height={remaining_height}mm",
+                        y=scrap_region['y'], height=remaining_height,
+                    )
 
-        print(f"[앵커 백트래킹 완료] {count}개 조각 배치, {len(regions)}개 영역")
+        if tr.debug:
+            tr.emit(
+                TRACE_DEBUG, 'anchor.done',
+                f"[앵커 백트래킹 완료] {count}개 조각 배치, {len(regions)}개 영역",
+                placed=count, regions=len(regions),
+            )
 
         return regions
 
@@ -857,67 +1249,44 @@ class RegionBasedPacker(PackingStrategy):
         return True
 
     def _build_recursive(self, node: GNode, pieces: list[dict]) -> bool:
-        """node 영역에 pieces를 Guillotine tree로 재귀 분해."""
-        kerf = self.kerf
-
-        if not pieces:
-            node.kind = 'scrap'
-            return True
+        """node 영역에 pieces를 Guillotine tree로 분해 (명시적 스택).
 
-        if len(pieces) == 1:
-            return self._attach_single_piece(node, pieces[0])
-
-        # V split 후보: pieces 의 x_end 값
-        v_candidates = sorted({
-            p['x'] + p.get('placed_w', p['width']) for p in pieces
-        })
-        for cut_x in v_candidates:
-            if not (node.x < cut_x < node.x + node.w):
-                continue
-            left = [
-                p for p in pieces
-                if p['x'] + p.get('placed_w', p['width']) <= cut_x
-            ]
-            right = [p for p in pieces if p['x'] >= cut_x + kerf]
-            if len(left) + len(right) != len(pieces):
-                continue
-            if not left or not right:
+        노드마다 V split을 먼저, 없으면 H split을 찾는다 — 후보 중 가장 작은
+        좌표의 컷을 택하고, 한 번 자른 뒤에는 되돌리지 않는다(하위에서 실패하면
+        전체 실패). 재귀 대신 스택을 써서 조각이 수백 개인 region도 파이썬
+        재귀 한도와 무관하다.
+        """
+        kerf = self.kerf
+        stack = [(node, pieces)]
+        while stack:
+            node, pieces = stack.pop()
+            if not pieces:
+                node.kind = 'scrap'
                 continue
-            # 오른쪽 첫 piece의 x가 cut_x + kerf와 정확히 일치해야 함
-            if min(p['x'] for p in right) != cut_x + kerf:
+            if len(pieces) == 1:
+                if not self._attach_single_piece(node, pieces[0]):
+                    return False
                 continue
-            left_node, right_node = split_v(node, cut_x=cut_x, kerf=kerf)
-            if (self._build_recursive(left_node, left)
-                    and self._build_recursive(right_node, right)):
-                return True
-            return False
 
-        # H split 후보: pieces 의 y_end 값
-        h_candidates = sorted({
-            p['y'] + p.get('placed_h', p['height']) for p in pieces
-        })
-        for cut_y in h_candidates:
-            if not (node.y < cut_y < node.y + node.h):
-                continue
-            top = [
-                p for p in pieces
-                if p['y'] + p.get('placed_h', p['height']) <= cut_y
-            ]
-            bot = [p for p in pieces if p['y'] >= cut_y + kerf]
-            if len(top) + len(bot) != len(pieces):
-                continue
-            if not top or not bot:
+            split = _find_split(pieces, 'x', 'placed_w', 'width', node.x, node.x + node.w, kerf)
+            if split is not None:
+                cut_x, left, right = split
+                left_node, right_node = split_v(node, cut_x=cut_x, kerf=kerf)
+                stack.append((right_node, right))
+                stack.append((left_node, left))
                 continue
-            if min(p['y'] for p in bot) != cut_y + kerf:
+
+            split = _find_split(pieces, 'y', 'placed_h', 'height', node.y, node.y + node.h, kerf)
+            if split is not None:
+                cut_y, top, bot = split
+                top_node, bot_node = split_h(node, cut_y=cut_y, kerf=kerf)
+                stack.append((bot_node, bot))
+                stack.append((top_node, top))
                 continue
-            top_node, bot_node = split_h(node, cut_y=cut_y, kerf=kerf)
-            if (self._build_recursive(top_node, top)
-                    and self._build_recursive(bot_node, bot)):
-                return True
-            return False
 
-        # 어떤 guillotine split으로도 분리 불가 (겹침/NFDH-incompat)
-        return False
+            # 어떤 guillotine split으로도 분리 불가 (겹침/NFDH-incompat)
+            return False
+        return True
 
     def _attach_single_piece(self, node: GNode, piece: dict) -> bool:
         """node 영역에 piece 하나만 있을 때 주위 scrap을 V/H로 분리하고 leaf 부착.
@@ -939,7 +1308,7 @@ class RegionBasedPacker(PackingStrategy):
         if right_gap > kerf:
             col, right_scrap = split_v(cur, cut_x=piece['x'] + pw, kerf=kerf)
             right_scrap.kind = 'scrap'
-            right_scrap.meta['type'] = 'right_trim'
+            right_scrap.tag = 'right_trim'
             cur = col
         elif right_gap < -kerf:
             return False
@@ -949,7 +1318,7 @@ class RegionBasedPacker(PackingStrategy):
         if top_gap > kerf:
             piece_node, top_scrap = split_h(cur, cut_y=piece['y'] + ph, kerf=kerf)
             top_scrap.kind = 'scrap'
-            top_scrap.meta['type'] = 'column_top_trim'
+            top_scrap.tag = 'column_top_trim'
             cur = piece_node
         elif top_gap < -kerf:
             return False
@@ -959,17 +1328,20 @@ class RegionBasedPacker(PackingStrategy):
         return True
 
     def _reset_node_recursive(self, node: GNode) -> None:
-        """node와 그 서브트리를 leaf 상태로 복원 (빌드 실패 rollback)."""
-        if node.first is not None:
-            self._reset_node_recursive(node.first)
-        if node.second is not None:
-            self._reset_node_recursive(node.second)
-        node.cut_dir = None
-        node.cut_pos = None
-        node.first = None
-        node.second = None
-        node.piece = None
-        # kind/meta는 region_node 원래 세팅(scrap 힌트 등)을 지우지 않도록 보존
+        """node와 그 서브트리를 leaf 상태로 복원 (빌드 실패 rollback, 명시적 스택)."""
+        stack = [node]
+        while stack:
+            cur = stack.pop()
+            if cur.first is not None:
+                stack.append(cur.first)
+            if cur.second is not None:
+                stack.append(cur.second)
+            cur.cut_dir = None
+            cur.cut_pos = None
+            cur.first = None
+            cur.second = None
+            cur.piece = None
+        # kind/tag는 region_node 원래 세팅(scrap 힌트 등)을 지우지 않도록 보존
         # — 단 이 메서드는 region_node 자체가 아니라 하위 노드에만 쓰이므로 안전
 
     def _pack_multi_group_region(self, region: dict) -> list[dict] | None:
@@ -992,7 +1364,13 @@ class RegionBasedPacker(PackingStrategy):
         region_y = region['y']
         max_height = region['max_height']
 
-        print(f"\n[영역 배치] {region['type']}, y={region_y}, max_height={max_height}")
+        tr = TRACER
+        if tr.debug:
+            tr.emit(
+                TRACE_DEBUG, 'region.start',
+                f"\n[영역 배치] {region['type']}, y={region_y}, max_height={max_height}",
+                region=region.get('id'), type=region['type'], y=region_y, max_height=max_height,
+            )
 
         # scrap region은 배치 없음 — plate skeleton이 경계 H cut을 이미 emit함
         if region['type'] == 'scrap':
@@ -1012,11 +1390,15 @@ class RegionBasedPacker(PackingStrategy):
                 piece_w = h if rotated else w
                 piece_h = w if rotated else h
 
-                mode_str = "세로" if stacked else "가로"
-                print(
-                    f"  [행 {row_idx+1}] 그룹 {w}×{h} "
-                    f"(회전={rotated}, {mode_str}배치): {count}개 → y={current_y}"
-                )
+                if tr.debug:
+                    mode_str = "세로" if stacked else "가로"
+                    tr.emit(
+                        TRACE_DEBUG, 'region.group',
+                        f"  [행 {row_idx+1}] 그룹 {w}×{h} "
+                        f"(회전={rotated}, {mode_str}배치): {count}개 → y={current_y}",
+                        row=row_idx + 1, size=(w, h), rotated=rotated, stacked=stacked,
+                        count=count, y=current_y,
+                    )
 
                 group_start_x = current_x  # trim_rows 기준점
 
@@ -1024,10 +1406,13 @@ class RegionBasedPacker(PackingStrategy):
                     # 세로 배치: 같은 x에 연속 y로 쌓음
                     for i in range(count):
                         if current_x + piece_w > region['x'] + region['width']:
-                            print(
-                                f"    ⚠️  공간 부족: x={current_x}, piece_w={piece_w}, "
-                                f"region_w={region['width']}"
-                            )
+                            if tr.warning:
+                                tr.emit(
+                                    TRACE_WARNING, 'region.overflow',
+                                    f"    ⚠️  공간 부족: x={current_x}, piece_w={piece_w}, "
+                                    f"region_w={region['width']}",
+                                    x=current_x, piece_w=piece_w, region_w=region['width'],
+                                )
                             return None
                         piece_y = current_y + i * (piece_h + self.kerf)
                         placed.append({
@@ -1042,10 +1427,13 @@ class RegionBasedPacker(PackingStrategy):
                     # 가로 배치: 같은 y에 연속 x로 나열
                     for _ in range(count):
                         if current_x + piece_w > region['x'] + region['width']:
-                            print(
-                                f"    ⚠️  공간 부족: x={current_x}, piece_w={piece_w}, "
-                                f"region_w={region['width']}"
-                            )
+                            if tr.warning:
+                                tr.emit(
+                                    TRACE_WARNING, 'region.overflow',
+                                    f"    ⚠️  공간 부족: x={current_x}, piece_w={piece_w}, "
+                                    f"region_w={region['width']}",
+                                    x=current_x, piece_w=piece_w, region_w=region['width'],
+                                )
                             return None
                         placed.append({
                             'width': w, 'height': h,
@@ -1078,7 +1466,12 @@ class RegionBasedPacker(PackingStrategy):
 
             current_y += row['height']
 
-        print(f"  → {len(placed)}개 조각 배치 성공 ({len(region['rows'])}개 행)")
+        if tr.debug:
+            tr.emit(
+                TRACE_DEBUG, 'region.done',
+                f"  → {len(placed)}개 조각 배치 성공 ({len(region['rows'])}개 행)",
+                region=region.get('id'), placed=len(placed), rows=len(region['rows']),
+            )
 
         # placed_w/h 설정 (회전 반영된 실제 크기 — 후속 subtree 빌드가 소비)
         for piece in placed:
@@ -1108,7 +1501,10 @@ class RegionBasedPacker(PackingStrategy):
           - 행 아래 여분(일반적으로 0)
 
         호출 시점: Phase A 직후, Phase B(`_optimize_trim_placement`) 직전.
-        이 단계는 필드만 추가하고 기존 동작에는 영향 없다(아직 읽는 패스 없음).
+        이 단계는 필드만 추가하고 기존 동작에는 영향 없다.
+
+        점유 Rect가 많으면 `occupancy`에 OccupancyGrid(압축 좌표 래스터)도
+        붙인다 — 격자는 첫 질의 때 만들어지고, numpy가 없거나 Rect가 적으면 None.
         """
         for region in regions:
             occupied: list[Rect] = []
@@ -1191,6 +1587,7 @@ class RegionBasedPacker(PackingStrategy):
 
             region['occupied'] = occupied
             region['free_rects'] = free_rects
+            region['occupancy'] = occupancy_grid(region['width'], region['height'], occupied)
 
     def _optimize_trim_placement(self, regions: list[dict]) -> None:
         """이후 영역 그룹을 이전 영역 trim 공간으로 재배치 (최적화)
@@ -1202,6 +1599,7 @@ class RegionBasedPacker(PackingStrategy):
         Args:
             regions: _allocate_anchor_backtrack()의 결과 (in-place 수정)
         """
+        pool = TrimCandidatePool(regions)
         for i, region in enumerate(regions):
             if region.get('type') == 'scrap':
                 continue
@@ -1264,23 +1662,25 @@ class RegionBasedPacker(PackingStrategy):
                         scan_x += (rpiece_w + self.kerf) * rg['count']
                 trim_width_available = trim_x_end - group_start_x
 
-                # 후보 수집: 이후 region의 잔여 그룹을 평탄화
-                candidates = self._collect_trim_candidates(regions, i + 1)
+                # 후보: 이후 region의 잔여 그룹 중 strip에 들어가는 것
+                candidates = pool.query(i, trim_width_available, trim_height)
                 if not candidates:
                     continue
 
                 # Shelf 기반 백트래킹: greedy FFDH lower bound + DFS with pruning.
                 # shelf 동질성(같은 height만 병합)을 강제해 cut 생성은 무변경.
+                t = perf_counter()
                 shelves = self._pack_strip_shelves(
                     trim_width_available, trim_height, candidates, self.kerf,
                 )
+                self.profile.add('strip_shelves', t)
                 if not shelves:
                     continue
 
                 # trim_rows 엔트리 변환 + 후보 count 감소 + 점유 방어 assert
                 self._apply_shelf_result(
                     group, shelves, candidates,
-                    piece_h, region, group_start_x, i, regions,
+                    piece_h, region, group_start_x, i, regions, pool,
                 )
 
         # 연속된 scrap 영역 병합 (불필요한 경계 절단선 제거)
@@ -1292,37 +1692,6 @@ class RegionBasedPacker(PackingStrategy):
             else:
                 i += 1
 
-    def _collect_trim_candidates(self, regions: list[dict], start_idx: int) -> list[dict]:
-        """regions[start_idx..]의 잔여 그룹을 trim 후보로 평탄화.
-
-        각 후보는 {region_idx, group_ref, original_size, rotated, piece_w, piece_h,
-        count}. group_ref 는 source region의 group dict를 그대로 참조하므로
-        `_apply_shelf_result` 에서 count를 직접 감소시킬 수 있다.
-        """
-        candidates: list[dict] = []
-        for ridx in range(start_idx, len(regions)):
-            r = regions[ridx]
-            if r.get('type') == 'scrap':
-                continue
-            rows = r.get('rows') or []
-            if not rows:
-                continue
-            for g in rows[0]['groups']:
-                if g.get('count', 0) <= 0:
-                    continue
-                ow, oh = g['original_size']
-                rot = g['rotated']
-                candidates.append({
-                    'region_idx': ridx,
-                    'group_ref': g,
-                    'original_size': (ow, oh),
-                    'rotated': rot,
-                    'piece_w': oh if rot else ow,
-                    'piece_h': ow if rot else oh,
-                    'count': g['count'],
-                })
-        return candidates
-
     def _pack_strip_shelves(
         self,
         strip_w: int,
@@ -1383,8 +1752,11 @@ class RegionBasedPacker(PackingStrategy):
         ]
 
         # 2) DFS 백트래킹
+        stats = self.stats
+
         def dfs(i: int, shelves: list[dict], current_area: int) -> None:
             nonlocal best_area, best_count, best_snapshot
+            stats.shelf_nodes += 1
 
             count_so_far = sum(len(s['pieces']) for s in shelves)
             if current_area > best_area or (
@@ -1402,6 +1774,7 @@ class RegionBasedPacker(PackingStrategy):
 
             # 가지치기: 지금까지 + 잔여 전체 면적도 best에 못 미치면 컷
             if current_area + suffix_area[i] < best_area:
+                stats.pruned_branches += 1
                 return
 
             u_idx = units[i]
@@ -1499,18 +1872,21 @@ class RegionBasedPacker(PackingStrategy):
         group_start_x: int,
         region_idx: int,
         regions: list[dict],
+        pool: TrimCandidatePool,
     ) -> None:
         """Shelf 결과를 anchor_group.trim_rows + 후보 count 감소 + 방어 assert 로 반영.
 
         - 각 shelf → 하나의 trim_rows 엔트리 (y_offset, height, groups)
         - shelf 내 동일 cand_idx 연속은 하나의 trim_group 으로 병합
-        - 후보 candidates[u_idx]['group_ref']['count'] -= 배치된 수
+        - pool.consume(후보) — 후보와 group_ref의 count를 배치된 수만큼 제자리 감소
         - 각 배치 직전 region['occupied']와 Rect 교차 검사 — 겹침 시 AssertionError
+          (region['occupancy'] 격자가 있으면 질의 한 번, 겹칠 때만 Rect를 찾아 보고)
         - 완료 후 count=0 이 된 그룹을 source region row에서 제거,
           row가 비면 region을 scrap 전환
         """
         kerf = self.kerf
         occupied_rects = region.get('occupied', [])
+        grid = region.get('occupancy')
 
         # trim_rows 엔트리 생성 + 방어 검사
         for shelf in shelves:
@@ -1522,7 +1898,11 @@ class RegionBasedPacker(PackingStrategy):
             for (u_idx, pw, ph) in shelf['pieces']:
                 cand = candidates[u_idx]
                 candidate_rect = Rect(cursor_x_local, y_local, pw, ph)
-                for occ in occupied_rects:
+                if grid is not None and grid.is_free(cursor_x_local, y_local, pw, ph):
+                    hits = ()
+                else:
+                    hits = occupied_rects
+                for occ in hits:
                     if intersects(candidate_rect, occ):
                         raise AssertionError(
                             f"trim 배치가 점유 공간과 겹침: "
@@ -1549,22 +1929,23 @@ class RegionBasedPacker(PackingStrategy):
                 'groups': trim_groups,
                 'height': shelf['height'],
             })
-            moved_sig = ', '.join(
-                f"{tg['original_size'][0]}×{tg['original_size'][1]}×{tg['count']}"
-                for tg in trim_groups
-            )
-            print(
-                f"  [trim 최적화] shelf y={shelf['y']} h={shelf['height']}: {moved_sig} "
-                f"→ R{region_idx+1}"
-            )
+            if TRACER.debug:
+                moved_sig = ', '.join(
+                    f"{tg['original_size'][0]}×{tg['original_size'][1]}×{tg['count']}"
+                    for tg in trim_groups
+                )
+                TRACER.emit(
+                    TRACE_DEBUG, 'trim.move',
+                    f"  [trim 최적화] shelf y={shelf['y']} h={shelf['height']}: {moved_sig} "
+                    f"→ R{region_idx+1}",
+                    region=f"R{region_idx+1}", shelf_y=shelf['y'], shelf_h=shelf['height'],
+                    groups=[(tg['original_size'], tg['count']) for tg in trim_groups],
+                )
 
-        # 후보 count 감소 (group_ref 직접 수정)
+        # 후보 count 감소 (풀 후보 + group_ref 제자리 수정)
         for shelf in shelves:
             for (u_idx, _pw, _ph) in shelf['pieces']:
-                g = candidates[u_idx]['group_ref']
-                g['count'] -= 1
-                if g['count'] < 0:
-                    raise AssertionError(f"후보 count 음수: {g}")
+                pool.consume(candidates[u_idx])
 
         # count=0 그룹 제거 + 빈 row → scrap 전환
         touched_regions = {candidates[u_idx]['region_idx']
@@ -1971,13 +2352,41 @@ class RegionBasedPacker(PackingStrategy):
 
         num_groups = len(all_groups_dict)  # 총 그룹 개수
 
+        # 그룹 1개가 차지하는 최소 면적 — 영역은 조각마다 (w+kerf)×(h+kerf) 이상을 쓴다
+        kerf = self.kerf
+        unit_area = {size: (size[0] + kerf) * (size[1] + kerf) for size in all_groups_dict}
+        by_density = sorted(all_groups_dict, key=unit_area.__getitem__)
+
+        def piece_bound(sizes, free_area):
+            """sizes 그룹으로 free_area 안에 더 놓을 수 있는 조각 수 상한 (분할 배낭)"""
+            bound = 0
+            for size in by_density:
+                if size not in sizes:
+                    continue
+                need = all_groups_dict[size] * unit_area[size]
+                if need <= free_area:
+                    bound += all_groups_dict[size]
+                    free_area -= need
+                else:
+                    bound += free_area // unit_area[size]
+                    break
+            return bound
+
+        # 자유 공간은 영역을 놓을 때마다 증분 갱신, 되돌아갈 때 undo
+        space = MaxRects(self.plate_width, self.plate_height)
+        # 같은 영역 집합에 다른 순서로 도달한 상태는 결과가 같다 — 집합 → (이후 추가 영역, 조각 수)
+        memo: dict[frozenset, tuple[list, int]] = {}
+        plate_area = self.plate_width * self.plate_height
+
         # 4. 백트래킹을 위한 재귀 함수
-        def backtrack(regions_so_far, used_original_sizes):
+        def backtrack(regions_so_far, used_original_sizes, floor=-1):
             """재귀적 백트래킹으로 영역 할당
 
             Args:
                 regions_so_far: 지금까지 생성된 영역들
                 used_original_sizes: 이미 사용된 원본 크기들 (중복 배치 방지)
+                floor: 호출측의 현재 최선 조각 수. 이 상태에서 그보다 많이 놓을 수
+                    없음이 확실하면 탐색 없이 돌아간다 (호출측은 더 클 때만 채택)
 
             Returns:
                 (최선의 영역 리스트, 배치 가능한 조각 수)
@@ -1987,10 +2396,22 @@ class RegionBasedPacker(PackingStrategy):
                 piece_count = sum(sum(g['count'] for g in r['groups']) for r in regions_so_far)
                 return regions_so_far, piece_count
 
+            key = frozenset(
+                (r['x'], r['y'], r['width'], r['height'], r['type'],
+                 r['groups'][0]['size'], r['groups'][0]['rotated'])
+                for r in regions_so_far
+            )
+            hit = memo.get(key)
+            if hit is not None:
+                self.stats.cache_hits += 1
+                return regions_so_far + hit[0], hit[1]
+
             best_regions = regions_so_far
             best_count = sum(sum(g['count'] for g in r['groups']) for r in regions_so_far)
 
-            # 각 옵션을 시도
+            # 옵션별 배치 후보 — 지금 놓을 곳이 없는 그룹은 더 깊이 가도(자유 공간이
+            # 줄기만 하므로) 놓을 곳이 없다
+            candidates = []
             for option in group_options:
                 original_size = option['original_size']
 
@@ -2011,40 +2432,73 @@ class RegionBasedPacker(PackingStrategy):
 
                 # 이 클러스터를 배치할 수 있는 모든 위치 탐색
                 possible_placements = self._find_region_placements(
-                    regions_so_far, option['cluster_type'], cluster, cluster['groups']
+                    regions_so_far, option['cluster_type'], cluster, cluster['groups'],
+                    free_rects=space.free,
                 )
+                if possible_placements:
+                    candidates.append((option, possible_placements))
 
-                if not possible_placements:
-                    # 배치 불가능 - 스킵
-                    continue
+            placeable = {option['original_size'] for option, _ in candidates}
+            free_area = plate_area - sum(r['width'] * r['height'] for r in regions_so_far)
+            upper = best_count + piece_bound(placeable, free_area)
+            if upper <= floor:
+                self.stats.pruned_branches += 1
+                return best_regions, best_count
 
+            for option, possible_placements in candidates:
+                original_size = option['original_size']
                 for placement in possible_placements:
                     # 새 영역 추가
                     new_regions = regions_so_far + [placement]
                     new_used = used_original_sizes | {original_size}
+                    self.stats.backtrack_nodes += 1
 
                     # 재귀적으로 남은 옵션 배치
+                    space.place(Rect(placement['x'], placement['y'],
+                                     placement['width'], placement['height']))
                     result_regions, result_count = backtrack(
                         new_regions,
-                        new_used
+                        new_used,
+                        best_count,
                     )
+                    space.undo()
 
                     if result_count > best_count:
                         best_count = result_count
                         best_regions = result_regions
+                        if best_count == upper:
+                            break
+                if best_count == upper:
+                    # 상한 도달 — 남은 분기는 더 나을 수 없다
+                    self.stats.pruned_branches += 1
+                    break
 
+            if len(memo) < RECURSIVE_2D_MEMO_LIMIT:
+                memo[key] = (best_regions[len(regions_so_far):], best_count)
             return best_regions, best_count
 
         # 백트래킹 시작
-        print(f"\n[백트래킹 디버그] 총 {num_groups}개 그룹, {len(group_options)}개 옵션")
+        tr = TRACER
+        if tr.debug:
+            tr.emit(TRACE_DEBUG, 'recursive2d.start',
+                    f"\n[백트래킹 디버그] 총 {num_groups}개 그룹, {len(group_options)}개 옵션",
+                    groups=num_groups, options=len(group_options))
         regions, count = backtrack([], set())
-        print(f"[백트래킹 완료] {count}개 조각 배치, {len(regions)}개 영역")
+        if tr.debug:
+            tr.emit(TRACE_DEBUG, 'recursive2d.done',
+                    f"[백트래킹 완료] {count}개 조각 배치, {len(regions)}개 영역",
+                    placed=count, regions=len(regions))
 
         return regions
 
-    def _find_region_placements(self, existing_regions, region_type, cluster, unique_groups):
+    def _find_region_placements(self, existing_regions, region_type, cluster, unique_groups,
+                                free_rects=None):
         """주어진 클러스터를 배치할 수 있는 모든 위치 찾기
 
+        Args:
+            free_rects: 이미 계산된 최대 빈 직사각형 (`MaxRects.free`). None이면
+                existing_regions로부터 새로 계산
+
         Returns:
             가능한 영역 배치 리스트
         """
@@ -2052,12 +2506,7 @@ class RegionBasedPacker(PackingStrategy):
 
         placements = []
 
-        # 현재 사용 중인 공간 계산
-        if not existing_regions:
-            # 첫 영역: 전체 판 사용 가능
-            free_rects = [(0, 0, self.plate_width, self.plate_height)]
-        else:
-            # 기존 영역들로부터 자유 공간 계산
+        if free_rects is None:
             free_rects = self._calculate_free_rects(existing_regions)
 
         # 각 자유 공간에 배치 시도
@@ -2181,68 +2630,18 @@ class RegionBasedPacker(PackingStrategy):
         return placements
 
     def _calculate_free_rects(self, regions):
-        """기존 영역들로부터 남은 자유 공간(rectangles) 계산
-
-        Maximal Rectangles 알고리즘 사용
-        """
-        if not regions:
-            return [(0, 0, self.plate_width, self.plate_height)]
+        """기존 영역들로부터 남은 최대 빈 직사각형(maximal rectangles) 계산
 
-        # 모든 영역의 경계 좌표 수집
-        x_coords = {0, self.plate_width}
-        y_coords = {0, self.plate_height}
+        예전 구현은 좌표 격자 칸마다 모든 영역과 겹침을 검사(O(X·Y·R))해 빈 칸을
+        돌려줬다. 이제 `MaxRects`로 영역마다 증분 갱신한다.
 
+        Returns:
+            [(x, y, w, h), ...] — x, y 순 정렬
+        """
+        space = MaxRects(self.plate_width, self.plate_height)
         for r in regions:
-            x_coords.add(r['x'])
-            x_coords.add(r['x'] + r['width'])
-            y_coords.add(r['y'])
-            y_coords.add(r['y'] + r['height'])
-
-        x_coords = sorted(x_coords)
-        y_coords = sorted(y_coords)
-
-        # 모든 가능한 직사각형 생성
-        free_rects = []
-
-        for i in range(len(x_coords) - 1):
-            for j in range(len(y_coords) - 1):
-                x1, x2 = x_coords[i], x_coords[i + 1]
-                y1, y2 = y_coords[j], y_coords[j + 1]
-
-                # 이 직사각형이 기존 영역과 겹치는지 확인
-                is_free = True
-                for r in regions:
-                    rx1, rx2 = r['x'], r['x'] + r['width']
-                    ry1, ry2 = r['y'], r['y'] + r['height']
-
-                    # 겹침 검사
-                    if not (x2 <= rx1 or x1 >= rx2 or y2 <= ry1 or y1 >= ry2):
-                        is_free = False
-                        break
-
-                if is_free:
-                    free_rects.append((x1, y1, x2 - x1, y2 - y1))
-
-        # 최대 직사각형만 유지 (다른 직사각형에 포함되지 않는 것)
-        maximal_rects = []
-        for rect in free_rects:
-            x1, y1, w1, h1 = rect
-            is_maximal = True
-
-            for other in free_rects:
-                if rect == other:
-                    continue
-                x2, y2, w2, h2 = other
-
-                # rect가 other에 완전히 포함되면 maximal이 아님
-                if x2 <= x1 and y2 <= y1 and x2 + w2 >= x1 + w1 and y2 + h2 >= y1 + h1:
-                    is_maximal = False
-                    break
-
-            if is_maximal and w1 > 0 and h1 > 0:
-                maximal_rects.append(rect)
-
-        return maximal_rects if maximal_rects else []
+            space.place(Rect(r['x'], r['y'], r['width'], r['height']))
+        return space.free
 
     def _pack_region(self, region):
         """특정 영역 내에서 조각들 배치 (그룹 기반, 다단 배치)
@@ -2260,7 +2659,10 @@ class RegionBasedPacker(PackingStrategy):
         region_h = region['height']
 
         # 영역 크기로 제한된 자유 공간 생성
-        free_spaces = [FreeSpace(region_x, region_y, region_w, region_h)]
+        free_spaces = FreeSpaceIndex(
+            self.kerf, [FreeSpace(region_x, region_y, region_w, region_h)],
+            origin=(region_x, region_y), columns=space_columns(),
+        )
         placed = []
 
         # 그룹들을 면적순으로 정렬 (큰 그룹 우선)
@@ -2268,12 +2670,17 @@ class RegionBasedPacker(PackingStrategy):
 
         total_pieces = sum(g['count'] for g in groups_sorted)
         piece_counter = 0
+        tr = TRACER
 
         for group in groups_sorted:
             # 그룹 내 모든 조각 배치
             preferred_rotated = group['rotated']
 
-            print(f"  [그룹 배치] {group['size'][0]}×{group['size'][1]}, {group['count']}개, 회전: {preferred_rotated}")
+            if tr.debug:
+                tr.emit(TRACE_DEBUG, 'region_pack.group',
+                        f"  [그룹 배치] {group['size'][0]}×{group['size'][1]}, "
+                        f"{group['count']}개, 회전: {preferred_rotated}",
+                        size=group['size'], count=group['count'], rotated=preferred_rotated)
 
             # 그룹 내 조각들을 같은 크기이므로 격자 형태로 배치 시도
             group_pieces = group['pieces']
@@ -2288,12 +2695,20 @@ class RegionBasedPacker(PackingStrategy):
             cols_per_row = (region_w + self.kerf) // (piece_w + self.kerf)
             rows_available = (region_h + self.kerf) // (piece_h + self.kerf)
 
-            print(f"    영역 크기: {region_w}×{region_h}mm")
-            print(f"    조각 크기 (회전 적용): {piece_w}×{piece_h}mm")
-            print(f"    가능한 배치: {cols_per_row}열 × {rows_available}행 = 최대 {cols_per_row * rows_available}개")
+            if tr.debug:
+                tr.emit(TRACE_DEBUG, 'region_pack.grid',
+                        f"    영역 크기: {region_w}×{region_h}mm\n"
+                        f"    조각 크기 (회전 적용): {piece_w}×{piece_h}mm\n"
+                        f"    가능한 배치: {cols_per_row}열 × {rows_available}행 = "
+                        f"최대 {cols_per_row * rows_available}개",
+                        region=(region_w, region_h), piece=(piece_w, piece_h),
+                        cols=cols_per_row, rows=rows_available)
 
             if cols_per_row == 0 or rows_available == 0:
-                print("    ⚠️  조각이 너무 커서 영역에 배치 불가!")
+                if tr.warning:
+                    tr.emit(TRACE_WARNING, 'region_pack.too_large',
+                            "    ⚠️  조각이 너무 커서 영역에 배치 불가!",
+                            piece=(piece_w, piece_h))
                 return None
 
             # 그룹 조각들을 격자로 배치
@@ -2304,29 +2719,48 @@ class RegionBasedPacker(PackingStrategy):
 
                 # AlignedFreeSpace 방식으로 배치 시도
                 placement = self._find_placement_aligned(
-                    free_spaces, placed, piece, preferred_rotated, region_x, region_y, region_w, region_h
+                    free_spaces, piece, preferred_rotated, region_x, region_y, region_w, region_h
                 )
 
                 if placement:
                     # FreeSpace 업데이트 (L자형 분할)
                     self._apply_placement(free_spaces, placed, piece, placement)
                     pieces_placed_count += 1
-                    print(f"    조각 {piece_counter}/{total_pieces}: {piece['width']}×{piece['height']} → ({placement['x']}, {placement['y']}) {placement['width']}×{placement['height']}")
+                    if tr.debug:
+                        tr.emit(TRACE_DEBUG, 'region_pack.piece',
+                                f"    조각 {piece_counter}/{total_pieces}: "
+                                f"{piece['width']}×{piece['height']} → "
+                                f"({placement['x']}, {placement['y']}) "
+                                f"{placement['width']}×{placement['height']}",
+                                index=piece_counter, x=placement['x'], y=placement['y'],
+                                width=placement['width'], height=placement['height'])
                 else:
-                    # 배치 실패
-                    print(f"    조각 {piece_counter}/{total_pieces}: {piece['width']}×{piece['height']} → 배치 실패!")
-                    print(f"      남은 FreeSpace: {len(free_spaces)}개")
-                    for i, fs in enumerate(free_spaces[:5]):
-                        print(f"        [{i+1}] ({fs.x}, {fs.y}) {fs.width}×{fs.height}mm")
-
-                    # 그룹 깨기: 배치된 조각만으로 계속 진행
-                    print(f"    ⚠️  그룹 일부만 배치 ({pieces_placed_count}/{len(group_pieces)}개), 나머지는 다른 영역에 할당 필요")
+                    # 배치 실패 → 그룹 깨기: 배치된 조각만으로 계속 진행
+                    if tr.warning:
+                        spaces = '\n'.join(
+                            f"        [{i+1}] ({fs.x}, {fs.y}) {fs.width}×{fs.height}mm"
+                            for i, fs in enumerate(list(free_spaces)[:5])
+                        )
+                        tr.emit(TRACE_WARNING, 'region_pack.partial',
+                                f"    조각 {piece_counter}/{total_pieces}: "
+                                f"{piece['width']}×{piece['height']} → 배치 실패!\n"
+                                f"      남은 FreeSpace: {len(free_spaces)}개\n{spaces}\n"
+                                f"    ⚠️  그룹 일부만 배치 ({pieces_placed_count}/{len(group_pieces)}개), "
+                                f"나머지는 다른 영역에 할당 필요",
+                                index=piece_counter, placed=pieces_placed_count,
+                                group_size=len(group_pieces), free_spaces=len(free_spaces))
                     # 실패해도 None 반환하지 않고 계속 진행 (다음 그룹 시도)
                     break
 
-            print(f"  [그룹 완료] {pieces_placed_count}/{len(group_pieces)}개 배치 성공")
+            if tr.debug:
+                tr.emit(TRACE_DEBUG, 'region_pack.group_done',
+                        f"  [그룹 완료] {pieces_placed_count}/{len(group_pieces)}개 배치 성공",
+                        placed=pieces_placed_count, group_size=len(group_pieces))
 
-        print(f"  [영역 완료] 총 {len(placed)}/{total_pieces}개 배치")
+        if tr.debug:
+            tr.emit(TRACE_DEBUG, 'region_pack.done',
+                    f"  [영역 완료] 총 {len(placed)}/{total_pieces}개 배치",
+                    placed=len(placed), total=total_pieces)
 
         # 일부라도 배치 성공하면 반환
         return placed if placed else None
@@ -2334,189 +2768,135 @@ class RegionBasedPacker(PackingStrategy):
     def _recalculate_free_spaces(self, placed_pieces, plate_w, plate_h):
         """배치된 조각들로부터 FreeSpace 재계산 (단순화 버전)
 
+        현재 호출하는 곳이 없다 — Phase A 실패 시 안전망은 `_pack_fallback_shelf`.
+
+        분할된 공간은 예전 리스트처럼 부모 자리에 들어간다: 위치를 경로 튜플
+        (부모 경로 + 우측 0 / 상단 1)로 들고 있다가, 끝에서 그 순서대로 새
+        FreeSpaceIndex를 만들어 seq(= best_fit 동점 순서)를 리스트 순서와 맞춘다.
+
         Args:
             placed_pieces: 이미 배치된 조각 리스트
             plate_w: 판 너비
             plate_h: 판 높이
 
         Returns:
-            FreeSpace 리스트
+            FreeSpaceIndex
         """
         # 간단한 구현: 전체 판을 초기 FreeSpace로 시작
-        # 각 배치된 조각에 대해 FreeSpace를 분할
-        free_spaces = [FreeSpace(0, 0, plate_w, plate_h)]
+        # 각 배치된 조각에 대해 겹치는 FreeSpace만 분할 (x 버킷으로 후보 조회)
+        root = FreeSpace(0, 0, plate_w, plate_h)
+        free_spaces = FreeSpaceIndex(self.kerf, [root])
+        order = {id(root): (0,)}  # id(space) → 예전 리스트에서의 위치 경로
+        notes = []
 
         for piece in placed_pieces:
             x, y = piece['x'], piece['y']
             w = piece.get('placed_w', piece['height'] if piece.get('rotated') else piece['width'])
             h = piece.get('placed_h', piece['width'] if piece.get('rotated') else piece['height'])
-
-            # 기존 FreeSpace들과 겹치는 부분 처리
-            new_free_spaces = []
-            for space in free_spaces:
-                # 조각과 겹치지 않으면 유지
-                if (x >= space.x + space.width or x + w + self.kerf <= space.x or
-                    y >= space.y + space.height or y + h + self.kerf <= space.y):
-                    new_free_spaces.append(space)
-                else:
-                    # 겹치는 경우 분할 (간단한 L자형 분할)
-                    # 우측 공간
-                    if space.x + space.width > x + w + self.kerf:
-                        new_free_spaces.append(FreeSpace(
-                            x + w + self.kerf, space.y,
-                            space.x + space.width - (x + w + self.kerf), space.height
-                        ))
-                    # 상단 공간
-                    if space.y + space.height > y + h + self.kerf:
-                        new_free_spaces.append(FreeSpace(
-                            space.x, y + h + self.kerf,
-                            space.width, space.y + space.height - (y + h + self.kerf)
-                        ))
-
-            free_spaces = new_free_spaces
-
-        return free_spaces
+            x2, y2 = x + w + self.kerf, y + h + self.kerf
+
+            for space in free_spaces.overlapping(x, y, x2, y2):
+                # 겹치는 경우 분할 (간단한 L자형 분할)
+                free_spaces.remove(space)
+                path = order.pop(id(space))
+                # 우측 공간
+                if space.x + space.width > x2:
+                    right = FreeSpace(x2, space.y, space.x + space.width - x2, space.height)
+                    free_spaces.add(right)
+                    order[id(right)] = path + (0,)
+                # 상단 공간
+                if space.y + space.height > y2:
+                    top = FreeSpace(space.x, y2, space.width, space.y + space.height - y2)
+                    free_spaces.add(top)
+                    order[id(top)] = path + (1,)
+            notes.append((x, y, w, h))
+
+        result = FreeSpaceIndex(self.kerf, sorted(free_spaces, key=lambda s: order[id(s)]),
+                                origin=(0, 0))
+        for note in notes:
+            result.note_piece(*note)
+        return result
 
     def _find_best_placement_simple(self, free_spaces, placed, piece):
         """단순한 AlignedFreeSpace 배치 (전체 판 대상)
 
+        현재 호출하는 곳이 없다 (`_recalculate_free_spaces`와 짝).
+
         Args:
-            free_spaces: 사용 가능한 FreeSpace 리스트
+            free_spaces: FreeSpaceIndex
             placed: 이미 배치된 조각 리스트
             piece: 배치할 조각
 
         Returns:
-            placement dict 또는 None
+            placement dict 또는 None (낭비 최소, 동점이면 앞선 공간·비회전 우선)
         """
         w, h = piece['width'], piece['height']
 
-        candidates = []
-
-        for space in free_spaces:
-            # 비회전
-            if w + self.kerf <= space.width and h + self.kerf <= space.height:
-                waste = (space.width - w) * (space.height - h)
-                candidates.append({
-                    'space': space, 'x': space.x, 'y': space.y,
-                    'width': w, 'height': h, 'rotated': False,
-                    'waste': waste
-                })
-
-            # 회전
-            if self.allow_rotation and h + self.kerf <= space.width and w + self.kerf <= space.height:
-                waste = (space.width - h) * (space.height - w)
-                candidates.append({
-                    'space': space, 'x': space.x, 'y': space.y,
-                    'width': h, 'height': w, 'rotated': True,
-                    'waste': waste
-                })
-
-        if not candidates:
+        options = [(free_spaces.best_fit(w, h), w, h, False)]
+        if self.allow_rotation:
+            options.append((free_spaces.best_fit(h, w), h, w, True))
+        options = [o for o in options if o[0] is not None]
+        if not options:
             return None
 
-        # 낭비가 적은 순으로 정렬
-        candidates.sort(key=lambda c: c['waste'])
-        return candidates[0]
+        (_, waste, _, space), pw, ph, rotated = min(
+            options, key=lambda o: (o[0][1], o[0][2], o[3])
+        )
+        return {
+            'space': space, 'x': space.x, 'y': space.y,
+            'width': pw, 'height': ph, 'rotated': rotated,
+            'waste': waste
+        }
 
-    def _find_placement_aligned(self, free_spaces, placed, piece, preferred_rotated, rx, ry, rw, rh):
+    def _find_placement_aligned(self, free_spaces, piece, preferred_rotated, rx, ry, rw, rh):
         """AlignedFreeSpace 방식의 배치 후보 찾기
 
         Args:
+            free_spaces: FreeSpaceIndex — existing_x/existing_y 정렬 좌표 포함
             preferred_rotated: 클러스터링에서 결정된 선호 회전 상태
 
         Returns:
             placement dict 또는 None
+            (순위: rotation_bonus > alignment_score > waste > 공간 순서 > 선호 방향)
         """
         w, h = piece['width'], piece['height']
+        region = (rx, ry, rw, rh)
 
-        # 영역 경계 및 기존 조각 좌표 수집
-        existing_x = {rx}
-        existing_y = {ry}
-
-        for p in placed:
-            if rx <= p['x'] < rx + rw:
-                existing_x.add(p['x'])
-                pw = p.get('placed_w', p['height'] if p.get('rotated') else p['width'])
-                ph = p.get('placed_h', p['width'] if p.get('rotated') else p['height'])
-                existing_x.add(p['x'] + pw + self.kerf)
-                existing_y.add(p['y'])
-                existing_y.add(p['y'] + ph + self.kerf)
-
-        candidates = []
-
-        for space in free_spaces:
-            # 영역 내 공간만 고려
-            if not (rx <= space.x < rx + rw and ry <= space.y < ry + rh):
-                continue
-
-            # 선호 회전 상태 우선 시도
-            if preferred_rotated:
-                test_w, test_h = h, w
-            else:
-                test_w, test_h = w, h
-
-            # 후보 생성 (선호 방향)
-            if test_w + self.kerf <= space.width and test_h + self.kerf <= space.height:
-                alignment_score = (1 if space.x in existing_x else 0) + (1 if space.y in existing_y else 0)
-                waste = (space.width - test_w) * (space.height - test_h)
-                rotation_bonus = 100 if (preferred_rotated == (test_w == h)) else 0
-
-                candidates.append({
-                    'space': space, 'x': space.x, 'y': space.y,
-                    'width': test_w, 'height': test_h,
-                    'rotated': (test_w == h),  # w가 h와 같으면 회전됨
-                    'alignment_score': alignment_score,
-                    'waste': waste,
-                    'rotation_bonus': rotation_bonus
-                })
-
-            # 다른 회전 상태도 시도 (allow_rotation이면)
-            if self.allow_rotation:
-                alt_w, alt_h = test_h, test_w
-                if alt_w + self.kerf <= space.width and alt_h + self.kerf <= space.height:
-                    alignment_score = (1 if space.x in existing_x else 0) + (1 if space.y in existing_y else 0)
-                    waste = (space.width - alt_w) * (space.height - alt_h)
-                    rotation_bonus = 0  # 비선호 회전
-
-                    candidates.append({
-                        'space': space, 'x': space.x, 'y': space.y,
-                        'width': alt_w, 'height': alt_h,
-                        'rotated': (alt_w == h),
-                        'alignment_score': alignment_score,
-                        'waste': waste,
-                        'rotation_bonus': rotation_bonus
-                    })
-
-        if not candidates:
+        # 선호 회전 상태 우선 시도
+        if preferred_rotated:
+            test_w, test_h = h, w
+        else:
+            test_w, test_h = w, h
+
+        options = [(free_spaces.best_fit(test_w, test_h, prefer=region), test_w, test_h,
+                    100 if (preferred_rotated == (test_w == h)) else 0, 0)]
+        # 다른 회전 상태도 시도 (allow_rotation이면) — 비선호 회전은 보너스 없음
+        if self.allow_rotation:
+            options.append((free_spaces.best_fit(test_h, test_w, prefer=region), test_h, test_w, 0, 1))
+        options = [o for o in options if o[0] is not None]
+        if not options:
             return None
 
-        # 정렬: rotation_bonus > alignment_score > waste
-        candidates.sort(key=lambda c: (-c['rotation_bonus'], -c['alignment_score'], c['waste']))
-        return candidates[0]
+        (align, waste, _, space), pw, ph, bonus, _ = min(
+            options, key=lambda o: (-o[3], o[0][0], o[0][1], o[0][2], o[4])
+        )
+        return {
+            'space': space, 'x': space.x, 'y': space.y,
+            'width': pw, 'height': ph,
+            'rotated': (pw == h),  # w가 h와 같으면 회전됨
+            'alignment_score': -align,
+            'waste': waste,
+            'rotation_bonus': bonus
+        }
 
     def _apply_placement(self, free_spaces, placed, piece, placement):
-        """배치 적용 및 FreeSpace 업데이트"""
-        space = placement['space']
+        """배치 적용 및 FreeSpace 업데이트 (L자형 분할 + 정렬 좌표 갱신)"""
         x, y = placement['x'], placement['y']
-        w, h = placement['width'], placement['height']
 
         placed.append({
             **piece, 'x': x, 'y': y,
             'rotated': placement['rotated']
         })
 
-        free_spaces.remove(space)
-
-        # L자형 분할 (우측 공간 + 상단 공간)
-        if space.width > w + self.kerf:
-            free_spaces.append(FreeSpace(
-                x + w + self.kerf, y,
-                space.width - w - self.kerf, h + self.kerf
-            ))
-
-        if space.height > h + self.kerf:
-            free_spaces.append(FreeSpace(
-                x, y + h + self.kerf,
-                space.width, space.height - h - self.kerf
-            ))
+        free_spaces.split(placement['space'], x, y, placement['width'], placement['height'])
 
@@ -3,12 +3,40 @@
 RegionBasedPacker의 Fallback 전략:
 - 배치 실패 시 큰 그룹을 자동 분할하여 재시도
 - 무한 루프 방지: 분할 후에도 실패하면 즉시 중단
+- 분할 재시도는 1차 시도의 variant 캐시와 루트 가지치기 결과를 이어받는다
 """
 
 from __future__ import annotations
+from time import perf_counter
+from ..trace import TRACER, TRACE_DEBUG, TRACE_WARNING
 from .region_based import RegionBasedPacker
 
 
+class SplitAttempt:
+    """원판 1장의 시도 간 공유 상태 — 분할 재시도의 warm start
+
+    1차 백트래킹이 실패(루트 결과 ([], 0))했다면 루트의 모든 앵커가 판 높이/너비
+    초과로 가지치기된 것이다 — 앵커가 하나라도 들어가면 그 region만으로 1개
+    이상 배치된다. 분할은 그룹 count만 바꾸므로 재시도의 variant 중 그 모양
+    (높이, 전체 너비)이 이미 가지치기된 것은 다시 볼 필요가 없고, 새로 생긴
+    모양이 빈 원판에 들어갈 때만 백트래킹을 다시 돌린다.
+
+    memo 자체는 넘기지 않는다 — 부분해는 variant 집합에 의존하는데 분할 후
+    집합이 달라진다 (같은 사이즈 chunk별 k 격자).
+
+    Attributes:
+        variants: (size, count) → 그 그룹의 variant 리스트 (시도 간 재사용)
+        pruned: 실패한 시도에서 빈 원판 루트에 놓지 못한 (높이, 전체 너비) 모양
+        failed: 이전 시도가 실패했는지
+    """
+    __slots__ = ('variants', 'pruned', 'failed')
+
+    def __init__(self) -> None:
+        self.variants: dict[tuple, list[dict]] = {}
+        self.pruned: set[tuple[int, int]] = set()
+        self.failed = False
+
+
 class RegionBasedPackerWithSplit(RegionBasedPacker):
     """그룹 자동 분할을 지원하는 영역 기반 패커
 
@@ -33,55 +61,99 @@ class RegionBasedPackerWithSplit(RegionBasedPacker):
         Returns:
             plate dict: {'width', 'height', 'pieces', 'cuts', 'free_spaces'}
         """
-        print("\n=== 원판: 다중 그룹 영역 배치 시작 (분할 지원) ===")
-        print(f"남은 조각: {len(remaining_pieces)}개")
-
+        tr = TRACER
         groups = self._group_by_exact_size(remaining_pieces)
 
-        print(f"\n레벨 1: {len(groups)}개 그룹 생성")
-        for i, group in enumerate(groups):
-            print(f"  그룹 {i+1}: {group['size'][0]}×{group['size'][1]}mm, {group['count']}개 조각, 총 면적 {group['total_area']:,}mm²")
+        if tr.debug:
+            lines = [
+                f"  그룹 {i+1}: {g['size'][0]}×{g['size'][1]}mm, {g['count']}개 조각, "
+                f"총 면적 {g['total_area']:,}mm²"
+                for i, g in enumerate(groups)
+            ]
+            tr.emit(
+                TRACE_DEBUG, 'split.start',
+                "\n=== 원판: 다중 그룹 영역 배치 시작 (분할 지원) ===\n"
+                f"남은 조각: {len(remaining_pieces)}개\n"
+                f"\n레벨 1: {len(groups)}개 그룹 생성\n" + "\n".join(lines),
+                remaining=len(remaining_pieces), groups=len(groups),
+            )
 
         # 1차 시도: 분할 없이 백트래킹
-        plate = self._try_pack_groups(groups)
+        attempt = SplitAttempt()
+        plate = self._try_pack_groups(groups, attempt)
         if plate['pieces']:
             self._print_plate_summary(plate)
             return plate
 
         # 2차 시도: 그룹 분할 후 재시도
-        print("\n⚠️  배치 실패, 큰 그룹 분할 후 재시도...")
+        self.stats.split_retries += 1
         groups = self._split_oversized_groups(groups)
-        print(f"분할 후 그룹 수: {len(groups)}개")
-
-        plate = self._try_pack_groups(groups)
+        if tr.debug:
+            tr.emit(
+                TRACE_DEBUG, 'split.retry',
+                "\n⚠️  배치 실패, 큰 그룹 분할 후 재시도...\n"
+                f"분할 후 그룹 수: {len(groups)}개",
+                groups=len(groups),
+            )
+
+        plate = self._try_pack_groups(groups, attempt)
         if plate['pieces']:
             self._print_plate_summary(plate)
             return plate
 
         # 분할 후에도 실패 — 빈 plate 반환
-        print("\n❌ 오류: 원판에 조각을 배치할 수 없습니다")
-        print(f"남은 조각: {len(remaining_pieces)}개")
-        for idx, piece in enumerate(remaining_pieces[:3]):
-            print(f"  {idx+1}. {piece['width']}×{piece['height']}mm")
-        if len(remaining_pieces) > 3:
-            print(f"  ... 외 {len(remaining_pieces) - 3}개")
+        if tr.warning:
+            lines = [
+                f"  {idx+1}. {piece['width']}×{piece['height']}mm"
+                for idx, piece in enumerate(remaining_pieces[:3])
+            ]
+            if len(remaining_pieces) > 3:
+                lines.append(f"  ... 외 {len(remaining_pieces) - 3}개")
+            tr.emit(
+                TRACE_WARNING, 'split.failed',
+                "\n❌ 오류: 원판에 조각을 배치할 수 없습니다\n"
+                f"남은 조각: {len(remaining_pieces)}개\n" + "\n".join(lines),
+                remaining=len(remaining_pieces),
+            )
         return plate
 
-    def _try_pack_groups(self, groups: list[dict]) -> dict:
+    def _try_pack_groups(self, groups: list[dict], attempt: SplitAttempt | None = None) -> dict:
         """그룹 리스트로부터 plate 1장 구성 시도.
 
         백트래킹 실패 시 pieces가 비어 있는 plate dict 반환 —
         호출 측에서 `not plate['pieces']`로 실패 판정.
 
+        Args:
+            groups: 그룹 리스트
+            attempt: 같은 원판의 이전 시도 상태 (선택). 있으면 그룹별 variant를
+                재사용하고, 이전 시도가 실패했으면 새 모양의 앵커가 빈 원판에
+                들어갈 때만 백트래킹한다. 실패하면 이 시도의 결과를 기록한다.
+
         Returns:
             plate dict: {'width', 'height', 'pieces', 'cuts', 'free_spaces'}
         """
-        group_options = self._generate_group_options(groups)
-        all_variants = self._flatten_group_options(group_options)
-        regions = self._allocate_anchor_backtrack(all_variants)
+        if attempt is None:
+            attempt = SplitAttempt()
+        prof = self.profile
+        t = perf_counter()
+        all_variants = self._cached_variants(groups, attempt)
+        t = prof.add('group_variants', t)
+
+        if attempt.failed and not any(
+            self._anchor_fits_empty_plate(v) for v in all_variants
+            if (v['height'], v['total_width']) not in attempt.pruned
+        ):
+            # 분할이 새로 연 가지가 없다 — 결과는 이전 시도와 같은 실패
+            regions = []
+        else:
+            regions = self._allocate_anchor_backtrack(all_variants)
+            t = prof.add('anchor_backtrack', t)
 
         if not regions:
-            print("\n⚠️  백트래킹 실패")
+            attempt.failed = True
+            attempt.pruned.update((v['height'], v['total_width']) for v in all_variants)
+            if TRACER.debug:
+                TRACER.emit(TRACE_DEBUG, 'split.backtrack_failed', "\n⚠️  백트래킹 실패")
             return {
                 'width': self.plate_width,
                 'height': self.plate_height,
@@ -91,22 +163,56 @@ class RegionBasedPackerWithSplit(RegionBasedPacker):
             }
 
         self._optimize_trim_placement(regions)
+        prof.add('trim_optimize', t)
         return self._build_plate_from_regions(regions)
 
+    def _cached_variants(self, groups: list[dict], attempt: SplitAttempt) -> list[dict]:
+        """그룹별 variant를 이어 붙인 전체 variant 리스트
+
+        `_flatten_group_options`는 그룹 순서대로 이어 붙인 뒤 중복을 지우므로
+        그룹 단위로 만들어 이어 붙이고 같은 중복 제거를 하면 결과가 같다.
+        분할되지 않은 그룹과 같은 count의 분할 chunk는 캐시된 variant를 그대로
+        쓴다 (variant는 읽기 전용).
+        """
+        cache = attempt.variants
+        all_variants = []
+        for group in groups:
+            key = (group['size'], group['count'])
+            variants = cache.get(key)
+            if variants is None:
+                variants = self._flatten_group_options(self._generate_group_options([group]))
+                cache[key] = variants
+            all_variants.extend(variants)
+        return self._dedupe_variants(all_variants)
+
+    def _anchor_fits_empty_plate(self, variant: dict) -> bool:
+        """빈 원판(y=0)에서 앵커 가지치기를 통과하는지 — `_allocate_anchor_backtrack`과 같은 조건"""
+        return (variant['height'] + self.kerf <= self.plate_height
+                and variant['total_width'] <= self.plate_width)
+
     def _print_plate_summary(self, plate: dict) -> None:
-        """배치 완료 로그 + 크기별 배치 개수 검증 출력."""
-        print("\n=== 원판: 다중 그룹 영역 배치 완료 ===")
-        print(f"  배치된 조각: {len(plate['pieces'])}개")
-        print(f"  절단선: {len(plate['cuts'])}개\n")
+        """배치 완료 로그 + 크기별 배치 개수 검증 (DEBUG trace)."""
+        if not TRACER.debug:
+            return
 
         placed_sizes_count: dict[tuple[int, int], int] = {}
         for p in plate['pieces']:
             size_key = (p['width'], p['height'])
             placed_sizes_count[size_key] = placed_sizes_count.get(size_key, 0) + 1
 
-        print("\n=== 배치 검증 ===")
-        for size_key, count in placed_sizes_count.items():
-            print(f"  {size_key[0]}×{size_key[1]}: {count}개 배치")
+        lines = [
+            f"  {size_key[0]}×{size_key[1]}: {count}개 배치"
+            for size_key, count in placed_sizes_count.items()
+        ]
+        TRACER.emit(
+            TRACE_DEBUG, 'split.done',
+            "\n=== 원판: 다중 그룹 영역 배치 완료 ===\n"
+            f"  배치된 조각: {len(plate['pieces'])}개\n"
+            f"  절단선: {len(plate['cuts'])}개\n"
+            "\n\n=== 배치 검증 ===\n" + "\n".join(lines),
+            placed=len(plate['pieces']), cuts=len(plate['cuts']),
+            sizes={f"{w}x{h}": c for (w, h), c in placed_sizes_count.items()},
+        )
 
     def _split_oversized_groups(self, groups: list[dict]) -> list[dict]:
         """한 행에 들어가지 않는 그룹을 자동 분할.
@@ -142,15 +248,21 @@ class RegionBasedPackerWithSplit(RegionBasedPacker):
                 best_option = 'horizontal'
 
             if max_count == 0:
-                print(f"  ⚠️  {w}×{h}mm 조각이 원판보다 큽니다")
+                if TRACER.warning:
+                    TRACER.emit(TRACE_WARNING, 'split.oversized',
+                                f"  ⚠️  {w}×{h}mm 조각이 원판보다 큽니다", size=(w, h))
                 result.append(group)
                 continue
 
             if count <= max_count:
                 result.append(group)
             else:
-                option_desc = f"회전 {max_count}개" if best_option == 'rotated' else f"{max_count}개"
-                print(f"  분할: {w}×{h}mm {count}개 → {option_desc}씩 그룹")
+                if TRACER.debug:
+                    option_desc = f"회전 {max_count}개" if best_option == 'rotated' else f"{max_count}개"
+                    TRACER.emit(TRACE_DEBUG, 'split.group',
+                                f"  분할: {w}×{h}mm {count}개 → {option_desc}씩 그룹",
+                                size=(w, h), count=count, per_group=max_count,
+                                rotated=best_option == 'rotated')
 
                 remaining_count = count
                 piece_idx = 0
@@ -0,0 +1,201 @@
+"""선택적 NumPy 후보 점수 계산 백엔드
+
+넓은 후보 집합에서 dict/루프 대신 열(column) 배열 한 번의 벡터 연산으로
+적합 마스크·낭비·정렬 점수를 계산하고 최선 인덱스만 돌려준다.
+
+- SpaceColumns: FreeSpaceIndex에 붙는 자유 공간 열 저장소 (best_fit 가속)
+- VariantTable: 앵커 백트래킹의 variant 열 저장소 (호환 필터 + 정렬 + 그리디 채우기)
+
+numpy가 없거나(Pyodide 기본 로드, 최소 설치) `WOODCUT_NUMPY=off`이면
+생성 함수가 None을 돌려주고 호출 측은 기존 순수 파이썬 경로를 쓴다.
+numpy는 생성 함수가 실제로 열 저장소를 만들 때 처음 import 한다 —
+`import woodcut`(솔버 워커, 웹 서버, CLI)의 기동 비용에 들어가지 않는다.
+두 경로는 동점 처리까지 같은 결과를 낸다 — 마지막 정렬 키가 원래 순서.
+"""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+SCORING_ENV_VAR = 'WOODCUT_NUMPY'
+
+# 후보가 이보다 적으면 배열 변환·호출 오버헤드가 루프보다 비싸다
+MIN_VECTOR_SPACES = 64
+MIN_VECTOR_VARIANTS = 64
+
+# 환경변수만 본다 — numpy 설치 여부는 _numpy()가 첫 사용 때 확인
+NUMPY_SCORING = os.environ.get(SCORING_ENV_VAR, 'on').lower() not in (
+    '0', 'off', 'false', 'no',
+)
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """numpy 모듈 — 처음 불릴 때 import, 없으면 None"""
+    try:
+        import numpy
+    except ImportError:  # numpy 없는 환경 — 순수 파이썬 경로만
+        return None
+    return numpy
+
+
+class SpaceColumns:
+    """자유 공간 (x, y, w, h, seq, x정렬, y정렬) 행 저장소
+
+    add/remove/note는 파이썬 버퍼에만 쌓고, best()가 불릴 때 한 번에 배열로
+    반영한다 — 벡터 조회가 없는 동안은 배치마다 numpy 스칼라 연산 비용이 없다.
+    정렬 여부는 열로 들고 있어 조회마다 좌표 집합과 isin 하지 않는다.
+    """
+    __slots__ = ('min_rows', '_np', '_rows', '_added', '_removed', '_noted_x', '_noted_y')
+
+    def __init__(self, min_rows: int = MIN_VECTOR_SPACES, np=None) -> None:
+        self.min_rows = min_rows
+        self._np = np = np or _numpy()
+        self._rows = np.empty((0, 7), dtype=np.int64)
+        self._added: dict[int, tuple] = {}  # seq → 행 (아직 배열에 없음)
+        self._removed: list[int] = []  # 배열에서 지울 seq
+        self._noted_x: list[int] = []
+        self._noted_y: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows) - len(self._removed) + len(self._added)
+
+    def add(self, seq: int, x: int, y: int, w: int, h: int,
+            x_aligned: bool = False, y_aligned: bool = False) -> None:
+        self._added[seq] = (x, y, w, h, seq, x_aligned, y_aligned)
+
+    def remove(self, seq: int) -> None:
+        if self._added.pop(seq, None) is None:
+            self._removed.append(seq)
+
+    def note(self, xs=(), ys=()) -> None:
+        """정렬 좌표 추가 — x가 xs 중 하나 / y가 ys 중 하나인 행을 정렬로 표시"""
+        self._noted_x.extend(xs)
+        self._noted_y.extend(ys)
+
+    def _flush(self):
+        np = self._np
+        rows = self._rows
+        if self._removed:
+            rows = rows[~np.isin(rows[:, 4], self._removed)]
+            self._removed = []
+        if self._added:
+            rows = np.concatenate((rows, np.array(list(self._added.values()), dtype=np.int64)))
+            self._added = {}
+        # 정렬 표시는 단조(0→1)라 추가 행에 다시 적용해도 같다
+        if self._noted_x:
+            rows[np.isin(rows[:, 0], self._noted_x), 5] = 1
+            self._noted_x = []
+        if self._noted_y:
+            rows[np.isin(rows[:, 1], self._noted_y), 6] = 1
+            self._noted_y = []
+        self._rows = rows
+        return rows
+
+    def best(self, need_w: int, need_h: int, w: int, h: int, region: tuple | None = None):
+        """need_w×need_h가 들어가는 공간 중 (정렬 점수↓, 낭비↑, seq↑) 최선
+
+        Returns:
+            (-정렬 점수, 낭비, seq) 또는 None. region이 None이면 정렬 점수는 -2 고정.
+        """
+        rows = self._flush()
+        x, y, sw, sh = rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]
+        mask = (sw >= need_w) & (sh >= need_h)
+        if region is not None:
+            rx, ry, rw, rh = region
+            mask &= (x >= rx) & (x < rx + rw) & (y >= ry) & (y < ry + rh)
+        fit = rows[mask]
+        if not len(fit):
+            return None
+        waste = (fit[:, 2] - w) * (fit[:, 3] - h)
+        if region is not None:
+            align = -(fit[:, 5] + fit[:, 6])
+            top = align.min()
+            keep = align == top
+            fit, waste = fit[keep], waste[keep]
+            align = int(top)
+        else:
+            align = -2
+        least = waste.min()
+        seq = int(fit[waste == least, 4].min())
+        return align, int(least), seq
+
+
+class VariantTable:
+    """앵커 백트래킹 variant 열 저장소 — `_build_region_with_anchor`의 호환 필터용
+
+    sizes는 remaining_counts의 키 순서(= initial_remaining 순서)와 같아야 한다.
+    """
+    __slots__ = ('variants', 'height', 'total_width', 'count', 'neg_count', 'neg_area',
+                 'size_idx', 'size_pos', 'order', '_np')
+
+    def __init__(self, variants: list[dict], sizes: list[tuple], np=None) -> None:
+        self._np = np = np or _numpy()
+        self.variants = variants
+        self.size_pos = {s: i for i, s in enumerate(sizes)}
+        n = len(variants)
+        self.height = np.fromiter((v['height'] for v in variants), dtype=np.int64, count=n)
+        self.total_width = np.fromiter((v['total_width'] for v in variants), dtype=np.int64, count=n)
+        self.count = np.fromiter((v['count'] for v in variants), dtype=np.int64, count=n)
+        self.neg_count = -self.count
+        self.neg_area = -np.fromiter((v['area'] for v in variants), dtype=np.int64, count=n)
+        self.size_idx = np.fromiter((self.size_pos[v['original_size']] for v in variants),
+                                     dtype=np.int64, count=n)
+        self.order = np.arange(n)
+
+    def greedy_fill(self, remaining_counts: dict, exclude_size: tuple,
+                    max_height: int, width_budget: int, kerf: int) -> list[dict]:
+        """앵커 region에 그리디로 추가될 variant들 (추가 순서)
+
+        호환 필터(남은 수·높이·너비 예산, 앵커 사이즈 제외)와 정렬
+        (높이 차, -k, -면적, 원래 순서)은 벡터 연산. 이어지는 그리디는 순차라
+        파이썬으로 돌되, 정렬 순서 뒤쪽 최소 너비(suffix min)가 남은 예산을
+        넘으면 그 자리에서 끝낸다.
+        """
+        np = self._np
+        rem = np.fromiter(remaining_counts.values(), dtype=np.int64, count=len(remaining_counts))
+        mask = ((rem[self.size_idx] >= self.count)
+                & (self.height <= max_height)
+                & (self.total_width <= width_budget)
+                & (self.size_idx != self.size_pos[exclude_size]))
+        idx = np.flatnonzero(mask)
+        if not idx.size:
+            return []
+        order = idx[np.lexsort((self.order[idx], self.neg_area[idx], self.neg_count[idx],
+                                 max_height - self.height[idx]))]
+        widths = self.total_width[order]
+        floor = np.minimum.accumulate(widths[::-1])[::-1]
+
+        variants = self.variants
+        picked = []
+        used = set()
+        budget = width_budget
+        for i, w, s, f in zip(order.tolist(), widths.tolist(),
+                              self.size_idx[order].tolist(), floor.tolist()):
+            if f > budget:
+                break
+            if s in used or w > budget:
+                continue
+            picked.append(variants[i])
+            used.add(s)
+            budget -= w + kerf
+        return picked
+
+
+def space_columns(enabled: bool | None = None) -> SpaceColumns | None:
+    """numpy 백엔드가 켜져 있으면 빈 SpaceColumns, 아니면 None"""
+    if enabled is None:
+        enabled = NUMPY_SCORING
+    np = _numpy() if enabled else None
+    return SpaceColumns(np=np) if np is not None else None
+
+
+def variant_table(variants: list[dict], sizes: list[tuple],
+                  enabled: bool | None = None) -> VariantTable | None:
+    """variant가 충분히 많고 numpy 백엔드가 켜져 있으면 VariantTable, 아니면 None"""
+    if enabled is None:
+        enabled = NUMPY_SCORING
+    if not enabled or len(variants) < MIN_VECTOR_VARIANTS:
+        return None
+    np = _numpy()
+    return VariantTable(variants, sizes, np) if np is not None else None
@@ -0,0 +1,137 @@
+"""솔버 탐색 카운터 + 단계별 시간 계측
+
+- `SearchStats`: 패커 인스턴스마다 하나씩 두고 탐색 루프에서 정수 필드를 직접
+  증가시킨다. 속성 증가 한 번이라 수집 비용은 무시할 수 있고, 집계/노출
+  (`/metrics`)은 호출 측이 `as_dict()`로 꺼내 간다.
+- `PackProfile`: `pack(pieces, profile=...)`로 넘기면 단계별 벽시계 시간,
+  stock 후보별 시뮬레이션 시간, 탐색 카운터를 채워 준다.
+
+Pyodide 경로에서도 로드되므로 woodcut의 다른 모듈을 import 하지 않는다.
+"""
+
+from time import perf_counter
+
+
+class SearchStats:
+    """pack() 1회 동안의 탐색 카운터
+
+    Attributes:
+        backtrack_nodes: 앵커 백트래킹 재귀 노드 전개 수
+        shelf_nodes: strip shelf DFS 노드 전개 수
+        pruned_branches: 가지치기된 분기 수 (앵커 크기 초과 스킵 + shelf 면적 상한 컷)
+        cache_hits: 앵커 백트래킹 부분해 memo 적중 수
+        fallback_shelf: NFDH 폴백(`_pack_fallback_shelf`) 진입 수
+        split_retries: 그룹 분할 재시도(`_split_oversized_groups`) 수
+        pruned_stocks: 시뮬레이션 없이 건너뛴 stock 후보 수 (같은 치수 중복 +
+            상한이 지금 최선을 못 이김)
+        validated_plates: `validate_guillotine`으로 트리 불변식을 검사한 원판 수
+        validate_seconds: 그 검사에 쓴 누적 시간(초) — 원판당 시간은
+            validate_seconds / validated_plates
+    """
+
+    FIELDS = (
+        'backtrack_nodes',
+        'shelf_nodes',
+        'pruned_branches',
+        'cache_hits',
+        'fallback_shelf',
+        'split_retries',
+        'pruned_stocks',
+        'validated_plates',
+        'validate_seconds',
+    )
+
+    def __init__(self) -> None:
+        self.backtrack_nodes = 0
+        self.shelf_nodes = 0
+        self.pruned_branches = 0
+        self.cache_hits = 0
+        self.fallback_shelf = 0
+        self.split_retries = 0
+        self.pruned_stocks = 0
+        self.validated_plates = 0
+        self.validate_seconds = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """{필드명: 값} — 프로세스 경계를 넘길 수 있는 형태"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+class PackProfile:
+    """pack() 1회의 단계별 시간/탐색 통계
+
+    단계 이름 (`PHASES`):
+        group_variants: 크기별 그룹화 + 회전/부분 count variant 생성
+        anchor_backtrack: `_allocate_anchor_backtrack`
+        init_occupancy: `_init_region_occupancy`
+        trim_optimize: `_optimize_trim_placement`
+        strip_shelves: `_pack_strip_shelves` (trim_optimize 시간에 포함)
+        multi_group_region: `_pack_multi_group_region` (region마다)
+        region_subtree: `_build_region_subtree` (region마다)
+        emit_cuts: `emit_cuts`
+        validate_guillotine: `validate_guillotine` (`ValidationPolicy`가 고른 원판만)
+        fallback_shelf: `_pack_fallback_shelf`
+
+    stock 후보 시뮬레이션마다 위 단계가 모두 돌므로 `phases`는 선택되지 않은
+    후보의 시간까지 포함한 누적값이다.
+
+    Attributes:
+        phases: {단계: 누적 초}
+        calls: {단계: 호출 수}
+        stock_sims: [{'plate', 'stock_index', 'width', 'height', 'seconds',
+            'placed'}, ...] — 원판 선택 시뮬레이션 1회당 1개
+        search: 종료 시점의 `SearchStats.as_dict()`
+        total_seconds: pack() 전체 시간
+    """
+
+    PHASES = (
+        'group_variants',
+        'anchor_backtrack',
+        'init_occupancy',
+        'trim_optimize',
+        'strip_shelves',
+        'multi_group_region',
+        'region_subtree',
+        'emit_cuts',
+        'validate_guillotine',
+        'fallback_shelf',
+    )
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.stock_sims: list[dict] = []
+        self.search: dict[str, int] = {}
+        self.total_seconds = 0.0
+
+    def add(self, phase: str, started: float) -> float:
+        """`started`(perf_counter() 값)부터 지금까지를 phase에 누적하고 현재 시각 반환.
+
+        반환값을 다음 단계의 started로 바로 넘길 수 있다.
+        """
+        now = perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - started)
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        return now
+
+    def as_dict(self) -> dict:
+        """JSON 직렬화 가능한 요약"""
+        return {
+            'total_seconds': self.total_seconds,
+            'phases': {p: self.phases[p] for p in self.PHASES if p in self.phases},
+            'calls': {p: self.calls[p] for p in self.PHASES if p in self.calls},
+            'stock_sims': list(self.stock_sims),
+            'search': dict(self.search),
+        }
+
+    def format_table(self) -> str:
+        """단계별 시간 표 (사람이 읽는 용도)"""
+        total = self.total_seconds or sum(self.phases.values()) or 1.0
+        lines = [f"{'phase':<22}{'calls':>8}{'seconds':>12}{'share':>9}"]
+        for p in self.PHASES:
+            if p not in self.phases:
+                continue
+            sec = self.phases[p]
+            lines.append(f"{p:<22}{self.calls[p]:>8}{sec:>12.4f}{sec / total:>9.1%}")
+        lines.append(f"{'total':<22}{'':>8}{self.total_seconds:>12.4f}")
+        return '\n'.join(lines)
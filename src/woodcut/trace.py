@@ -0,0 +1,196 @@
+"""구조화 이벤트 추적 (솔버 print() 대체)
+
+솔버는 원판/영역/조각마다 진행 상황을 남기는데, 이를 stdout print로 하면 대형
+주문에서 문자열 포매팅 자체가 실행 시간의 상당 부분을 차지하고 서버 로그가 넘친다.
+대신 전역 `TRACER`에 레벨이 있는 이벤트를 보내고, 붙어 있는 sink만 받아 간다.
+
+비활성 비용: 호출부는 항상 레벨 플래그를 먼저 확인한다.
+
+    tr = TRACER
+    if tr.debug:
+        tr.emit(TRACE_DEBUG, 'region.row', f"...", y=current_y)
+
+sink가 없거나 레벨이 높으면 `tr.debug`는 False라서 속성 조회 한 번으로 끝나고,
+f-string 포매팅과 dict 생성은 일어나지 않는다.
+
+sink는 record dict 하나를 받는 callable이다:
+
+    {'ts': 1700000000.0, 'level': 'INFO', 'event': 'pack.stock_selected',
+     'msg': '✓ 선택: ...', <이벤트별 필드>...}
+
+제공 sink: `ConsoleSink`(사람용 msg 출력), `JsonlSink`(파일에 한 줄씩),
+`RingBufferSink`(메모리에 최근 N개 — 테스트/디버깅용).
+
+Pyodide 경로에서도 로드되므로 woodcut의 다른 모듈을 import 하지 않고,
+공유 globals 충돌을 피하려고 공개 이름에 TRACE/Trace 접두어를 붙인다.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import deque
+
+TRACE_DEBUG = 10
+TRACE_INFO = 20
+TRACE_WARNING = 30
+TRACE_OFF = 100
+
+_TRACE_LEVEL_NAMES = {
+    TRACE_DEBUG: 'DEBUG',
+    TRACE_INFO: 'INFO',
+    TRACE_WARNING: 'WARNING',
+    TRACE_OFF: 'OFF',
+}
+
+
+def parse_trace_level(name: str | int) -> int:
+    """'debug' / 'INFO' / 20 → 레벨 정수"""
+    if isinstance(name, int):
+        return name
+    for level, level_name in _TRACE_LEVEL_NAMES.items():
+        if level_name == name.strip().upper():
+            return level
+    raise ValueError(f"알 수 없는 trace 레벨: {name!r}")
+
+
+class Tracer:
+    """이벤트를 레벨별 sink로 분배
+
+    Attributes:
+        debug / info / warning: 해당 레벨 이벤트를 받을 sink가 하나라도 있으면
+            True. 호출부는 이 플래그로 emit 여부를 먼저 판단한다.
+    """
+
+    def __init__(self) -> None:
+        self._sinks: list[tuple[int, object]] = []
+        self.debug = False
+        self.info = False
+        self.warning = False
+
+    def add_sink(self, sink, level: int = TRACE_INFO):
+        """sink 등록 — level 이상 이벤트만 전달. sink를 그대로 반환."""
+        self._sinks.append((level, sink))
+        self._refresh()
+        return sink
+
+    def remove_sink(self, sink) -> None:
+        self._sinks = [(lv, s) for lv, s in self._sinks if s is not sink]
+        self._refresh()
+
+    def clear(self) -> None:
+        self._sinks = []
+        self._refresh()
+
+    def _refresh(self) -> None:
+        lowest = min((lv for lv, _ in self._sinks), default=TRACE_OFF)
+        self.debug = lowest <= TRACE_DEBUG
+        self.info = lowest <= TRACE_INFO
+        self.warning = lowest <= TRACE_WARNING
+
+    def emit(self, level: int, event: str, msg: str = '', **fields) -> None:
+        """이벤트 1건 전송. 호출부가 레벨 플래그를 이미 확인했다고 가정."""
+        record = {
+            'ts': time.time(),
+            'level': _TRACE_LEVEL_NAMES.get(level, str(level)),
+            'event': event,
+            'msg': msg,
+        }
+        record.update(fields)
+        for min_level, sink in self._sinks:
+            if level >= min_level:
+                sink(record)
+
+    def capture(self, level: int = TRACE_DEBUG, capacity: int = 10000) -> 'TraceCapture':
+        """with 블록 동안 RingBufferSink를 붙인다 (테스트/디버깅용)."""
+        return TraceCapture(self, level, capacity)
+
+
+class TraceCapture:
+    """`Tracer.capture()`의 컨텍스트 매니저 — 진입 시 RingBufferSink 반환"""
+
+    def __init__(self, tracer: Tracer, level: int, capacity: int) -> None:
+        self._tracer = tracer
+        self._level = level
+        self._sink = RingBufferSink(capacity)
+
+    def __enter__(self) -> 'RingBufferSink':
+        return self._tracer.add_sink(self._sink, self._level)
+
+    def __exit__(self, *exc) -> None:
+        self._tracer.remove_sink(self._sink)
+
+
+class ConsoleSink:
+    """사람이 읽는 msg를 stream에 출력 (msg가 없으면 event + 필드)"""
+
+    def __init__(self, stream=None) -> None:
+        self._stream = stream
+
+    def __call__(self, record: dict) -> None:
+        msg = record['msg']
+        if not msg:
+            extra = ' '.join(
+                f"{k}={v}" for k, v in record.items() if k not in ('ts', 'level', 'event', 'msg')
+            )
+            msg = f"[{record['event']}] {extra}"
+        print(msg, file=self._stream or sys.stdout)
+
+
+class JsonlSink:
+    """record를 JSON Lines로 파일에 기록"""
+
+    def __init__(self, path_or_file) -> None:
+        if isinstance(path_or_file, (str, os.PathLike)):
+            self._file = open(path_or_file, 'a', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = path_or_file
+            self._owns_file = False
+
+    def __call__(self, record: dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class RingBufferSink:
+    """최근 capacity개 record를 메모리에 보관"""
+
+    def __init__(self, capacity: int = 10000) -> None:
+        self._records: deque[dict] = deque(maxlen=capacity)
+
+    def __call__(self, record: dict) -> None:
+        self._records.append(record)
+
+    @property
+    def records(self) -> list[dict]:
+        return list(self._records)
+
+    def events(self, prefix: str = '') -> list[dict]:
+        """event 이름이 prefix로 시작하는 record만"""
+        return [r for r in self._records if r['event'].startswith(prefix)]
+
+
+# 프로세스 전역 tracer — 기본은 sink 없음(완전 비활성)
+TRACER = Tracer()
+
+
+def configure_trace_from_env(default_console_level: int | None = None) -> None:
+    """환경변수로 전역 tracer 구성 (CLI 진입점에서 호출)
+
+    - WOODCUT_TRACE: 콘솔 출력 레벨 (debug/info/warning/off).
+      없으면 default_console_level (None이면 콘솔 출력 없음)
+    - WOODCUT_TRACE_FILE: JSONL 경로 — 모든 DEBUG 이상 이벤트 기록
+    """
+    level_name = os.environ.get('WOODCUT_TRACE')
+    level = parse_trace_level(level_name) if level_name else default_console_level
+    if level is not None and level < TRACE_OFF:
+        TRACER.add_sink(ConsoleSink(), level)
+    path = os.environ.get('WOODCUT_TRACE_FILE')
+    if path:
+        TRACER.add_sink(JsonlSink(path), TRACE_DEBUG)
@@ -0,0 +1,287 @@
+"""재단 결과 검증기 — 원판 dict만 보고 물리적/Guillotine 제약 위반을 찾는다
+
+솔버 내부의 `validate_guillotine`은 GNode 트리를 검사하고 `ValidationPolicy`가 고른
+원판에만 돈다.
+여기서는 클라이언트가 받는 결과(원판 dict의 `pieces`, `cuts`)를 직접 검사하므로
+어느 전략이 만든 결과든, 프로세스 경계를 넘은 결과든 같은 기준으로 확인할 수 있다.
+
+검사 항목 (`Violation.code`):
+    size_mismatch       placed_w/h가 원래 크기(회전 반영)와 ±tol 넘게 다름
+    out_of_bounds       조각이 원판 밖으로 나감
+    overlap             두 조각이 겹침
+    kerf_gap            두 조각 사이 간격이 톱날 두께(kerf)보다 좁음 — 둘을 가를 수 없다
+    cut_bounds          절단선이 원판 밖이거나 start ≥ end
+    duplicate_cut       같은 절단선이 두 번
+    guillotine_order    절단선이 앞선 절단들로 생긴 서브영역 하나를 끝까지 관통하지 않음
+    cut_crosses_piece   절단선(kerf 폭 포함)이 조각을 가로지름
+    unseparated_pieces  모든 절단 후에도 한 서브영역에 조각이 2개 이상
+    count_mismatch      배치 + 미배치 수량 ≠ 요청 수량
+
+비용: 겹침/kerf 검사는 x 방향 sweep-line + y 구간 정렬 리스트로 O(n log n + 위반 수).
+Guillotine 재현은 서브영역을 (x, x2)/(y, y2) 해시로 찾아 절단 1개당 O(1) 조회,
+조각을 서브영역마다 나눠 담아 절단선-조각 교차를 O(n × 트리 깊이)로 확인한다.
+기존 테스트 헬퍼(`tests/test_comprehensive_validation.py`)의 쌍별 O(n²) 검사와
+같은 위반을 잡는다.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+
+VIOLATION_CODES = (
+    'size_mismatch',
+    'out_of_bounds',
+    'overlap',
+    'kerf_gap',
+    'cut_bounds',
+    'duplicate_cut',
+    'guillotine_order',
+    'cut_crosses_piece',
+    'unseparated_pieces',
+    'count_mismatch',
+)
+
+
+@dataclass
+class Violation:
+    """위반 1건
+
+    Attributes:
+        code: `VIOLATION_CODES` 중 하나
+        plate: 원판 번호 (0부터, 원판과 무관하면 -1)
+        message: 사람이 읽는 설명
+        pieces: 관련 조각 인덱스 (원판의 `pieces` 리스트 기준)
+        cuts: 관련 절단선 `order`
+    """
+    code: str
+    plate: int
+    message: str
+    pieces: tuple[int, ...] = field(default_factory=tuple)
+    cuts: tuple[int, ...] = field(default_factory=tuple)
+
+    def as_dict(self) -> dict:
+        return {
+            'code': self.code,
+            'plate': self.plate,
+            'message': self.message,
+            'pieces': list(self.pieces),
+            'cuts': list(self.cuts),
+        }
+
+
+def _piece_rect(p: dict) -> tuple[int, int, int, int]:
+    if 'placed_w' in p and 'placed_h' in p:
+        return p['x'], p['y'], p['placed_w'], p['placed_h']
+    if p.get('rotated'):
+        return p['x'], p['y'], p['height'], p['width']
+    return p['x'], p['y'], p['width'], p['height']
+
+
+def find_close_pairs(rects: list[tuple[int, int, int, int]], gap: int = 0) -> list[tuple[int, int]]:
+    """x·y 양쪽 간격이 모두 gap 미만인 사각형 쌍 (gap=0이면 내부가 겹치는 쌍)
+
+    sweep-line: 각 사각형을 (w + gap) × (h + gap)로 늘려 x 순서로 훑으며, 현재 x를
+    지나는 사각형들의 y 구간을 시작점 순 정렬 리스트로 유지한다. 새 구간 [y1, y2)와
+    겹칠 수 있는 활성 구간은 시작점이 [y1 - 최대높이, y2) 안인 것뿐이라 그 범위만
+    이분 탐색으로 잘라 본다. 재단 결과처럼 조각이 서로 떨어져 있으면 조각당 활성
+    이웃 몇 개만 보게 된다.
+    """
+    events = []
+    for i, (x, _, w, _) in enumerate(rects):
+        events.append((x + w + gap, 0, i))  # 같은 x에서 제거 먼저 (맞닿음은 겹침 아님)
+        events.append((x, 1, i))
+    events.sort()
+    max_h = max((h for _, _, _, h in rects), default=0) + gap
+
+    active: list[tuple[int, int, int]] = []  # (y1, y2, idx) — y1 순
+    pairs = []
+    for _, kind, i in events:
+        _, y, _, h = rects[i]
+        item = (y, y + h + gap, i)
+        if kind == 0:
+            del active[bisect_left(active, item)]
+            continue
+        k = bisect_left(active, (y - max_h,))
+        while k < len(active) and active[k][0] < item[1]:
+            if active[k][1] > y:
+                j = active[k][2]
+                pairs.append((min(i, j), max(i, j)))
+            k += 1
+        insort(active, item)
+    return pairs
+
+
+def _check_pieces(plate: dict, kerf: int, tol: int, pi: int, out: list[Violation]) -> None:
+    W, H = plate['width'], plate['height']
+    rects = []
+    for i, p in enumerate(plate['pieces']):
+        x, y, w, h = rect = _piece_rect(p)
+        rects.append(rect)
+        exp_w, exp_h = (p['height'], p['width']) if p.get('rotated') else (p['width'], p['height'])
+        if abs(w - exp_w) > tol or abs(h - exp_h) > tol:
+            out.append(Violation('size_mismatch', pi, f"조각 {i}: 배치 {w}x{h}, 기대 {exp_w}x{exp_h}", (i,)))
+        if x < 0 or y < 0 or x + w > W + tol or y + h > H + tol:
+            out.append(Violation('out_of_bounds', pi, f"조각 {i} ({x},{y},{w}x{h})가 원판 {W}x{H} 밖", (i,)))
+
+    for i, j in find_close_pairs(rects, kerf):
+        xi, yi, wi, hi = rects[i]
+        xj, yj, wj, hj = rects[j]
+        gap_x = max(xj - (xi + wi), xi - (xj + wj))
+        gap_y = max(yj - (yi + hi), yi - (yj + hj))
+        if gap_x < 0 and gap_y < 0:
+            out.append(Violation('overlap', pi, f"조각 {i} {rects[i]}와 조각 {j} {rects[j]}가 겹침", (i, j)))
+        else:
+            out.append(Violation(
+                'kerf_gap', pi, f"조각 {i}와 {j} 간격 {max(gap_x, gap_y)}mm < kerf {kerf}mm", (i, j),
+            ))
+
+
+def _check_cuts(plate: dict, kerf: int, tol: int, pi: int, out: list[Violation],
+                guillotine: bool) -> None:
+    W, H = plate['width'], plate['height']
+    cuts = sorted(plate.get('cuts') or [], key=lambda c: c['order'])
+    seen: dict[tuple, int] = {}
+    valid = []
+    for c in cuts:
+        d, pos, s, e = c['direction'], c['position'], c['start'], c['end']
+        key = (d, pos, s, e)
+        if key in seen:
+            out.append(Violation('duplicate_cut', pi, f"절단 #{seen[key]}와 #{c['order']}가 같음 {key}",
+                                 cuts=(seen[key], c['order'])))
+            continue
+        seen[key] = c['order']
+        length = W if d == 'H' else H
+        span = H if d == 'H' else W
+        if d not in ('H', 'V') or not (0 <= pos <= span) or s < 0 or e > length + tol or s >= e:
+            out.append(Violation('cut_bounds', pi, f"절단 #{c['order']} {d} pos={pos} [{s},{e}] 범위 오류",
+                                 cuts=(c['order'],)))
+            continue
+        valid.append(c)
+    if guillotine:
+        _replay_guillotine(plate, valid, kerf, tol, pi, out)
+
+
+def _replay_guillotine(plate: dict, cuts: list[dict], kerf: int, tol: int, pi: int,
+                       out: list[Violation]) -> None:
+    """절단을 order 순으로 재현 — 각 절단이 기존 서브영역 하나를 끝까지 관통하는지,
+    조각을 가로지르지 않는지, 마지막에 서브영역마다 조각이 1개 이하인지 확인"""
+    rects = [_piece_rect(p) for p in plate['pieces']]
+    # region id → [x, y, w, h, 조각 인덱스 리스트]
+    regions: dict[int, list] = {0: [0, 0, plate['width'], plate['height'], list(range(len(rects)))]}
+    by_x: dict[tuple[int, int], set[int]] = {}  # (x, x2) → region ids (H 절단 조회용)
+    by_y: dict[tuple[int, int], set[int]] = {}  # (y, y2) → region ids (V 절단 조회용)
+    next_id = 1
+
+    def add(x, y, w, h, members):
+        nonlocal next_id
+        rid = next_id
+        next_id += 1
+        regions[rid] = [x, y, w, h, members]
+        by_x.setdefault((x, x + w), set()).add(rid)
+        by_y.setdefault((y, y + h), set()).add(rid)
+
+    def drop(rid):
+        x, y, w, h, _ = regions.pop(rid)
+        by_x[(x, x + w)].discard(rid)
+        by_y[(y, y + h)].discard(rid)
+
+    by_x[(0, plate['width'])] = {0}
+    by_y[(0, plate['height'])] = {0}
+
+    for c in cuts:
+        d, pos, s, e = c['direction'], c['position'], c['start'], c['end']
+        index = by_x if d == 'H' else by_y
+        match = None
+        for ds in range(-tol, tol + 1):
+            for de in range(-tol, tol + 1):
+                for rid in index.get((s + ds, e + de), ()):
+                    x, y, w, h, _ = regions[rid]
+                    lo, hi = (y, y + h) if d == 'H' else (x, x + w)
+                    if lo < pos < hi:
+                        match = rid
+                        break
+                if match is not None:
+                    break
+            if match is not None:
+                break
+        if match is None:
+            out.append(Violation(
+                'guillotine_order', pi,
+                f"절단 #{c['order']} {d} pos={pos} [{s},{e}]가 관통하는 서브영역이 없음",
+                cuts=(c['order'],),
+            ))
+            continue
+
+        x, y, w, h, members = regions[match]
+        drop(match)
+        first, second = [], []
+        for i in members:
+            px, py, pw, ph = rects[i]
+            lo, size = (py, ph) if d == 'H' else (px, pw)
+            if lo + size <= pos + tol:
+                first.append(i)
+            elif lo >= pos + kerf - tol:
+                second.append(i)
+            else:
+                out.append(Violation(
+                    'cut_crosses_piece', pi,
+                    f"절단 #{c['order']} {d} pos={pos}(+kerf {kerf})가 조각 {i} {rects[i]}를 가로지름",
+                    (i,), (c['order'],),
+                ))
+        if d == 'H':
+            if pos - y > 0:
+                add(x, y, w, pos - y, first)
+            if y + h - (pos + kerf) > 0:
+                add(x, pos + kerf, w, y + h - (pos + kerf), second)
+        else:
+            if pos - x > 0:
+                add(x, y, pos - x, h, first)
+            if x + w - (pos + kerf) > 0:
+                add(pos + kerf, y, x + w - (pos + kerf), h, second)
+
+    for x, y, w, h, members in regions.values():
+        if len(members) > 1:
+            out.append(Violation(
+                'unseparated_pieces', pi,
+                f"서브영역 ({x},{y},{w}x{h})에 조각 {len(members)}개가 절단 없이 남음",
+                tuple(sorted(members)),
+            ))
+
+
+def validate_plate(plate: dict, kerf: int = 5, plate_index: int = 0, tol: int = 1,
+                   guillotine: bool = True) -> list[Violation]:
+    """원판 1장 검증 → 위반 목록 (비어 있으면 OK)
+
+    Args:
+        plate: {'width', 'height', 'pieces', 'cuts'} 원판 dict
+        kerf: 톱날 두께 — 조각 간 최소 간격, 절단선이 차지하는 폭
+        tol: 크기/관통 비교 허용 오차(mm)
+        guillotine: False면 절단 순서 재현(절단선-조각 교차 포함)을 생략
+    """
+    out: list[Violation] = []
+    _check_pieces(plate, kerf, tol, plate_index, out)
+    _check_cuts(plate, kerf, tol, plate_index, out, guillotine)
+    return out
+
+
+def validate_solution(plates: list[dict], kerf: int = 5, pieces: list | None = None,
+                      unplaced: list | None = None, tol: int = 1,
+                      guillotine: bool = True) -> list[Violation]:
+    """결과 전체 검증 — 원판별 검사 + (pieces, unplaced가 있으면) 수량 대조
+
+    Args:
+        pieces: 요청 조각 [(width, height, count), ...]
+        unplaced: 미배치 조각 dict 리스트
+    """
+    out: list[Violation] = []
+    for i, plate in enumerate(plates):
+        out.extend(validate_plate(plate, kerf, i, tol, guillotine))
+    if pieces is not None and unplaced is not None:
+        required = sum(c for _, _, c in pieces)
+        placed = sum(len(p['pieces']) for p in plates)
+        if placed + len(unplaced) != required:
+            out.append(Violation(
+                'count_mismatch', -1, f"배치 {placed} + 미배치 {len(unplaced)} ≠ 요청 {required}",
+            ))
+    return out
@@ -1,18 +1,78 @@
-"""시각화 모듈"""
-
-import matplotlib
-matplotlib.use('Agg')  # 비대화형 백엔드
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Rectangle as MPLRect
-from matplotlib import font_manager
+"""시각화 모듈
+
+matplotlib은 import에만 수백 ms가 걸리므로 모듈 수준에서 import 하지 않는다.
+첫 그리기 호출 때 `_pyplot()`이 백엔드 지정 + 한글 폰트 설정과 함께 한 번만
+불러온다 — 솔버 워커/웹 서버/CLI 시작 시간에 포함되지 않게.
+
+원판이 많으면 `visualize_solution(..., per_page=N)`으로 N장씩 나눈 페이지를
+프로세스 풀에서 따로 그려 번호 붙은 PNG로 저장한다. 워커마다 matplotlib/폰트
+초기화는 한 번만 하고, 한글 폰트 탐색 결과(`ttflist` 스캔)는 디스크에 캐시한다.
+"""
+
+import json
+import os
 import platform
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+_plt = None
+
+
+def _pyplot(verbose: bool = True):
+    """matplotlib.pyplot을 처음 쓸 때 불러와 초기화 (Agg 백엔드, 한글 폰트)"""
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # 비대화형 백엔드
+        import matplotlib.pyplot as plt
+        _plt = plt
+        setup_korean_font(verbose)
+        plt.rcParams['axes.unicode_minus'] = False
+    return _plt
+
+
+def _font_cache_path() -> Path:
+    """한글 폰트 탐색 결과 캐시 파일 (WOODCUT_CACHE_DIR > XDG_CACHE_HOME > ~/.cache)"""
+    base = os.environ.get('WOODCUT_CACHE_DIR')
+    if not base:
+        base = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'woodcut')
+    return Path(base) / 'korean_font.json'
+
+
+def _find_korean_font(candidates: list[str]) -> str | None:
+    """후보 중 설치된 첫 폰트 — `ttflist` 스캔 결과를 디스크에 캐시
 
-def setup_korean_font():
+    캐시 키는 matplotlib 버전 + OS + 후보 목록. 폰트를 새로 설치했다면 캐시 파일을
+    지우면 된다. 캐시를 못 쓰는 환경(읽기 전용 홈 등)에서는 매번 스캔한다.
+    """
+    import matplotlib
+    key = f"{matplotlib.__version__}|{platform.system()}|{','.join(candidates)}"
+    path = _font_cache_path()
+    try:
+        cached = json.loads(path.read_text(encoding='utf-8'))
+        if cached.get('key') == key:
+            return cached.get('font')
+    except (OSError, ValueError):
+        pass
+
+    from matplotlib import font_manager
+    available_fonts = {f.name for f in font_manager.fontManager.ttflist}
+    found = next((font for font in candidates if font in available_fonts), None)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'key': key, 'font': found}, ensure_ascii=False), encoding='utf-8')
+    except OSError:
+        pass
+    return found
+
+
+def setup_korean_font(verbose: bool = True):
     """한글 폰트 설정"""
+    if _plt is None:
+        _pyplot(verbose)  # 초기화 과정에서 이 함수가 다시 호출된다
+        return
+    plt = _plt
     system = platform.system()
     if system == 'Darwin':
         fonts = ['AppleGothic', 'AppleSDGothicNeo', 'Nanum Gothic']
@@ -21,160 +81,210 @@ def setup_korean_font():
     else:
         fonts = ['NanumGothic', 'Noto Sans CJK KR', 'UnDotum']
 
-    available_fonts = [f.name for f in font_manager.fontManager.ttflist]
-    for font in fonts:
-        if font in available_fonts:
-            plt.rcParams['font.family'] = font
+    font = _find_korean_font(fonts)
+    if font:
+        plt.rcParams['font.family'] = font
+        if verbose:
             print(f"폰트 설정: {font}")
-            return
-    print("⚠️  한글 폰트를 찾지 못했습니다.")
-
+        return
+    if verbose:
+        print("⚠️  한글 폰트를 찾지 못했습니다.")
 
-def visualize_solution(plates, pieces, strategy_name="unknown"):
-    """시각화 함수
 
-    Args:
-        plates: 패킹 결과 (각 원판의 조각 배치 및 절단선 정보)
-        pieces: 원본 조각 리스트 [(width, height, count), ...]
-        strategy_name: 전략 이름 (파일명에 사용)
-    """
-    # 색상
+def _piece_colors(pieces) -> dict:
+    """조각 종류 'WxH' → RGBA (Set3)"""
+    plt = _pyplot()
     piece_types = set(f"{w}x{h}" for w, h, _ in pieces)
-    colors = {ptype: plt.cm.Set3(i / len(piece_types))
-              for i, ptype in enumerate(sorted(piece_types))}
+    return {ptype: tuple(plt.cm.Set3(i / len(piece_types)))
+            for i, ptype in enumerate(sorted(piece_types))}
 
-    # 시각화
-    fig, axes = plt.subplots(1, len(plates), figsize=(10 * len(plates), 5))
-    if len(plates) == 1:
-        axes = [axes]
 
-    for plot_idx, plate in enumerate(plates):
-        ax = axes[plot_idx]
-
-        print(f"\n{'='*60}")
-        print(f"원판 {plot_idx + 1}")
-        print(f"배치된 조각: {len(plate['pieces'])}개")
-        print(f"절단 횟수: {len(plate['cuts'])}회\n")
-
-        # 절단선 순서 출력
-        print("절단 순서:")
-        for cut in plate['cuts']:
-            direction = "수평" if cut['direction'] == 'H' else "수직"
-            print(f"  {cut['order']:2d}. {direction} {cut['position']:4.0f}mm "
-                  f"(영역 {cut['region_x']:.0f},{cut['region_y']:.0f} "
-                  f"{cut['region_w']:.0f}×{cut['region_h']:.0f})")
-
-        # 조각들의 최종 크기 검증
-        print("\n조각 크기 검증 (상세):")
-        all_exact = True
-        for i, piece in enumerate(plate['pieces']):
-            required = f"{piece['width']}×{piece['height']}"
-
-            # 회전 고려
-            if piece.get('rotated', False):
-                req_w, req_h = piece['height'], piece['width']
-            else:
-                req_w, req_h = piece['width'], piece['height']
-
-            # placed_w/h가 없으면 아직 트리밍 안됨
-            if 'placed_w' not in piece or 'placed_h' not in piece:
-                actual = "트리밍 전"
-                match = "✗"
-                all_exact = False
-            else:
-                actual = f"{piece['placed_w']}×{piece['placed_h']}"
-                match = "✓" if (abs(piece['placed_w'] - req_w) <= 1 and
-                               abs(piece['placed_h'] - req_h) <= 1) else "✗"
-                if match == "✗":
-                    all_exact = False
-
-            pos = f"({piece['x']:.0f},{piece['y']:.0f})"
-            print(f"  [{i+1}] {match} 위치: {pos}, 필요: {required}, 실제: {actual}, 기대: {req_w}×{req_h}")
-
-        if all_exact:
-            print("\n  ✅ 모든 조각이 정확한 크기입니다")
+def _print_plate_report(plate, plot_idx):
+    """원판 1장의 절단 순서 + 조각 크기 검증 출력"""
+    print(f"\n{'='*60}")
+    print(f"원판 {plot_idx + 1}")
+    print(f"배치된 조각: {len(plate['pieces'])}개")
+    print(f"절단 횟수: {len(plate['cuts'])}회\n")
+
+    # 절단선 순서 출력
+    print("절단 순서:")
+    for cut in plate['cuts']:
+        direction = "수평" if cut['direction'] == 'H' else "수직"
+        print(f"  {cut['order']:2d}. {direction} {cut['position']:4.0f}mm "
+              f"(영역 {cut['region_x']:.0f},{cut['region_y']:.0f} "
+              f"{cut['region_w']:.0f}×{cut['region_h']:.0f})")
+
+    # 조각들의 최종 크기 검증
+    print("\n조각 크기 검증 (상세):")
+    all_exact = True
+    for i, piece in enumerate(plate['pieces']):
+        required = f"{piece['width']}×{piece['height']}"
+
+        # 회전 고려
+        if piece.get('rotated', False):
+            req_w, req_h = piece['height'], piece['width']
         else:
-            print("\n  ❌ 일부 조각이 부정확합니다")
-
-        ax.add_patch(MPLRect((0, 0), plate["width"], plate["height"],
-                             fill=False, edgecolor='black', linewidth=2))
-
-        total_area = 0
-        for piece in plate['pieces']:
-            x, y = piece['x'], piece['y']
-            # placed_w/h가 없으면 회전 고려한 크기 사용
-            if 'placed_w' in piece and 'placed_h' in piece:
-                w, h = piece['placed_w'], piece['placed_h']
-            else:
-                if piece.get('rotated', False):
-                    w, h = piece['height'], piece['width']
-                else:
-                    w, h = piece['width'], piece['height']
-            orig = piece['original']
-
-            piece_type = f"{orig[0]}x{orig[1]}"
-            color = colors[piece_type]
-
-            rect_patch = MPLRect((x, y), w, h,
-                                linewidth=1, edgecolor='black',
-                                facecolor=color, alpha=0.7)
-            ax.add_patch(rect_patch)
-
-            cx, cy = x + w/2, y + h/2
-            label = f"{w}×{h}"
-            if piece['rotated']:
-                label += "\n(회전)"
-            ax.text(cx, cy, label, ha='center', va='center',
-                   fontsize=8, fontweight='bold')
-
-            total_area += w * h
-
-        # 절단선 - 영역 내에서만
-        for cut in plate['cuts']:
-            if cut['direction'] == 'H':
-                ax.plot([cut['start'], cut['end']],
-                       [cut['position'], cut['position']],
-                       'r-', linewidth=2.5, alpha=0.8)
-                mid_x = (cut['start'] + cut['end']) / 2
-                ax.text(mid_x, cut['position'], str(cut['order']),
-                       ha='center', va='bottom', fontsize=11,
-                       fontweight='bold', color='red',
-                       bbox=dict(boxstyle='circle,pad=0.3', facecolor='white',
-                                edgecolor='red', linewidth=2))
-            else:
-                ax.plot([cut['position'], cut['position']],
-                       [cut['start'], cut['end']],
-                       'b-', linewidth=2.5, alpha=0.8)
-                mid_y = (cut['start'] + cut['end']) / 2
-                ax.text(cut['position'], mid_y, str(cut['order']),
-                       ha='left', va='center', fontsize=11,
-                       fontweight='bold', color='blue',
-                       bbox=dict(boxstyle='circle,pad=0.3', facecolor='white',
-                                edgecolor='blue', linewidth=2))
-
-        usage = total_area / (plate["width"] * plate["height"]) * 100
-        print(f"\n  사용률: {usage:.1f}%")
+            req_w, req_h = piece['width'], piece['height']
+
+        # placed_w/h가 없으면 아직 트리밍 안됨
+        if 'placed_w' not in piece or 'placed_h' not in piece:
+            actual = "트리밍 전"
+            match = "✗"
+            all_exact = False
+        else:
+            actual = f"{piece['placed_w']}×{piece['placed_h']}"
+            match = "✓" if (abs(piece['placed_w'] - req_w) <= 1 and
+                           abs(piece['placed_h'] - req_h) <= 1) else "✗"
+            if match == "✗":
+                all_exact = False
+
+        pos = f"({piece['x']:.0f},{piece['y']:.0f})"
+        print(f"  [{i+1}] {match} 위치: {pos}, 필요: {required}, 실제: {actual}, 기대: {req_w}×{req_h}")
+
+    if all_exact:
+        print("\n  ✅ 모든 조각이 정확한 크기입니다")
+    else:
+        print("\n  ❌ 일부 조각이 부정확합니다")
 
-        ax.set_xlim(0, plate["width"])
-        ax.set_ylim(0, plate["height"])
-        ax.set_aspect('equal')
-        ax.set_xlabel('가로 (mm)')
-        ax.set_ylabel('세로 (mm)')
-        ax.set_title(f'원판 {plot_idx + 1} ({plate["width"]}×{plate["height"]})\n사용률: {usage:.1f}% | 절단: {len(plate["cuts"])}회',
-                    fontsize=12, fontweight='bold')
-        ax.grid(True, alpha=0.3)
 
+def _print_totals(plates):
     print(f"\n{'='*60}")
     print(f"총 사용 원판: {len(plates)}장")
     print(f"총 절단 횟수: {sum(len(p['cuts']) for p in plates)}회")
 
+
+def _placed_size(piece):
+    # placed_w/h가 없으면 회전 고려한 크기 사용
+    if 'placed_w' in piece and 'placed_h' in piece:
+        return piece['placed_w'], piece['placed_h']
+    if piece.get('rotated', False):
+        return piece['height'], piece['width']
+    return piece['width'], piece['height']
+
+
+def _plate_usage(plate):
+    """원판 사용률 (%)"""
+    total_area = sum(w * h for w, h in map(_placed_size, plate['pieces']))
+    return total_area / (plate["width"] * plate["height"]) * 100
+
+
+def _draw_plate(ax, plate, plot_idx, colors):
+    """원판 1장을 ax에 그리고 사용률(%) 반환"""
+    from matplotlib.patches import Rectangle as MPLRect
+
+    ax.add_patch(MPLRect((0, 0), plate["width"], plate["height"],
+                         fill=False, edgecolor='black', linewidth=2))
+
+    for piece in plate['pieces']:
+        x, y = piece['x'], piece['y']
+        w, h = _placed_size(piece)
+        orig = piece['original']
+
+        piece_type = f"{orig[0]}x{orig[1]}"
+        color = colors[piece_type]
+
+        rect_patch = MPLRect((x, y), w, h,
+                            linewidth=1, edgecolor='black',
+                            facecolor=color, alpha=0.7)
+        ax.add_patch(rect_patch)
+
+        cx, cy = x + w/2, y + h/2
+        label = f"{w}×{h}"
+        if piece['rotated']:
+            label += "\n(회전)"
+        ax.text(cx, cy, label, ha='center', va='center',
+               fontsize=8, fontweight='bold')
+
+    # 절단선 - 영역 내에서만
+    for cut in plate['cuts']:
+        if cut['direction'] == 'H':
+            ax.plot([cut['start'], cut['end']],
+                   [cut['position'], cut['position']],
+                   'r-', linewidth=2.5, alpha=0.8)
+            mid_x = (cut['start'] + cut['end']) / 2
+            ax.text(mid_x, cut['position'], str(cut['order']),
+                   ha='center', va='bottom', fontsize=11,
+                   fontweight='bold', color='red',
+                   bbox=dict(boxstyle='circle,pad=0.3', facecolor='white',
+                            edgecolor='red', linewidth=2))
+        else:
+            ax.plot([cut['position'], cut['position']],
+                   [cut['start'], cut['end']],
+                   'b-', linewidth=2.5, alpha=0.8)
+            mid_y = (cut['start'] + cut['end']) / 2
+            ax.text(cut['position'], mid_y, str(cut['order']),
+                   ha='left', va='center', fontsize=11,
+                   fontweight='bold', color='blue',
+                   bbox=dict(boxstyle='circle,pad=0.3', facecolor='white',
+                            edgecolor='blue', linewidth=2))
+
+    usage = _plate_usage(plate)
+
+    ax.set_xlim(0, plate["width"])
+    ax.set_ylim(0, plate["height"])
+    ax.set_aspect('equal')
+    ax.set_xlabel('가로 (mm)')
+    ax.set_ylabel('세로 (mm)')
+    ax.set_title(f'원판 {plot_idx + 1} ({plate["width"]}×{plate["height"]})\n사용률: {usage:.1f}% | 절단: {len(plate["cuts"])}회',
+                fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    return usage
+
+
+def _add_legend(fig, colors):
+    from matplotlib import patches
     legend_elements = [patches.Patch(facecolor=colors[ptype], alpha=0.7,
                                     edgecolor='black', label=ptype)
-                      for ptype in sorted(piece_types)]
+                      for ptype in sorted(colors)]
     fig.legend(handles=legend_elements, loc='upper center',
-              bbox_to_anchor=(0.5, 0.98), ncol=len(piece_types))
+              bbox_to_anchor=(0.5, 0.98), ncol=len(colors))
 
-    plt.tight_layout()
+
+def _render_page(page_plates, first_idx, colors, filepath, dpi=150):
+    """원판 여러 장을 figure 1개(최대 2열 격자)로 그려 filepath에 저장"""
+    plt = _pyplot(verbose=False)
+    n = len(page_plates)
+    cols = min(n, 2)
+    rows = (n + cols - 1) // cols
+    fig, axes = plt.subplots(rows, cols, figsize=(10 * cols, 5 * rows), squeeze=False)
+    flat = axes.ravel()
+    for k, plate in enumerate(page_plates):
+        _draw_plate(flat[k], plate, first_idx + k, colors)
+    for ax in flat[n:]:
+        ax.set_visible(False)
+    _add_legend(fig, colors)
+    fig.tight_layout()
+    fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)  # 워커가 페이지를 계속 그려도 figure가 쌓이지 않게
+    return str(filepath)
+
+
+def _init_render_worker():
+    """렌더 워커 초기화 — matplotlib import + 한글 폰트 설정을 워커당 1회"""
+    _pyplot(verbose=False)
+
+
+def _drawable(plate):
+    """워커로 넘길 최소 원판 dict (GNode 트리/FreeSpace 같은 내부 상태 제외)"""
+    return {k: plate[k] for k in ('width', 'height', 'pieces', 'cuts')}
+
+
+def visualize_solution(plates, pieces, strategy_name="unknown", per_page=None, workers=None):
+    """시각화 함수
+
+    Args:
+        plates: 패킹 결과 (각 원판의 조각 배치 및 절단선 정보)
+        pieces: 원본 조각 리스트 [(width, height, count), ...]
+        strategy_name: 전략 이름 (파일명에 사용)
+        per_page: None이면 모든 원판을 PNG 1장에. 정수 N이면 원판 N장씩 나눈 페이지를
+            `cut_<전략>_<시각>_p001.png`부터 번호 붙은 파일로 따로 저장
+        workers: 페이지 모드의 렌더 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스)
+
+    Returns:
+        저장한 PNG 경로 리스트
+    """
+    plt = _pyplot()
+    colors = _piece_colors(pieces)
 
     # output 디렉토리 생성
     output_dir = Path('output')
@@ -182,10 +292,34 @@ def visualize_solution(plates, pieces, strategy_name="unknown"):
 
     # 파일명 생성: cut_<method name>_<datetime>.png
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    if per_page:
+        # 페이지 모드: 보고서는 여기서, 그리기는 렌더 워커에서
+        for plot_idx, plate in enumerate(plates):
+            _print_plate_report(plate, plot_idx)
+            print(f"\n  사용률: {_plate_usage(plate):.1f}%")
+        _print_totals(plates)
+        return _save_pages(plates, colors, output_dir / f'cut_{strategy_name}_{timestamp}', per_page, workers)
+
+    # 시각화
+    fig, axes = plt.subplots(1, len(plates), figsize=(10 * len(plates), 5))
+    if len(plates) == 1:
+        axes = [axes]
+
+    for plot_idx, plate in enumerate(plates):
+        _print_plate_report(plate, plot_idx)
+        usage = _draw_plate(axes[plot_idx], plate, plot_idx, colors)
+        print(f"\n  사용률: {usage:.1f}%")
+    _print_totals(plates)
+
+    _add_legend(fig, colors)
+    plt.tight_layout()
+
     filename = f'cut_{strategy_name}_{timestamp}.png'
     filepath = output_dir / filename
 
     plt.savefig(filepath, dpi=150, bbox_inches='tight')
+    plt.close(fig)
     print(f"\n시각화 파일 저장: {filepath}")
 
     # 저장된 이미지 자동 열기 (macOS)
@@ -195,8 +329,24 @@ def visualize_solution(plates, pieces, strategy_name="unknown"):
     except Exception as e:
         print(f"이미지 자동 열기 실패: {e}")
         print(f"수동으로 열어주세요: {filepath}")
+    return [filepath]
+
 
+def _save_pages(plates, colors, prefix, per_page, workers):
+    """원판을 per_page장씩 나눠 페이지별 PNG 저장 (프로세스 풀)"""
+    jobs = []
+    for page, start in enumerate(range(0, len(plates), per_page), 1):
+        page_plates = [_drawable(p) for p in plates[start:start + per_page]]
+        jobs.append((page_plates, start, colors, f"{prefix}_p{page:03d}.png"))
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        paths = [_render_page(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+            paths = list(pool.map(_render_page, *zip(*jobs)))
 
-# 폰트 설정 초기화
-setup_korean_font()
-plt.rcParams['axes.unicode_minus'] = False
+    print(f"\n시각화 파일 저장: {len(paths)}페이지 ({per_page}장씩) → {Path(prefix).parent}/")
+    for path in paths:
+        print(f"  {path}")
+    return [Path(p) for p in paths]
@@ -1,21 +1,106 @@
 """FastAPI 백엔드 서버 - Woodcut 웹 애플리케이션"""
 
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
-from ..strategies import RegionBasedPacker
-from ..strategies.region_based_split import RegionBasedPackerWithSplit
+from .. import metrics
+from ..compact import COMPACT_MEDIA_TYPE
+from ..service import solve_order_instrumented
+from ..strategies.stats import SearchStats
 
 # 파일 디렉토리 경로
 CURR_DIR = Path(__file__).parent
 STATIC_DIR = CURR_DIR / "static"
 
-app = FastAPI(title="Woodcut - 목재 재단 최적화")
+# 배치 요청 1건당 최대 주문 수 (요청 본문 크기 방어)
+MAX_BATCH_ORDERS = 1000
+
+# 솔버 워커 풀 — 첫 요청 때 생성. 솔버는 순수 CPU 작업이라 스레드로는
+# GIL 때문에 병렬화가 안 되고, 이벤트 루프를 막지 않도록 프로세스로 분리한다.
+_executor: Executor | None = None
+# 워커 풀에 제출됐지만 아직 끝나지 않은 주문 수 (큐 대기 + 실행 중)
+_in_flight = 0
+
+
+def _pool_size() -> int:
+    """워커 수 (WOODCUT_WORKERS 환경변수, 기본 CPU 수)"""
+    return int(os.environ.get("WOODCUT_WORKERS", "0")) or os.cpu_count() or 1
+
+
+def _get_executor() -> Executor:
+    """워커 풀 반환 — 첫 호출 때 `_pool_size()` 크기로 생성"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=_pool_size())
+    return _executor
+
+
+# 메트릭 — 요청 경로에서는 값만 갱신하고, 직렬화와 게이지 계산은 /metrics 스크레이프 때 한다
+REGISTRY = metrics.Registry()
+_REQUEST_SECONDS = REGISTRY.histogram(
+    "woodcut_request_duration_seconds",
+    "주문 1건 처리 시간 (워커 큐 대기 포함)",
+    ("strategy", "outcome"),
+)
+_SOLVE_SECONDS = REGISTRY.histogram(
+    "woodcut_solve_duration_seconds",
+    "워커 안에서 솔버가 실제로 실행된 시간",
+    ("strategy",),
+)
+_PLATES = REGISTRY.histogram(
+    "woodcut_plates_per_request", "주문 1건이 사용한 원판 수",
+    ("strategy",), metrics.COUNT_BUCKETS,
+)
+_PIECES = REGISTRY.histogram(
+    "woodcut_pieces_per_request", "주문 1건의 요청 조각 수",
+    ("strategy",), metrics.COUNT_BUCKETS,
+)
+_UNPLACED = REGISTRY.counter(
+    "woodcut_unplaced_pieces_total", "배치하지 못한 조각 수", ("strategy",),
+)
+_SOLVER_COUNTERS = {
+    field: REGISTRY.counter(
+        f"woodcut_solver_{field}_total", f"솔버 탐색 카운터 SearchStats.{field}", ("strategy",),
+    )
+    for field in SearchStats.FIELDS
+}
+_VALIDATE_SECONDS = REGISTRY.histogram(
+    "woodcut_validation_seconds_per_plate",
+    "원판 1장의 트리 불변식 검사 시간 (주문별 평균, WOODCUT_VALIDATE 정책이 고른 원판만)",
+    ("strategy",), (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+_BUSY_SECONDS = REGISTRY.counter(
+    "woodcut_worker_busy_seconds_total",
+    "워커 누적 실행 시간 — rate()/woodcut_workers = 워커 가동률",
+)
+_WORKERS = REGISTRY.gauge("woodcut_workers", "워커 풀 크기")
+_IN_FLIGHT = REGISTRY.gauge("woodcut_orders_in_flight", "제출됐지만 끝나지 않은 주문 수")
+_QUEUE_DEPTH = REGISTRY.gauge("woodcut_queue_depth", "빈 워커를 기다리는 주문 수")
+_UTILIZATION = REGISTRY.gauge("woodcut_worker_utilization", "현재 실행 중인 워커 비율 (0~1)")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """서버 종료 시 워커 풀 정리"""
+    global _executor
+    yield
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+app = FastAPI(title="Woodcut - 목재 재단 최적화", lifespan=lifespan)
 
 # CORS 설정 (개발 환경용)
 app.add_middleware(
@@ -60,6 +145,84 @@ class CuttingResponse(BaseModel):
     unplaced_pieces: list[dict] = []
 
 
+class BatchCuttingRequest(BaseModel):
+    """배치 재단 요청 모델 — 서로 독립인 주문 목록"""
+    orders: list[CuttingRequest]
+
+
+class BatchItemResult(BaseModel):
+    """배치 내 주문 1건의 결과 (실패해도 배치 전체는 계속 진행)"""
+    index: int
+    ok: bool
+    result: CuttingResponse | None = None
+    error: str | None = None
+
+
+class BatchCuttingResponse(BaseModel):
+    """배치 재단 응답 모델 — results는 orders와 같은 순서"""
+    total_orders: int
+    failed_orders: int
+    results: list[BatchItemResult]
+
+
+def _wants_compact(http_request: Request, format: str | None) -> bool:
+    """컴팩트 인코딩 선택 여부 — `?format=compact` 또는 Accept 헤더"""
+    if format is not None:
+        return format == "compact"
+    return COMPACT_MEDIA_TYPE in http_request.headers.get("accept", "")
+
+
+def _record_order(strategy: str, result: dict, stats: dict) -> None:
+    """성공한 주문 1건의 결과/탐색 통계를 메트릭에 반영"""
+    labels = {"strategy": strategy}
+    _SOLVE_SECONDS.observe(stats["solve_seconds"], labels)
+    _BUSY_SECONDS.inc(stats["solve_seconds"])
+    _PLATES.observe(result["plates_used"], labels)
+    _PIECES.observe(result["total_pieces"], labels)
+    unplaced = result["total_pieces"] - result["placed_pieces"]
+    if unplaced:
+        _UNPLACED.inc(unplaced, labels)
+    for field, counter in _SOLVER_COUNTERS.items():
+        if stats[field]:
+            counter.inc(stats[field], labels)
+    if stats["validated_plates"]:
+        _VALIDATE_SECONDS.observe(stats["validate_seconds"] / stats["validated_plates"], labels)
+
+
+async def _run_order(order: dict, compact: bool = False) -> dict:
+    """주문 1건을 워커 풀에서 실행하고 메트릭 기록"""
+    global _in_flight
+    strategy = order.get("strategy", "region_based")
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    _in_flight += 1
+    try:
+        result, stats = await loop.run_in_executor(
+            _get_executor(), solve_order_instrumented, order, compact
+        )
+    except Exception:
+        _REQUEST_SECONDS.observe(
+            time.perf_counter() - started, {"strategy": strategy, "outcome": "error"}
+        )
+        raise
+    finally:
+        _in_flight -= 1
+    _REQUEST_SECONDS.observe(
+        time.perf_counter() - started, {"strategy": strategy, "outcome": "ok"}
+    )
+    _record_order(strategy, result, stats)
+    return result
+
+
+async def _run_batch_item(index: int, order: dict, compact: bool = False) -> dict:
+    """배치 주문 1건 실행 — 예외를 결과 항목으로 변환"""
+    try:
+        result = await _run_order(order, compact)
+    except Exception as e:
+        return {"index": index, "ok": False, "result": None, "error": str(e)}
+    return {"index": index, "ok": True, "result": result, "error": None}
+
+
 @app.get("/")
 async def read_root():
     """루트 경로 - index.html 반환"""
@@ -67,43 +230,92 @@ async def read_root():
 
 
 @app.post("/api/cut", response_model=CuttingResponse)
-async def calculate_cutting(request: CuttingRequest):
-    """재단 계획 계산 API"""
+async def calculate_cutting(
+    request: CuttingRequest,
+    http_request: Request,
+    format: str | None = None,
+):
+    """재단 계획 계산 API
+
+    `?format=compact` 또는 `Accept: application/vnd.woodcut.compact+json`이면
+    plates를 컴팩트 열 지향 인코딩(`woodcut.compact`)으로 반환한다.
+    """
     if not request.pieces:
         raise HTTPException(status_code=400, detail="조각 정보가 없습니다")
     if not request.stocks:
         raise HTTPException(status_code=400, detail="원판 정보가 없습니다")
 
+    compact = _wants_compact(http_request, format)
     try:
-        pieces = [(p.width, p.height, p.count) for p in request.pieces]
-        stocks = [(s.width, s.height, s.count) for s in request.stocks]
-
-        if request.strategy == "region_based_split":
-            packer = RegionBasedPackerWithSplit(stocks, request.kerf, request.allow_rotation)
-        else:
-            packer = RegionBasedPacker(stocks, request.kerf, request.allow_rotation)
-        plates, unplaced = packer.pack(pieces)
-
-        # free_spaces는 FreeSpace 객체 포함 내부 상태라 JSON 직렬화 불가 + 클라이언트 미사용
-        for plate in plates:
-            plate.pop('free_spaces', None)
-
-        total_pieces = sum(p.count for p in request.pieces)
-        placed_pieces = total_pieces - len(unplaced)
-
-        return CuttingResponse(
-            success=(len(unplaced) == 0),
-            total_pieces=total_pieces,
-            placed_pieces=placed_pieces,
-            plates_used=len(plates),
-            plates=plates,
-            unplaced_pieces=unplaced,
-        )
+        result = await _run_order(request.model_dump(), compact)
+        if compact:
+            # 응답 모델 검증을 건너뛴다 — 정수 배열이라 검증할 구조가 없다
+            return JSONResponse(result, media_type=COMPACT_MEDIA_TYPE)
+        return CuttingResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/cut/batch", response_model=BatchCuttingResponse)
+async def calculate_cutting_batch(
+    request: BatchCuttingRequest,
+    http_request: Request,
+    stream: bool = False,
+    format: str | None = None,
+):
+    """배치 재단 계획 계산 API
+
+    주문들을 워커 풀에 동시에 분배한다. 기본은 모든 주문이 끝난 뒤 입력 순서대로
+    한 번에 응답하고, `?stream=true`면 주문이 끝나는 순서대로 NDJSON 한 줄씩
+    흘려보낸다 (각 줄의 `index`로 원래 주문을 식별). 컴팩트 인코딩 선택은
+    `/api/cut`과 같다 — 각 항목의 `result`가 컴팩트 형식이 된다.
+    """
+    if not request.orders:
+        raise HTTPException(status_code=400, detail="주문 정보가 없습니다")
+    if len(request.orders) > MAX_BATCH_ORDERS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"배치당 주문은 최대 {MAX_BATCH_ORDERS}개입니다",
+        )
+
+    compact = _wants_compact(http_request, format)
+    tasks = [
+        _run_batch_item(i, order.model_dump(), compact)
+        for i, order in enumerate(request.orders)
+    ]
+
+    if stream:
+        async def ndjson_lines():
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                yield json.dumps(item, ensure_ascii=False) + "\n"
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    results = await asyncio.gather(*tasks)
+    body = {
+        "total_orders": len(results),
+        "failed_orders": sum(1 for r in results if not r["ok"]),
+        "results": results,
+    }
+    if compact:
+        return JSONResponse(body, media_type=COMPACT_MEDIA_TYPE)
+    return BatchCuttingResponse(**body)
+
+
+@app.get("/metrics")
+async def read_metrics():
+    """Prometheus 스크레이프 엔드포인트 (text format 0.0.4)"""
+    workers = _pool_size()
+    busy = min(_in_flight, workers)
+    _WORKERS.set(workers)
+    _IN_FLIGHT.set(_in_flight)
+    _QUEUE_DEPTH.set(_in_flight - busy)
+    _UTILIZATION.set(busy / workers)
+    return PlainTextResponse(REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
 # 정적 파일 서빙 (HTML, CSS, JS)
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR), follow_symlink=True), name="static")
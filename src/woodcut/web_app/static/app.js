@@ -237,8 +237,13 @@ async function initPyodide() {
             'packing.py',       // 의존 없음 — base 클래스
             'rect.py',          // 의존 없음 — Rect / intersects
             'gnode.py',         // 의존 없음 — Guillotine tree primitives
-            'region_based.py',  // 위 3개에 의존
+            'stats.py',         // 의존 없음 — 솔버 탐색 카운터
+            'trace.py',         // 의존 없음 — 구조화 이벤트 추적 (기본 비활성)
+            'scoring.py',       // 의존 없음 — numpy 없으면 순수 파이썬 경로
+            'occupancy.py',     // rect, scoring 에 의존 — numpy 없으면 비활성
+            'region_based.py',  // 위 7개에 의존
             'region_based_split.py',  // region_based 에 의존
+            'compact.py',       // 의존 없음 — 결과 컴팩트 인코딩
         ];
         for (const name of modules) {
             const res = await fetch(`static/${name}?v=${Date.now()}`);
@@ -312,12 +317,13 @@ placed_pieces = total_pieces - len(unplaced)
     'total_pieces': total_pieces,
     'placed_pieces': placed_pieces,
     'plates_used': len(plates),
-    'plates': plates,
-    'unplaced_pieces': unplaced,
+    **encode_compact(plates, unplaced),
 }
         `);
 
-        const data = result.toJs({ dict_converter: Object.fromEntries });
+        // 중첩 dict 대신 정수 배열로 넘겨 PyProxy → JS 변환 비용을 줄이고 JS 쪽에서 복원
+        const data = decodeCompact(result.toJs({ dict_converter: Object.fromEntries }));
+        result.destroy();
         lastResult = { data, kerf, strategy, allowRotation };
         displayResult(data, kerf, strategy);
 
@@ -329,6 +335,48 @@ placed_pieces = total_pieces - len(unplaced)
     }
 }
 
+// ─────────────────────────────────────────────
+// Compact result decoding (compact.py 와 같은 스키마)
+// ─────────────────────────────────────────────
+const COMPACT_FORMAT = 'woodcut.compact/1';
+const CUT_DIRS = ['H', 'V'];
+
+function decodeCompact(data) {
+    if (data.format !== COMPACT_FORMAT) return data;
+    const types = data.piece_types;
+    const plates = data.plates.map(cp => {
+        const pieces = [];
+        for (let i = 0; i < cp.pieces.length; i += 4) {
+            const [w, h] = types[cp.pieces[i + 2]];
+            const rotated = cp.pieces[i + 3] === 1;
+            pieces.push({
+                width: w, height: h,
+                x: cp.pieces[i], y: cp.pieces[i + 1],
+                rotated,
+                placed_w: rotated ? h : w,
+                placed_h: rotated ? w : h,
+            });
+        }
+        const cuts = [];
+        for (let i = 0; i < cp.cuts.length; i += 4) {
+            cuts.push({
+                order: i / 4 + 1,
+                direction: CUT_DIRS[cp.cuts[i]],
+                position: cp.cuts[i + 1],
+                start: cp.cuts[i + 2],
+                end: cp.cuts[i + 3],
+            });
+        }
+        const plate = { width: cp.width, height: cp.height, pieces, cuts };
+        // 선택 키 — 어느 stock/잔재를 썼는지 (compact.py _PLATE_TAGS)
+        if (cp.stock_index !== undefined) plate.stock_index = cp.stock_index;
+        if (cp.remnant_id !== undefined) plate.remnant_id = cp.remnant_id;
+        return plate;
+    });
+    const unplaced = data.unplaced_pieces.map(t => ({ width: types[t][0], height: types[t][1] }));
+    return { ...data, plates, unplaced_pieces: unplaced };
+}
+
 // ─────────────────────────────────────────────
 // Result rendering
 // ─────────────────────────────────────────────
@@ -0,0 +1 @@
+../../compact.py
\ No newline at end of file
@@ -0,0 +1 @@
+../../strategies/occupancy.py
\ No newline at end of file
@@ -0,0 +1 @@
+../../strategies/scoring.py
\ No newline at end of file
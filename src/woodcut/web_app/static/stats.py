@@ -0,0 +1 @@
+../../strategies/stats.py
\ No newline at end of file
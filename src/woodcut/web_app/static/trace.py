@@ -0,0 +1 @@
+../../trace.py
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""공용 fixture — 웹 서버 테스트 클라이언트."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """woodcut.web_app.server의 TestClient (fastapi/httpx 없으면 skip)"""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+    from woodcut.web_app import server
+
+    # 테스트에서는 프로세스 풀 대신 스레드 풀 — 동작은 같고 기동이 빠르다
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(server, "_executor", pool)
+    yield TestClient(server.app)
+    pool.shutdown()
@@ -0,0 +1,77 @@
+"""배치 재단 API 테스트 — 순서 보존, 주문별 실패 격리, NDJSON 스트리밍."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+# client fixture는 conftest.py — 모듈 전체가 서버 테스트라 여기서 미리 skip
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+
+ORDER_A = {
+    "stocks": [{"width": 2440, "height": 1220, "count": 2}],
+    "pieces": [{"width": 800, "height": 310, "count": 2}],
+}
+ORDER_B = {
+    "stocks": [{"width": 2440, "height": 1220, "count": 5}],
+    "pieces": [
+        {"width": 800, "height": 310, "count": 2},
+        {"width": 644, "height": 310, "count": 3},
+    ],
+    "allow_rotation": False,
+}
+# 원판 수량 0 → 패커 생성 시 ValueError
+ORDER_BAD = {
+    "stocks": [{"width": 2440, "height": 1220, "count": 0}],
+    "pieces": [{"width": 100, "height": 100, "count": 1}],
+}
+
+
+def test_batch_results_in_input_order(client):
+    res = client.post("/api/cut/batch", json={"orders": [ORDER_B, ORDER_A]})
+    assert res.status_code == 200
+    body = res.json()
+    assert body["total_orders"] == 2
+    assert body["failed_orders"] == 0
+    assert [r["index"] for r in body["results"]] == [0, 1]
+    assert body["results"][0]["result"]["total_pieces"] == 5
+    assert body["results"][1]["result"]["total_pieces"] == 2
+    for r in body["results"]:
+        assert r["ok"] and r["result"]["success"]
+
+
+def test_batch_failure_is_isolated(client):
+    res = client.post("/api/cut/batch", json={"orders": [ORDER_A, ORDER_BAD]})
+    assert res.status_code == 200
+    body = res.json()
+    assert body["failed_orders"] == 1
+    ok, bad = body["results"]
+    assert ok["ok"] and ok["result"]["placed_pieces"] == 2
+    assert not bad["ok"] and "양수" in bad["error"]
+
+
+def test_batch_stream_ndjson(client):
+    res = client.post(
+        "/api/cut/batch?stream=true",
+        json={"orders": [ORDER_A, ORDER_B, ORDER_A]},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines() if line]
+    assert sorted(item["index"] for item in lines) == [0, 1, 2]
+    assert all(item["ok"] for item in lines)
+
+
+def test_batch_rejects_empty(client):
+    res = client.post("/api/cut/batch", json={"orders": []})
+    assert res.status_code == 400
+
+
+def test_single_cut_uses_same_solver(client):
+    res = client.post("/api/cut", json=ORDER_A)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["placed_pieces"] == 2
+    assert all("_tree_root" not in p for p in body["plates"])
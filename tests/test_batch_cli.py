@@ -0,0 +1,79 @@
+"""`woodcut solve` — 입력 형식, 순서/창 크기, 종료 코드."""
+from __future__ import annotations
+
+import io
+import json
+
+from woodcut.batch import EXIT_FAILED, EXIT_OK, EXIT_UNPLACED, EXIT_USAGE, main, run_batch
+from woodcut.jobs import iter_jobs
+
+STOCKS = [[2440, 1220, 2]]
+FITS = {'stocks': STOCKS, 'pieces': [[800, 310, 2], [644, 310, 3]], 'kerf': 5}
+OVERFLOW = {'stocks': [[1000, 500, 1]], 'pieces': [[900, 400, 3]]}
+
+
+def _lines(buf: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+def test_iter_jobs_formats(tmp_path):
+    (tmp_path / 'a.json').write_text(json.dumps({'orders': [FITS, FITS]}), encoding='utf-8')
+    (tmp_path / 'b.csv').write_text(
+        'type,width,height,count\npiece,800,310,2\npiece,600,400,1\n', encoding='utf-8')
+    (tmp_path / 'c.jsonl').write_text(json.dumps(FITS) + '\n\nnot json\n', encoding='utf-8')
+    (tmp_path / 'ignored.txt').write_text('x', encoding='utf-8')
+
+    jobs = list(iter_jobs([str(tmp_path)], defaults={'stocks': STOCKS, 'kerf': 3}))
+    assert [name for name, _, _ in jobs] == ['a[0]', 'a[1]', 'b', 'c:1', 'c:3']
+    csv_order = jobs[2][1]
+    assert csv_order['pieces'] == [(800, 310, 2), (600, 400, 1)]
+    assert csv_order['stocks'] == [(2440, 1220, 2)] and csv_order['kerf'] == 3
+    assert jobs[0][1]['kerf'] == 5  # 작업 값이 CLI 기본값보다 우선
+    assert jobs[4][1] is None and 'JSON' in jobs[4][2]
+
+
+def test_run_batch_keeps_window_bounded():
+    pulled = emitted = 0
+    max_in_flight = 0
+
+    def source():
+        nonlocal pulled
+        for i in range(12):
+            pulled += 1
+            yield f'job{i}', {**FITS, 'name': f'job{i}'}, None
+
+    def write(item):
+        nonlocal emitted, max_in_flight
+        max_in_flight = max(max_in_flight, pulled - emitted)
+        emitted += 1
+        out.append(item)
+
+    out: list[dict] = []
+    totals = run_batch(source(), write, workers=2, summary=True, window=3)
+    assert totals == {'jobs': 12, 'failed': 0, 'unplaced_jobs': 0, 'invalid_jobs': 0}
+    assert [item['index'] for item in out] == list(range(12))
+    assert max_in_flight <= 3
+    assert 'plates' not in out[0]['result']
+
+
+def test_main_exit_codes(tmp_path):
+    stdout = io.StringIO()
+    stdin = io.StringIO(json.dumps(FITS) + '\n')
+    assert main(['-j', '1'], stdin=stdin, stdout=stdout) == EXIT_OK
+    assert _lines(stdout)[0]['result']['plates_used'] >= 1
+
+    stdin = io.StringIO(json.dumps(FITS) + '\n' + json.dumps(OVERFLOW) + '\n')
+    stdout = io.StringIO()
+    assert main(['-', '-j', '2', '--unordered', '--summary'], stdin=stdin, stdout=stdout) == EXIT_UNPLACED
+    assert sorted(item['index'] for item in _lines(stdout)) == [0, 1]
+
+    stdin = io.StringIO(json.dumps(OVERFLOW) + '\n{"pieces": []}\n')
+    assert main(['-j', '1'], stdin=stdin, stdout=io.StringIO()) == EXIT_FAILED
+
+    assert main([str(tmp_path / 'missing.json')], stdout=io.StringIO()) == EXIT_USAGE
+
+    out = tmp_path / 'out.jsonl'
+    job = tmp_path / 'job.json'
+    job.write_text(json.dumps(FITS), encoding='utf-8')
+    assert main([str(job), '-j', '1', '--compact', '-o', str(out)]) == EXIT_OK
+    assert json.loads(out.read_text(encoding='utf-8'))['result']['format'] == 'woodcut.compact/1'
@@ -0,0 +1,87 @@
+"""벤치마크 — 생성기 재현성, 측정 기록 형식, 기준선 회귀 판정, 스케일링 분석."""
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.run import compare, run_case
+from benchmarks.scaling import analyze, fit_exponent, run_point
+from benchmarks.workloads import FAMILIES, generate, generate_sized, suite
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_generator_is_seeded(family):
+    a = generate(family, 30, seed=3, inventory='many')
+    b = generate(family, 30, seed=3, inventory='many')
+    c = generate(family, 30, seed=4, inventory='many')
+    assert a.pieces == b.pieces and a.stocks == b.stocks
+    assert a.pieces != c.pieces
+    assert a.total_pieces == 30
+    assert all(w > 0 and h > 0 and n > 0 for w, h, n in a.pieces)
+    assert len(a.stocks) >= 2
+
+
+def test_run_case_records_metrics():
+    wl = generate('cabinet', 8, seed=0, inventory='one')
+    rec = run_case('region_based', wl, repeat=1, memory=True)
+    assert rec['placed'] + rec['unplaced'] == wl.total_pieces
+    assert rec['plates'] >= 1 and 0 < rec['utilization'] <= 1
+    assert rec['seconds'] > 0 and rec['peak_kib'] > 0
+    assert rec['nodes']['backtrack_nodes'] > 0
+    assert 'anchor_backtrack' in rec['phases']
+
+
+def _rec(**kw):
+    base = {'workload': 'w', 'packer': 'p', 'seconds': 1.0, 'peak_kib': 100.0,
+            'plates': 3, 'unplaced': 0, 'utilization': 0.80}
+    base.update(kw)
+    return {'results': [base]}
+
+
+def test_compare_thresholds():
+    baseline = _rec()
+    assert compare(_rec(seconds=1.2), baseline) == []
+    [r] = compare(_rec(seconds=1.3), baseline)
+    assert r['metric'] == 'seconds'
+    assert compare(_rec(seconds=1.3), baseline, {'time': 0.5}) == []
+
+    metrics = {r['metric'] for r in compare(
+        _rec(plates=4, utilization=0.70, peak_kib=200.0), baseline)}
+    assert metrics == {'plates', 'utilization', 'peak_kib'}
+
+    # 기준선에 없는 작업은 비교 생략, 새로 생긴 예외는 회귀
+    assert compare(_rec(workload='other', seconds=9.0), baseline) == []
+    [r] = compare({'results': [{'workload': 'w', 'packer': 'p', 'error': 'boom'}]}, baseline)
+    assert r['metric'] == 'error'
+
+
+def test_suites_are_known():
+    assert {w.family for w in suite('standard')} == set(FAMILIES)
+    with pytest.raises(ValueError):
+        suite('nope')
+
+
+def test_generate_sized_controls_axes():
+    wl = generate_sized(50, 7, n_stock_types=3, seed=1)
+    assert wl.total_pieces == 50 and len(wl.pieces) == 7 and len(wl.stocks) == 3
+    assert len(generate_sized(3, 10).pieces) == 3  # 종류 수는 조각 수 이하
+
+
+def test_scaling_fit_and_knee():
+    assert fit_exponent([10, 100, 1000], [1.0, 100.0, 10000.0]) == pytest.approx(2.0)
+    assert fit_exponent([10], [1.0]) is None
+
+    rows = [
+        {'axis': 'pieces', 'rotation': True, 'pieces': n, 'status': 'ok',
+         'pack_s': t, 'anchor_s': t, 'strip_s': 0.0, 'rss_kib': 100}
+        for n, t in [(10, 0.01), (100, 0.1), (1000, 1.0)]
+    ] + [{'axis': 'pieces', 'rotation': True, 'pieces': 10000, 'status': 'timeout'}]
+    [summary] = analyze(rows)
+    assert summary['pack_s'] == pytest.approx(1.0)
+    assert summary['strip_s'] is None
+    assert summary['knee'] == (1000, 10000, 'timeout')
+
+
+def test_scaling_point_in_subprocess():
+    row = run_point(6, 2, 1, True, budget=60)
+    assert row['status'] == 'ok' and row['plates'] >= 1
+    assert row['anchor_s'] <= row['pack_s']
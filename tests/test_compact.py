@@ -0,0 +1,104 @@
+"""컴팩트 결과 인코딩 — 왕복 무손실 + 크기 감소 + 서버 선택 경로."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from woodcut.compact import COMPACT_FORMAT, COMPACT_MEDIA_TYPE, decode_compact, encode_compact
+from woodcut.remnants import RemnantStore, pack_with_remnants
+from woodcut.strategies.region_based import RegionBasedPacker
+
+
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2), (3000, 10, 1)]
+
+
+def _pack():
+    packer = RegionBasedPacker([(2440, 1220, 2)], kerf=5, allow_rotation=True)
+    return packer.pack(PIECES)
+
+
+def test_roundtrip_preserves_geometry():
+    plates, unplaced = _pack()
+    data = encode_compact(plates, unplaced)
+    assert data['format'] == COMPACT_FORMAT
+
+    dec_plates, dec_unplaced = decode_compact(json.loads(json.dumps(data)))
+    assert len(dec_plates) == len(plates)
+    for orig, dec in zip(plates, dec_plates):
+        assert (dec['width'], dec['height']) == (orig['width'], orig['height'])
+        assert dec['stock_index'] == orig['stock_index']
+        assert 'remnant_id' not in dec
+        assert [
+            (p['x'], p['y'], p['width'], p['height'], p['rotated'], p['placed_w'], p['placed_h'])
+            for p in dec['pieces']
+        ] == [
+            (p['x'], p['y'], p['width'], p['height'], bool(p.get('rotated')),
+             p['placed_w'], p['placed_h'])
+            for p in orig['pieces']
+        ]
+        assert [
+            (c['order'], c['direction'], c['position'], c['start'], c['end'])
+            for c in dec['cuts']
+        ] == [
+            (c['order'], c['direction'], c['position'], c['start'], c['end'])
+            for c in orig['cuts']
+        ]
+    assert [(p['width'], p['height']) for p in dec_unplaced] == [(3000, 10)]
+
+
+def test_roundtrip_keeps_stock_and_remnant():
+    stocks = [(2440, 1220, 2)]
+    with RemnantStore() as store:
+        store.add(900, 600)
+        plates, unplaced = pack_with_remnants(store, stocks, [(300, 200, 1)])
+    assert any('remnant_id' in p for p in plates)
+    dec_plates, _ = decode_compact(json.loads(json.dumps(encode_compact(plates, unplaced))))
+    assert [p['stock_index'] for p in dec_plates] == [p['stock_index'] for p in plates]
+    assert [p.get('remnant_id') for p in dec_plates] == [p.get('remnant_id') for p in plates]
+
+
+def test_compact_is_smaller():
+    plates, unplaced = _pack()
+    for plate in plates:
+        plate.pop('_tree_root', None)
+    full = len(json.dumps({'plates': plates, 'unplaced_pieces': unplaced}))
+    compact = len(json.dumps(encode_compact(plates, unplaced)))
+    assert compact * 4 < full, f"compact={compact}B full={full}B"
+
+
+def test_decode_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        decode_compact({'format': 'other', 'piece_types': [], 'plates': [], 'unplaced_pieces': []})
+
+
+ORDER = {
+    "stocks": [{"width": 2440, "height": 1220, "count": 2}],
+    "pieces": [{"width": p[0], "height": p[1], "count": p[2]} for p in PIECES],
+}
+
+
+def test_server_compact_via_query(client):
+    res = client.post("/api/cut?format=compact", json=ORDER)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith(COMPACT_MEDIA_TYPE)
+    body = res.json()
+    assert body["format"] == COMPACT_FORMAT
+    plates, unplaced = decode_compact(body)
+    assert sum(len(p["pieces"]) for p in plates) == body["placed_pieces"]
+    assert len(unplaced) == 1
+
+
+def test_server_compact_via_accept_header(client):
+    res = client.post("/api/cut", json=ORDER, headers={"Accept": COMPACT_MEDIA_TYPE})
+    assert res.json()["format"] == COMPACT_FORMAT
+    # 기본은 기존 스키마 유지
+    res = client.post("/api/cut", json=ORDER)
+    assert "format" not in res.json()
+    assert "width" in res.json()["plates"][0]["pieces"][0]
+
+
+def test_server_compact_batch(client):
+    res = client.post("/api/cut/batch?format=compact", json={"orders": [ORDER, ORDER]})
+    body = res.json()
+    assert [r["result"]["format"] for r in body["results"]] == [COMPACT_FORMAT] * 2
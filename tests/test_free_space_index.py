@@ -0,0 +1,148 @@
+"""FreeSpaceIndex — 리스트 전수 스캔(이전 구현)과 같은 배치 선택/분할 결과."""
+from __future__ import annotations
+
+import random
+
+from woodcut.packing import FreeSpace, FreeSpaceIndex
+from woodcut.strategies.region_based import RegionBasedPacker
+
+KERF = 5
+
+
+def _list_aligned(free_spaces, placed, piece, preferred_rotated, region, allow_rotation=True):
+    """이전 구현: 매번 정렬 좌표 재구성 + 전 공간 후보 생성 후 정렬"""
+    rx, ry, rw, rh = region
+    w, h = piece['width'], piece['height']
+    existing_x, existing_y = {rx}, {ry}
+    for p in placed:
+        existing_x |= {p['x'], p['x'] + p['pw'] + KERF}
+        existing_y |= {p['y'], p['y'] + p['ph'] + KERF}
+    candidates = []
+    for space in free_spaces:
+        if not (rx <= space.x < rx + rw and ry <= space.y < ry + rh):
+            continue
+        test_w, test_h = (h, w) if preferred_rotated else (w, h)
+        orients = [(test_w, test_h, 100 if preferred_rotated == (test_w == h) else 0)]
+        if allow_rotation:
+            orients.append((test_h, test_w, 0))
+        for tw, th, bonus in orients:
+            if tw + KERF <= space.width and th + KERF <= space.height:
+                align = (space.x in existing_x) + (space.y in existing_y)
+                waste = (space.width - tw) * (space.height - th)
+                candidates.append((-bonus, -align, waste, space, tw, th))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda c: c[:3])
+    return candidates[0]
+
+
+def _list_split(free_spaces, space, x, y, w, h):
+    free_spaces.remove(space)
+    if space.width > w + KERF:
+        free_spaces.append(FreeSpace(x + w + KERF, y, space.width - w - KERF, h + KERF))
+    if space.height > h + KERF:
+        free_spaces.append(FreeSpace(x, y + h + KERF, space.width, space.height - h - KERF))
+
+
+def _spaces(seq):
+    return [(s.x, s.y, s.width, s.height) for s in seq]
+
+
+def test_aligned_placement_matches_list_scan():
+    rng = random.Random(5)
+    packer = RegionBasedPacker([(2440, 1220, 1)], kerf=KERF)
+    for _ in range(60):
+        region = (rng.randrange(0, 200), rng.randrange(0, 200), rng.randrange(300, 1500), rng.randrange(300, 900))
+        rx, ry, rw, rh = region
+        ref = [FreeSpace(rx, ry, rw, rh)]
+        index = FreeSpaceIndex(KERF, [FreeSpace(rx, ry, rw, rh)], origin=(rx, ry))
+        ref_placed, placed = [], []
+        sizes = [(rng.randrange(40, 400), rng.randrange(40, 300)) for _ in range(3)]
+        for _ in range(rng.randrange(5, 40)):
+            w, h = rng.choice(sizes)
+            piece = {'width': w, 'height': h}
+            preferred = rng.random() < 0.3
+            expected = _list_aligned(ref, ref_placed, piece, preferred, region)
+            got = packer._find_placement_aligned(index, piece, preferred, *region)
+            if expected is None:
+                assert got is None
+                break
+            bonus, align, waste, space, tw, th = expected
+            assert (got['x'], got['y'], got['width'], got['height']) == (space.x, space.y, tw, th)
+            assert (got['rotation_bonus'], got['alignment_score'], got['waste']) == (-bonus, -align, waste)
+
+            _list_split(ref, space, space.x, space.y, tw, th)
+            ref_placed.append({'x': space.x, 'y': space.y, 'pw': tw, 'ph': th})
+            packer._apply_placement(index, placed, piece, got)
+            assert _spaces(index) == _spaces(ref)
+
+
+def test_best_fit_simple_matches_min_waste():
+    rng = random.Random(9)
+    packer = RegionBasedPacker([(2440, 1220, 1)], kerf=KERF)
+    for _ in range(200):
+        spaces = [FreeSpace(rng.randrange(0, 2000), rng.randrange(0, 1000), rng.randrange(10, 600), rng.randrange(10, 600))
+                  for _ in range(rng.randrange(1, 30))]
+        piece = {'width': rng.randrange(5, 300), 'height': rng.randrange(5, 300)}
+        w, h = piece['width'], piece['height']
+        candidates = []
+        for s in spaces:
+            for pw, ph, rot in ((w, h, False), (h, w, True)):
+                if pw + KERF <= s.width and ph + KERF <= s.height:
+                    candidates.append(((s.width - pw) * (s.height - ph), s, rot))
+        got = packer._find_best_placement_simple(FreeSpaceIndex(KERF, spaces), [], piece)
+        if not candidates:
+            assert got is None
+            continue
+        waste, space, rotated = min(candidates, key=lambda c: c[0])
+        assert (got['waste'], got['space'], got['rotated']) == (waste, space, rotated)
+
+
+def test_recalculate_splits_only_overlapping_spaces():
+    packer = RegionBasedPacker([(1000, 600, 1)], kerf=KERF)
+    placed = [{'x': 0, 'y': 0, 'width': 300, 'height': 200},
+              {'x': 305, 'y': 0, 'width': 200, 'height': 200, 'rotated': True}]
+    index = packer._recalculate_free_spaces(placed, 1000, 600)
+    assert sorted(_spaces(index)) == [(0, 205, 1000, 395), (305, 205, 695, 395), (510, 0, 490, 600)]
+    assert {0, 305, 510} <= index.existing_x
+    assert len(index) == 3
+    index.remove(next(iter(index)))
+    assert len(index) == 2
+
+
+def _list_recalculate(placed, plate_w, plate_h):
+    """이전 구현: 겹치는 공간을 그 자리에서 우측·상단으로 바꿔 끼운 리스트"""
+    free_spaces = [FreeSpace(0, 0, plate_w, plate_h)]
+    for p in placed:
+        x, y, x2, y2 = p['x'], p['y'], p['x'] + p['width'] + KERF, p['y'] + p['height'] + KERF
+        new_free_spaces = []
+        for s in free_spaces:
+            if x >= s.x + s.width or x2 <= s.x or y >= s.y + s.height or y2 <= s.y:
+                new_free_spaces.append(s)
+                continue
+            if s.x + s.width > x2:
+                new_free_spaces.append(FreeSpace(x2, s.y, s.x + s.width - x2, s.height))
+            if s.y + s.height > y2:
+                new_free_spaces.append(FreeSpace(s.x, y2, s.width, s.y + s.height - y2))
+        free_spaces = new_free_spaces
+    return free_spaces
+
+
+def test_recalculate_keeps_list_order():
+    rng = random.Random(4)
+    packer = RegionBasedPacker([(2440, 1220, 1)], kerf=KERF)
+    for _ in range(100):
+        placed = [{'x': rng.randrange(0, 2200), 'y': rng.randrange(0, 1000),
+                   'width': rng.randrange(20, 400), 'height': rng.randrange(20, 300)}
+                  for _ in range(rng.randrange(1, 12))]
+        index = packer._recalculate_free_spaces(placed, 2440, 1220)
+        expected = [(s.x, s.y, s.width, s.height) for s in _list_recalculate(placed, 2440, 1220)]
+        assert _spaces(index) == expected
+        assert [index.seq(s) for s in index] == sorted(index.seq(s) for s in index)
+        piece = {'width': rng.randrange(5, 300), 'height': rng.randrange(5, 300)}
+        got = packer._find_best_placement_simple(index, placed, piece)
+        list_index = FreeSpaceIndex(KERF, _list_recalculate(placed, 2440, 1220))
+        want = packer._find_best_placement_simple(list_index, placed, piece)
+        assert (got is None) == (want is None)
+        if got is not None:
+            assert (got['x'], got['y'], got['rotated']) == (want['x'], want['y'], want['rotated'])
@@ -155,6 +155,23 @@ def t_deep_chain_matches_repro_topology():
     print("  [OK] deep_chain_matches_repro_topology")
 
 
+def t_tag_emitted_and_slotted():
+    """tag가 cut type으로 나가고, 노드는 __dict__ 없이 slot만 쓴다."""
+    root = GNode(x=0, y=0, w=1000, h=500)
+    top, _ = split_h(root, cut_y=200, kerf=KERF)
+    root.tag = 'region_boundary'
+    split_v(top, cut_x=300, kerf=KERF)
+    assert [c['type'] for c in emit_cuts(root)] == ['region_boundary', 'split']
+    assert not hasattr(root, '__dict__')
+    try:
+        root.note = 'x'
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("GNode accepted an undeclared attribute")
+    print("  [OK] tag_emitted_and_slotted")
+
+
 def main():
     tests = [
         t_leaf_only,
@@ -163,6 +180,7 @@ def main():
         t_invariant_violation_detected,
         t_piece_leaf_contained,
         t_deep_chain_matches_repro_topology,
+        t_tag_emitted_and_slotted,
     ]
     print("GNode smoke:")
     for t in tests:
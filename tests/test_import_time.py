@@ -0,0 +1,51 @@
+"""import 비용 회귀 테스트 — 솔버/CLI 경로가 matplotlib을 끌어오지 않는지.
+
+`python -X importtime`으로 새 프로세스에서 측정한다. matplotlib(~0.4s)이 다시
+끼어들면 예산을 크게 넘으므로 예산은 느린 CI에서도 여유 있게 잡는다.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# 솔버 워커/웹 워커/CLI 진입점이 import 하는 모듈
+ENTRY_MODULES = ('woodcut', 'woodcut.service', 'woodcut.batch', 'woodcut.cli', 'woodcut.profiling')
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """{모듈: 누적 import 시간(µs)} — 중첩 import는 이름 앞 공백으로 들여쓰기돼 있다"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+
+def test_entry_points_do_not_import_matplotlib():
+    times = _importtime(f"import {', '.join(ENTRY_MODULES)}")
+    assert not any(name.strip().startswith('matplotlib') for name in times)
+
+    # 최상위 import는 이름 앞 공백이 1칸
+    top_level = sum(us for name, us in times.items() if name[1:] in ENTRY_MODULES)
+    assert top_level > 0
+    assert top_level / 1e6 < IMPORT_BUDGET_SECONDS, times
+
+
+def test_visualize_solution_still_reachable_lazily():
+    proc = subprocess.run(
+        [sys.executable, '-c',
+         "import sys, woodcut; assert 'matplotlib' not in sys.modules; "
+         "from woodcut import visualize_solution; assert callable(visualize_solution); "
+         "assert 'matplotlib' not in sys.modules; "
+         "from woodcut.visualizer import _pyplot; _pyplot(); "
+         "assert 'matplotlib.pyplot' in sys.modules"],
+        capture_output=True, text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,74 @@
+"""주문 수정 증분 재계산 — 유지/재계산 원판 diff와 수량·재고 정합성."""
+from __future__ import annotations
+
+from collections import Counter
+
+from woodcut.incremental import repack
+from woodcut.strategies import RegionBasedPacker
+from woodcut.validate import validate_solution
+
+STOCKS = [(2440, 1220, 4), (1830, 915, 2)]
+PIECES = [(800, 310, 6), (644, 310, 5), (371, 270, 8), (369, 640, 4), (600, 500, 3)]
+KERF = 5
+
+
+def _solve(pieces):
+    return RegionBasedPacker(STOCKS, kerf=KERF).pack(pieces)
+
+
+def _check(result, pieces):
+    assert not validate_solution(result.plates, KERF, pieces, result.unplaced)
+    used = Counter(p['stock_index'] for p in result.plates)
+    assert all(used[i] <= c for i, (_, _, c) in enumerate(STOCKS))
+    for plate in result.plates:
+        w, h, _ = STOCKS[plate['stock_index']]
+        assert (plate['width'], plate['height']) == (w, h)
+
+
+def test_unchanged_order_keeps_everything():
+    plates, _ = _solve(PIECES)
+    result = repack(plates, STOCKS, PIECES, kerf=KERF)
+    assert result.kept == list(range(len(plates)))
+    assert result.removed == [] and result.added == []
+    assert all(a is b for a, b in zip(result.plates, plates))
+
+
+def test_added_pieces_reopen_last_plate_only():
+    plates, _ = _solve(PIECES)
+    edited = PIECES + [(300, 200, 2)]
+    result = repack(plates, STOCKS, edited, kerf=KERF)
+    _check(result, edited)
+    assert result.kept == list(range(len(plates) - 1))
+    assert result.removed == [len(plates) - 1]
+    assert result.added and not result.unplaced
+
+
+def test_removed_piece_repacks_affected_plate():
+    plates, _ = _solve(PIECES)
+    edited = [(w, h, c - 1 if (w, h) == (600, 500) else c) for w, h, c in PIECES]
+    result = repack(plates, STOCKS, edited, kerf=KERF)
+    _check(result, edited)
+    assert result.removed
+    holders = [i for i, p in enumerate(plates) if any((q['width'], q['height']) == (600, 500) for q in p['pieces'])]
+    assert set(result.removed) <= set(holders)
+    assert set(result.kept) == set(range(len(plates))) - set(result.removed)
+    assert result.as_dict()['plates_used'] == len(result.plates)
+
+
+def test_stock_exhausted_by_kept_plates():
+    stocks = [(2440, 1220, 1)]
+    plates, _ = RegionBasedPacker(stocks, kerf=KERF).pack([(800, 310, 2)])
+    result = repack(plates, stocks, [(800, 310, 2), (300, 200, 1)], kerf=KERF, reopen_last=False)
+    assert result.kept == [0] and not result.added
+    assert [(p['width'], p['height']) for p in result.unplaced] == [(300, 200)]
+
+
+def test_plates_without_stock_index_get_one():
+    plates, _ = _solve(PIECES)
+    for plate in plates:
+        del plate['stock_index']
+    edited = PIECES + [(300, 200, 2)]
+    result = repack(plates, STOCKS, edited, kerf=KERF)
+    assert result.kept
+    assert all(p.get('stock_index') is not None for p in result.plates)
+    _check(result, edited)
@@ -0,0 +1,73 @@
+"""MaxRects — 증분 갱신 결과가 전수 계산한 최대 빈 직사각형과 같은지, undo 복원."""
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+from woodcut.strategies.rect import MaxRects, Rect
+from woodcut.strategies.region_based import RegionBasedPacker
+
+W, H = 60, 40
+
+
+def _brute_force_maximal(used: list[Rect]) -> list[tuple[int, int, int, int]]:
+    """좌표 격자의 모든 직사각형 중 비어 있고 다른 빈 직사각형에 포함되지 않는 것"""
+    xs = sorted({0, W} | {r.x for r in used} | {r.x2 for r in used})
+    ys = sorted({0, H} | {r.y for r in used} | {r.y2 for r in used})
+    empty = []
+    for x1, x2 in combinations(xs, 2):
+        for y1, y2 in combinations(ys, 2):
+            if all(x2 <= u.x or u.x2 <= x1 or y2 <= u.y or u.y2 <= y1 for u in used):
+                empty.append((x1, y1, x2 - x1, y2 - y1))
+    return sorted(
+        r for r in empty
+        if not any(o != r and o[0] <= r[0] and o[1] <= r[1]
+                   and r[0] + r[2] <= o[0] + o[2] and r[1] + r[3] <= o[1] + o[3] for o in empty)
+    )
+
+
+def _random_used(rng: random.Random, n: int) -> list[Rect]:
+    used: list[Rect] = []
+    while len(used) < n:
+        w, h = rng.randrange(3, 20), rng.randrange(3, 15)
+        r = Rect(rng.randrange(0, W - w + 1), rng.randrange(0, H - h + 1), w, h)
+        if all(r.x2 <= u.x or u.x2 <= r.x or r.y2 <= u.y or u.y2 <= r.y for u in used):
+            used.append(r)
+    return used
+
+
+def test_incremental_matches_brute_force_and_undo():
+    rng = random.Random(11)
+    for _ in range(40):
+        used = _random_used(rng, rng.randrange(1, 6))
+        space = MaxRects(W, H)
+        states = [list(space.free)]
+        for i, r in enumerate(used, 1):
+            space.place(r)
+            assert space.free == _brute_force_maximal(used[:i])
+            states.append(list(space.free))
+        for expected in reversed(states[:-1]):
+            space.undo()
+            assert space.free == expected
+
+
+def test_free_rects_independent_of_placement_order():
+    used = [Rect(0, 0, 20, 10), Rect(30, 5, 10, 20), Rect(5, 25, 15, 10)]
+    orders = [used, used[::-1], [used[1], used[0], used[2]]]
+    results = []
+    for order in orders:
+        space = MaxRects(W, H)
+        for r in order:
+            space.place(r)
+        results.append(space.free)
+    assert results[0] == results[1] == results[2]
+
+
+def test_recursive_2d_allocator_uses_maximal_rects():
+    groups = [{'size': s, 'count': 2} for s in [(600, 400), (500, 300), (800, 200), (300, 300)]]
+    packer = RegionBasedPacker([(2440, 1220, 1)], kerf=5)
+    regions = packer._allocate_recursive_2d([{'groups': groups}], [])
+    assert sum(r['groups'][0]['count'] for r in regions) == 8
+    for a, b in combinations(regions, 2):
+        assert (a['x'] + a['width'] <= b['x'] or b['x'] + b['width'] <= a['x']
+                or a['y'] + a['height'] <= b['y'] or b['y'] + b['height'] <= a['y'])
@@ -0,0 +1,101 @@
+"""메트릭 — 텍스트 형식, 솔버 탐색 카운터, /metrics 엔드포인트."""
+from __future__ import annotations
+
+import pytest
+
+from woodcut.metrics import Registry
+from woodcut.service import solve_order_instrumented
+from woodcut.strategies.region_based import RegionBasedPacker, ValidationPolicy
+
+
+def test_histogram_render_is_cumulative():
+    reg = Registry()
+    hist = reg.histogram("t_seconds", "test", ("strategy",), buckets=(0.1, 1.0))
+    for v in (0.05, 0.5, 0.5, 3.0):
+        hist.observe(v, {"strategy": "a"})
+    text = reg.render()
+    assert "# TYPE t_seconds histogram" in text
+    assert 't_seconds_bucket{strategy="a",le="0.1"} 1' in text
+    assert 't_seconds_bucket{strategy="a",le="1"} 3' in text
+    assert 't_seconds_bucket{strategy="a",le="+Inf"} 4' in text
+    assert 't_seconds_count{strategy="a"} 4' in text
+
+
+def test_counter_labels_and_duplicate_name():
+    reg = Registry()
+    c = reg.counter("t_total", "test", ("strategy",))
+    c.inc(2, {"strategy": 'x"y'})
+    assert 't_total{strategy="x\\"y"} 2' in reg.render()
+    with pytest.raises(ValueError):
+        reg.counter("t_total", "dup")
+
+
+def test_search_stats_counted():
+    pieces = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+    packer = RegionBasedPacker([(2440, 1220, 2)], kerf=5, allow_rotation=True)
+    packer.pack(pieces)
+    stats = packer.stats.as_dict()
+    assert stats["backtrack_nodes"] > 0
+    # 앵커 순서만 다른 경로가 같은 상태로 모인다
+    assert stats["cache_hits"] > 0
+    assert stats["fallback_shelf"] == 0
+
+    # pack() 재호출 시 카운터는 새로 시작
+    packer.pack([(100, 100, 1)])
+    assert packer.stats.backtrack_nodes < stats["backtrack_nodes"]
+
+
+def test_split_and_fallback_counted():
+    # 원판보다 긴 조각 → 1차 백트래킹 실패 → 분할 재시도 / 기본 패커는 shelf 폴백
+    order = {"stocks": [(2440, 1220, 3)], "pieces": [(2500, 100, 1), (300, 300, 2)]}
+    _, stats = solve_order_instrumented({**order, "strategy": "region_based_split"})
+    assert stats["split_retries"] == 1
+    assert stats["solve_seconds"] > 0
+
+    _, stats = solve_order_instrumented({**order, "pieces": [(2500, 100, 1)]})
+    assert stats["fallback_shelf"] == 1
+    assert stats["pruned_branches"] >= 1
+
+
+def test_validation_policy_modes(monkeypatch):
+    pieces = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+    # 두 stock 모두 상한으로 걸러지지 않아 원판마다 2번 시뮬레이션
+    stocks = [(2440, 1220, 2), (1830, 1220, 2)]
+
+    def validated(policy):
+        packer = RegionBasedPacker(stocks, kerf=5, validation=policy)
+        plates, _ = packer.pack(pieces)
+        assert packer.profile.calls.get("validate_guillotine", 0) == packer.stats.validated_plates
+        return len(plates), len(packer.profile.stock_sims), packer.stats
+
+    plates, sims, stats = validated("committed")
+    assert stats.validated_plates == plates and stats.validate_seconds > 0
+    assert sims > plates  # 버려진 후보 시뮬레이션은 검사하지 않는다
+    assert validated("always")[2].validated_plates == sims
+    assert validated("off")[2].validated_plates == 0
+    assert validated(ValidationPolicy("sampled", 0.0))[2].validated_plates == 0
+    assert validated("sampled:1")[2].validated_plates == plates
+
+    monkeypatch.setenv(ValidationPolicy.ENV_VAR, "off")
+    assert RegionBasedPacker(stocks).validation.mode == "off"
+    monkeypatch.setenv(ValidationPolicy.ENV_VAR, "sampled:2")
+    with pytest.raises(ValueError):
+        RegionBasedPacker(stocks)
+
+
+def test_metrics_endpoint(client):
+    order = {
+        "stocks": [{"width": 2440, "height": 1220, "count": 2}],
+        "pieces": [{"width": 800, "height": 310, "count": 2}],
+    }
+    assert client.post("/api/cut", json=order).status_code == 200
+    res = client.get("/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain")
+    text = res.text
+    assert 'woodcut_request_duration_seconds_count{strategy="region_based",outcome="ok"}' in text
+    assert 'woodcut_solver_backtrack_nodes_total{strategy="region_based"}' in text
+    assert 'woodcut_plates_per_request_bucket{strategy="region_based",le="1"}' in text
+    assert 'woodcut_validation_seconds_per_plate_count{strategy="region_based"} 1' in text
+    assert "woodcut_queue_depth 0" in text
+    assert "woodcut_worker_utilization 0" in text
@@ -0,0 +1,108 @@
+"""OccupancyGrid — 압축 좌표 래스터 질의를 단위 격자 전수 계산과 대조."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from woodcut.strategies import RegionBasedPacker, occupancy
+from woodcut.strategies.occupancy import OccupancyGrid, occupancy_grid
+from woodcut.strategies.rect import Rect
+
+pytest.importorskip('numpy')
+
+W, H = 40, 30
+
+
+def _cover(rects):
+    cover = [[0] * W for _ in range(H)]
+    for r in rects:
+        for y in range(max(r.y, 0), min(r.y2, H)):
+            for x in range(max(r.x, 0), min(r.x2, W)):
+                cover[y][x] += 1
+    return cover
+
+
+def _area(cover, x, y, w, h, depth):
+    return sum(1 for yy in range(max(y, 0), min(y + h, H)) for xx in range(max(x, 0), min(x + w, W))
+               if cover[yy][xx] >= depth)
+
+
+def _largest_free(cover):
+    pre = [[0] * (W + 1) for _ in range(H + 1)]
+    for y in range(H):
+        for x in range(W):
+            pre[y + 1][x + 1] = pre[y][x + 1] + pre[y + 1][x] - pre[y][x] + (cover[y][x] > 0)
+    best = 0
+    for y1 in range(H):
+        for y2 in range(y1 + 1, H + 1):
+            for x1 in range(W):
+                for x2 in range(x1 + 1, W + 1):
+                    if pre[y2][x2] - pre[y1][x2] - pre[y2][x1] + pre[y1][x1]:
+                        break
+                    best = max(best, (x2 - x1) * (y2 - y1))
+    return best
+
+
+def _random_rects(rng, n):
+    return [Rect(rng.randrange(-3, W), rng.randrange(-3, H), rng.randrange(1, 15), rng.randrange(1, 12))
+            for _ in range(n)]
+
+
+def test_area_queries_match_unit_grid():
+    rng = random.Random(6)
+    for _ in range(40):
+        rects = _random_rects(rng, rng.randrange(0, 8))
+        grid = OccupancyGrid(W, H)
+        for r in rects:
+            grid.add(r)
+        cover = _cover(rects)
+        assert grid.overlap_area() == _area(cover, 0, 0, W, H, 2)
+        for _ in range(30):
+            q = (rng.randrange(-5, W), rng.randrange(-5, H), rng.randrange(0, 25), rng.randrange(0, 20))
+            covered = _area(cover, *q, 1)
+            assert grid.covered_area(*q) == covered
+            assert grid.is_free(*q) == (covered == 0)
+            assert grid.overlap_area(*q) == _area(cover, *q, 2)
+
+
+def test_largest_free_rect_matches_brute_force():
+    rng = random.Random(8)
+    for _ in range(8):
+        rects = _random_rects(rng, rng.randrange(0, 6))
+        grid = OccupancyGrid(W, H, rects)
+        found = grid.largest_free_rect()
+        expected = _largest_free(_cover(rects))
+        if not expected:
+            assert found is None
+            continue
+        x, y, w, h = found
+        assert w * h == expected
+        assert grid.is_free(x, y, w, h)
+
+
+def test_incremental_add_and_factory_threshold():
+    grid = OccupancyGrid(100, 100, [Rect(0, 0, 50, 50)])
+    assert not grid.is_free(49, 49, 5, 5)
+    assert grid.is_free(50, 0, 50, 100)
+    grid.add(Rect(60, 10, 10, 10))
+    assert not grid.is_free(50, 0, 50, 100)
+    assert grid.covered_area(0, 0, 100, 100) == 2600
+    assert occupancy_grid(100, 100, [Rect(0, 0, 1, 1)], min_rects=2) is None
+    assert len(occupancy_grid(100, 100, [Rect(0, 0, 1, 1)] * 2, min_rects=2)) == 2
+
+
+def test_trim_placement_uses_grid_without_changing_result(monkeypatch):
+    # trim 공간으로 200×150 조각이 옮겨지는 입력
+    pieces = [(600, 500, 3), (600, 300, 2), (200, 150, 8)]
+    stocks = [(2440, 1220, 3)]
+    baseline = RegionBasedPacker(stocks, kerf=5).pack(pieces)
+
+    monkeypatch.setattr(occupancy, 'OCCUPANCY_MIN_RECTS', 0)
+    queries = []
+    real_is_free = OccupancyGrid.is_free
+    monkeypatch.setattr(OccupancyGrid, 'is_free',
+                        lambda self, *q: queries.append(q) or real_is_free(self, *q))
+    with_grid = RegionBasedPacker(stocks, kerf=5).pack(pieces)
+    assert queries
+    assert [p['cuts'] for p in with_grid[0]] == [p['cuts'] for p in baseline[0]]
@@ -0,0 +1,44 @@
+"""pack(profile=...) 단계별 계측 — 반환값 호환 + 단계/후보 기록."""
+from __future__ import annotations
+
+from woodcut.strategies import PackProfile, RegionBasedPacker
+from woodcut.strategies.region_based_split import RegionBasedPackerWithSplit
+
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+STOCKS = [(2440, 1220, 2), (1830, 915, 2)]
+
+
+def test_profile_filled_without_changing_result():
+    plain = RegionBasedPacker(STOCKS, kerf=5).pack(PIECES)
+
+    prof = PackProfile()
+    plates, unplaced = RegionBasedPacker(STOCKS, kerf=5).pack(PIECES, profile=prof)
+    assert [len(p['pieces']) for p in plates] == [len(p['pieces']) for p in plain[0]]
+    assert len(unplaced) == len(plain[1])
+
+    for phase in ('group_variants', 'anchor_backtrack', 'init_occupancy',
+                  'trim_optimize', 'multi_group_region', 'region_subtree', 'emit_cuts'):
+        assert prof.calls[phase] >= 1, phase
+        assert prof.phases[phase] >= 0.0
+    assert prof.total_seconds >= sum(s['seconds'] for s in prof.stock_sims)
+
+    # 작은 stock은 면적 상한으로도 큰 stock의 배치 수를 못 넘어 시뮬레이션 없이 건너뛴다
+    assert {s['stock_index'] for s in prof.stock_sims} == {0}
+    assert prof.search['pruned_stocks'] == len(plates)
+    assert {s['plate'] for s in prof.stock_sims} == set(range(1, len(plates) + 1))
+    assert prof.search['backtrack_nodes'] > 0
+
+    summary = prof.as_dict()
+    assert list(summary['phases'])[0] == 'group_variants'
+    assert 'anchor_backtrack' in prof.format_table()
+
+
+def test_split_packer_and_fallback_phases():
+    prof = PackProfile()
+    RegionBasedPackerWithSplit(STOCKS, kerf=5).pack(PIECES, profile=prof)
+    assert prof.calls['anchor_backtrack'] >= 1
+
+    packer = RegionBasedPacker([(2440, 1220, 1)], kerf=5)
+    packer.pack([(2500, 100, 1)])
+    # profile을 넘기지 않아도 self.profile에 남는다
+    assert packer.profile.calls['fallback_shelf'] == 1
@@ -0,0 +1,74 @@
+"""`woodcut profile` — 작업 파일 로드 + 프로파일 산출물."""
+from __future__ import annotations
+
+import json
+import pstats
+
+import pytest
+
+from woodcut.jobs import load_job, normalize_job
+from woodcut.profiling import main, profile_job
+
+JOB = {
+    'stocks': [{'width': 2440, 'height': 1220, 'count': 2}],
+    'pieces': [[800, 310, 2], [644, 310, 3], [371, 270, 4]],
+    'kerf': 5,
+}
+
+
+def test_normalize_job_accepts_dicts_and_triples():
+    order = normalize_job(JOB, name='fallback')
+    assert order['name'] == 'fallback'
+    assert order['stocks'] == [(2440, 1220, 2)]
+    assert order['pieces'][0] == (800, 310, 2)
+    assert order['allow_rotation'] is True and order['strategy'] == 'region_based'
+
+    with pytest.raises(ValueError):
+        normalize_job({'stocks': JOB['stocks'], 'pieces': []})
+    with pytest.raises(ValueError):
+        normalize_job({'stocks': [{'width': 1}], 'pieces': JOB['pieces']})
+    with pytest.raises(ValueError):
+        normalize_job({**JOB, 'kerf': None})
+
+
+def test_profile_job_writes_artifacts(tmp_path):
+    order = normalize_job(JOB, name='small')
+    report = profile_job(order, tmp_path, interval=0.0005, top=5)
+
+    assert report['plates'] >= 1 and report['unplaced'] == 0
+    assert report['profile'].calls['anchor_backtrack'] >= 1
+
+    stats = pstats.Stats(str(report['pstats']))
+    assert any(fn[2] == 'pack' for fn in stats.stats)
+
+    # collapsed: "root;...;leaf count" — 모든 스택이 _run_pack에서 시작
+    for line in report['collapsed'].read_text(encoding='utf-8').splitlines():
+        stack, count = line.rsplit(' ', 1)
+        assert stack.startswith('_run_pack (') and int(count) >= 1
+
+    alloc = report['alloc'].read_text(encoding='utf-8')
+    assert alloc.startswith('peak traced memory:')
+    assert report['peak_kib'] > 0
+
+
+def test_cli_main(tmp_path, capsys):
+    job = tmp_path / 'order.json'
+    job.write_text(json.dumps(JOB), encoding='utf-8')
+    assert load_job(job)['name'] == 'order'
+
+    assert main([str(job), '--out', str(tmp_path / 'out'), '--no-memory']) == 0
+    out = capsys.readouterr().out
+    assert 'anchor_backtrack' in out
+    assert (tmp_path / 'out' / 'order.pstats').exists()
+    assert not (tmp_path / 'out' / 'order.alloc.txt').exists()
+
+    bad = tmp_path / 'bad.json'
+    bad.write_text('{not json', encoding='utf-8')
+    assert main([str(bad)]) == 2
+
+
+def test_cli_main_rejects_bad_job(tmp_path, capsys):
+    job = tmp_path / 'order.json'
+    job.write_text(json.dumps({**JOB, 'kerf': None}), encoding='utf-8')
+    assert main([str(job), '--out', str(tmp_path / 'out')]) == 2
+    assert '작업 파일 오류' in capsys.readouterr().err
@@ -0,0 +1,66 @@
+"""region 서브트리 빌드 — 정렬 투영 split 탐색과 깊은 트리(재귀 한도 초과 깊이)."""
+from __future__ import annotations
+
+import random
+import sys
+
+from woodcut.strategies.gnode import GNode, emit_cuts, validate_guillotine
+from woodcut.strategies.region_based import RegionBasedPacker, _find_split
+
+KERF = 5
+
+
+def _piece(x, y, w, h):
+    return {'x': x, 'y': y, 'width': w, 'height': h, 'placed_w': w, 'placed_h': h}
+
+
+def _brute_force_split(pieces, lo, hi, kerf):
+    """이전 구현: x_end 후보마다 조각 전체를 다시 분류"""
+    for cut in sorted({p['x'] + p['placed_w'] for p in pieces}):
+        if not lo < cut < hi:
+            continue
+        left = [p for p in pieces if p['x'] + p['placed_w'] <= cut]
+        right = [p for p in pieces if p['x'] >= cut + kerf]
+        if len(left) + len(right) != len(pieces) or not left or not right:
+            continue
+        if min(p['x'] for p in right) != cut + kerf:
+            continue
+        return cut, left, right
+    return None
+
+
+def test_find_split_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(300):
+        pieces = []
+        x = 0
+        for _ in range(rng.randrange(2, 12)):
+            w = rng.randrange(10, 60)
+            pieces.append(_piece(x, rng.randrange(0, 40), w, 20))
+            x += w + rng.choice((KERF, KERF, 0, -20, 12))  # 정확한 kerf 간격 / 맞닿음 / 겹침 / 넓은 틈
+        rng.shuffle(pieces)
+        expected = _brute_force_split(pieces, 0, x + 100, KERF)
+        got = _find_split(pieces, 'x', 'placed_w', 'width', 0, x + 100, KERF)
+        if expected is None:
+            assert got is None
+            continue
+        cut, left, right = got
+        assert cut == expected[0]
+        assert sorted(map(id, left)) == sorted(map(id, expected[1]))
+        assert sorted(map(id, right)) == sorted(map(id, expected[2]))
+
+
+def test_deep_region_subtree_beyond_recursion_limit():
+    # 한 줄로 늘어선 조각 — V 컷 체인의 깊이 = 조각 수
+    n = sys.getrecursionlimit() + 200
+    w, h = 10, 50
+    placed = [_piece(i * (w + KERF), 0, w, h) for i in range(n)]
+    width = n * (w + KERF) + 100
+    packer = RegionBasedPacker([(width, 100, 1)], kerf=KERF)
+    root = GNode(x=0, y=0, w=width, h=100)
+
+    assert packer._build_region_subtree(root, placed, {'type': 'region'})
+    assert sum(1 for leaf in root.leaves() if leaf.kind == 'piece') == n
+    cuts = emit_cuts(root)
+    assert [c['order'] for c in cuts] == list(range(1, len(cuts) + 1))
+    assert validate_guillotine(root, kerf=KERF) == []
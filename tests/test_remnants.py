@@ -0,0 +1,128 @@
+"""잔재 재고 — 지배 질의를 전수 비교와 대조하고, 작업 사이 정산을 확인."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from woodcut.remnants import RemnantStore, minimal_sizes, pack_with_remnants, plate_remnants
+from woodcut.strategies import RegionBasedPacker
+
+STOCKS = [(2440, 1220, 2)]
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+
+
+def _holds(rw, rh, pw, ph, allow_rotation):
+    return (rw >= pw and rh >= ph) or (allow_rotation and rw >= ph and rh >= pw)
+
+
+def test_fitting_matches_brute_force():
+    rng = random.Random(1)
+    with RemnantStore() as store:
+        sizes = [(rng.randrange(50, 1500), rng.randrange(50, 1200)) for _ in range(2000)]
+        ids = store.add_many(sizes)
+        assert len(store) == 2000
+        for _ in range(30):
+            wanted = [(rng.randrange(50, 900), rng.randrange(50, 900)) for _ in range(rng.randrange(1, 5))]
+            for rot in (True, False):
+                got = store.fitting(wanted, rot)
+                expected = sorted(
+                    (w * h, i) for i, (w, h) in zip(ids, sizes)
+                    if any(_holds(w, h, pw, ph, rot) for pw, ph in wanted)
+                )
+                assert [r.id for r in got] == [i for _, i in expected]
+        assert [r.id for r in store.fits(300, 200, limit=3)] == [r.id for r in store.fits(200, 300)][:3]
+
+
+def test_minimal_sizes():
+    assert minimal_sizes([(300, 200), (200, 300), (400, 400), (100, 900)]) == [(100, 900), (200, 300)]
+    assert minimal_sizes([(300, 200), (200, 300)], allow_rotation=False) == [(200, 300), (300, 200)]
+
+
+def test_remnants_feed_next_job(tmp_path):
+    path = tmp_path / 'remnants.db'
+    plates, _ = RegionBasedPacker(STOCKS, kerf=5).pack(PIECES)
+    scraps = plate_remnants(plates[0])
+    assert scraps and all(min(s) >= 100 for s in scraps)
+
+    with RemnantStore(path) as store:
+        assert len(store.record_plate(plates[0], source='job-1')) == len(scraps)
+
+    # 다음 작업: 잔재 하나에 들어가는 작은 조각
+    with RemnantStore(path) as store:
+        smallest = store.fits(300, 100, limit=1)[0]
+        lease = store.lease(STOCKS, [(300, 100, 1)])
+        assert lease.stocks[0] == STOCKS[0] and lease.base == 1
+        # 조각 1개 작업은 잔재도 가장 작은 1장만 임대
+        assert lease.stocks[1:] == [(smallest.width, smallest.height, 1)]
+        assert lease.ids == [[smallest.id]]
+        assert len(store.fits(300, 100)) == len(scraps) - 1
+        assert store.release(lease) == 1
+        plates, unplaced = pack_with_remnants(store, STOCKS, [(300, 100, 1)], source='job-2')
+        assert not unplaced
+        plate = plates[0]
+        assert plate['stock_index'] >= 1 and 'remnant_id' in plate
+        assert (plate['width'], plate['height']) == lease.stocks[plate['stock_index']][:2]
+        # 쓴 잔재는 빠지고 그 잔재의 남은 scrap이 새로 들어온다
+        assert len(store) == len(scraps) - 1 + len(plate_remnants(plate))
+        assert plate['remnant_id'] not in {r.id for r in store.fits(1, 1)}
+
+
+def test_lease_without_fitting_remnants_keeps_stocks():
+    with RemnantStore() as store:
+        store.add(150, 150)
+        lease = store.lease(STOCKS, [(300, 200, 1)])
+        assert lease.stocks == STOCKS and lease.ids == []
+        plates, _ = pack_with_remnants(store, STOCKS, [(300, 200, 1)])
+        assert plates[0]['stock_index'] == 0 and 'remnant_id' not in plates[0]
+
+
+def test_lease_reserves_remnants_across_connections(tmp_path):
+    path = tmp_path / 'remnants.db'
+    with RemnantStore(path) as a, RemnantStore(path) as b:
+        ids = a.add_many([(600, 400), (600, 400), (900, 500)])
+        first = a.lease(STOCKS, [(300, 200, 3)])
+        assert sorted(i for group in first.ids for i in group) == ids
+        # 다른 연결은 임대 중인 잔재를 보지 못한다
+        assert b.lease(STOCKS, [(300, 200, 1)]).ids == []
+        assert b.fits(300, 200) == []
+
+        plates, _ = RegionBasedPacker(first.stocks, kerf=5).pack([(300, 200, 1)])
+        assert plates[0]['stock_index'] >= first.base
+        a.settle(first, plates)
+        # 쓴 1장은 빠지고 나머지는 임대가 풀린다
+        left = {r.id for r in b.fits(300, 200)}
+        assert plates[0]['remnant_id'] not in left
+        assert set(ids) - {plates[0]['remnant_id']} <= left
+
+
+def test_settle_rejects_remnant_taken_after_expiry():
+    with RemnantStore() as store:
+        store.add(600, 400)
+        first = store.lease(STOCKS, [(300, 200, 1)])
+        assert store.expire_leases(-1) == 1
+        second = store.lease(STOCKS, [(300, 200, 1)])
+        plates, _ = RegionBasedPacker(first.stocks, kerf=5).pack([(300, 200, 1)])
+        with pytest.raises(RuntimeError):
+            store.settle(first, plates)
+        assert len(store) == 1
+        store.release(second)
+        assert len(store.fits(300, 200)) == 1
+
+
+def test_concurrent_jobs_both_get_remnants(tmp_path):
+    path = tmp_path / 'remnants.db'
+    with RemnantStore(path) as a, RemnantStore(path) as b:
+        ids = a.add_many([(600, 400)] * 5 + [(900, 500)] * 5)
+        # 조각 2개 작업은 작은 잔재 2장만 임대하고 나머지는 다른 작업 몫
+        first = a.lease(STOCKS, [(300, 200, 2)])
+        assert first.stocks[first.base:] == [(600, 400, 2)] and first.ids == [ids[:2]]
+        second = b.lease(STOCKS, [(300, 200, 1), (500, 300, 3)])
+        assert second.stocks[second.base:] == [(600, 400, 3), (900, 500, 1)]
+        assert second.ids == [ids[2:5], ids[5:6]]
+        assert len(a.fits(300, 200)) == len(ids) - 6
+
+        for store, lease, pieces in ((a, first, [(300, 200, 2)]), (b, second, [(300, 200, 1), (500, 300, 3)])):
+            store.settle(lease, RegionBasedPacker(lease.stocks, kerf=5).pack(pieces)[0])
+        # 정산 후엔 임대 중인 잔재가 없다
+        assert len(a.fits(1, 1)) == len(a)
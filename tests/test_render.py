@@ -0,0 +1,83 @@
+"""SVG/PDF 렌더러 — 구조 유효성, GNode 트리에서 절단선 복원, 스트리밍 입력."""
+from __future__ import annotations
+
+import json
+import re
+import xml.etree.ElementTree as ET
+
+from woodcut.render import iter_result_plates, main, render_svg, write_pdf, write_svg
+from woodcut.service import solve_order
+from woodcut.strategies import RegionBasedPacker
+
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+STOCKS = [(2440, 1220, 2), (1830, 915, 2)]
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+def _plates():
+    plates, _ = RegionBasedPacker(STOCKS, kerf=5).pack(PIECES)
+    return plates
+
+
+def _check_pdf(data: bytes, pages: int) -> None:
+    assert data.startswith(b'%PDF-1.4')
+    assert data.rstrip().endswith(b'%%EOF')
+    xref = int(data.rsplit(b'startxref', 1)[1].split()[0])
+    entries = data[xref:].split(b'trailer')[0].splitlines()[3:]
+    for num, entry in enumerate(entries, 1):
+        offset = int(entry[:10])
+        assert data[offset:].startswith(f'{num} 0 obj'.encode()), num
+    assert re.search(rb'/Count (\d+)', data).group(1) == str(pages).encode()
+
+
+def test_svg_has_pieces_and_numbered_cuts(tmp_path):
+    plate = _plates()[0]
+    root = ET.fromstring(render_svg(plate, 1))
+    rects = root.findall(f'{SVG_NS}rect')
+    legend = len({p['original'] for p in plate['pieces']})
+    assert len(rects) == legend + 1 + len(plate['pieces'])  # 범례 + 원판 외곽 + 조각
+    assert len(root.findall(f'{SVG_NS}line')) == len(plate['cuts'])
+    numbers = [t.text for t in root.findall(f'{SVG_NS}text') if t.text and t.text.isdigit()]
+    assert numbers == [str(c['order']) for c in plate['cuts']]
+
+    plates = _plates()
+    paths = write_svg(iter(plates), tmp_path, stem='order')
+    assert [p.name for p in paths] == [f'order_p{i:03d}.svg' for i in range(1, len(plates) + 1)]
+
+
+def test_cuts_rebuilt_from_tree_when_missing():
+    plate = _plates()[0]
+    assert plate.get('_tree_root') is not None
+    expected = len(plate['cuts'])
+    without_cuts = {k: v for k, v in plate.items() if k != 'cuts'}
+    root = ET.fromstring(render_svg(without_cuts, 1))
+    assert len(root.findall(f'{SVG_NS}line')) == expected
+
+
+def test_pdf_one_page_per_plate_from_generator(tmp_path):
+    plates = _plates()
+    path = tmp_path / 'out.pdf'
+    assert write_pdf((p for p in plates), path) == len(plates)
+    _check_pdf(path.read_bytes(), len(plates))
+
+
+def test_render_cli_reads_solve_output(tmp_path):
+    order = {'stocks': STOCKS, 'pieces': PIECES, 'kerf': 5}
+    full = solve_order(order)
+    compact = solve_order(order, compact=True)
+    lines = [
+        {'index': 0, 'name': 'full', 'ok': True, 'result': full, 'error': None},
+        {'index': 1, 'name': 'bad', 'ok': False, 'result': None, 'error': 'x'},
+        {'index': 2, 'name': 'compact', 'ok': True, 'result': compact, 'error': None},
+    ]
+    src = tmp_path / 'res.jsonl'
+    src.write_text('\n'.join(json.dumps(rec) for rec in lines) + '\n', encoding='utf-8')
+
+    names = [(name, i) for name, i, _ in iter_result_plates(src)]
+    n = full['plates_used']
+    assert names == [('full', i) for i in range(1, n + 1)] + [('compact', i) for i in range(1, n + 1)]
+
+    pdf = tmp_path / 'all.pdf'
+    assert main([str(src), '--svg', str(tmp_path / 'svg'), '--pdf', str(pdf)]) == 0
+    _check_pdf(pdf.read_bytes(), 2 * n)
+    assert len(list((tmp_path / 'svg').glob('*.svg'))) == 2 * n
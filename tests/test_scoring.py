@@ -0,0 +1,71 @@
+"""선택적 numpy 점수 계산 — 벡터 경로와 순수 파이썬 경로가 같은 선택을 하는지."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from woodcut.packing import FreeSpace, FreeSpaceIndex
+from woodcut.strategies import RegionBasedPacker, scoring
+
+pytest.importorskip('numpy')
+
+KERF = 5
+
+
+def _variants(packer, rng, types):
+    pieces = [(rng.randint(50, 600), rng.randint(50, 500), rng.randint(1, 12)) for _ in range(types)]
+    groups = packer._group_by_exact_size(packer.expand_pieces(pieces))
+    return packer._flatten_group_options(packer._generate_group_options(groups))
+
+
+def test_variant_table_matches_python_filter():
+    rng = random.Random(2)
+    packer = RegionBasedPacker([(2440, 1220, 1)], kerf=KERF)
+    for _ in range(20):
+        variants = _variants(packer, rng, rng.randrange(4, 30))
+        remaining = {}
+        for v in variants:
+            remaining[v['original_size']] = rng.randrange(0, v['orig_count'] + 1)
+        unused = [v for v in variants if remaining[v['original_size']] >= v['count']]
+        table = scoring.VariantTable(variants, list(remaining))
+        for anchor in unused[:15]:
+            expected = packer._build_region_with_anchor(anchor, unused, remaining)
+            assert packer._build_region_with_anchor(anchor, unused, remaining, table) == expected
+
+
+def test_space_columns_match_bucket_scan():
+    rng = random.Random(4)
+    for _ in range(30):
+        spaces = [FreeSpace(rng.randrange(0, 3000), rng.randrange(0, 3000),
+                            rng.randrange(20, 600), rng.randrange(20, 600)) for _ in range(rng.randrange(1, 200))]
+        plain = FreeSpaceIndex(KERF, spaces, origin=(0, 0))
+        vector = FreeSpaceIndex(KERF, spaces, origin=(0, 0), columns=scoring.SpaceColumns(min_rows=0))
+        region = (0, 0, rng.randrange(500, 3000), rng.randrange(500, 3000))
+        for _ in range(20):
+            w, h = rng.randrange(10, 300), rng.randrange(10, 300)
+            for prefer in (None, region):
+                got, expected = vector.best_fit(w, h, prefer), plain.best_fit(w, h, prefer)
+                if expected is None:
+                    assert got is None
+                else:
+                    assert got[:3] == expected[:3]
+                    assert (got[3].x, got[3].y) == (expected[3].x, expected[3].y)
+            for index in (plain, vector):
+                found = index.best_fit(w, h)
+                if found is not None:
+                    index.split(found[3], found[3].x, found[3].y, w, h)
+        assert len(vector._columns) == len(vector)
+
+
+def test_pack_same_with_numpy_disabled(monkeypatch):
+    pieces = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2), (240, 240, 5)]
+    stocks = [(2440, 1220, 3)]
+    monkeypatch.setattr(scoring, 'MIN_VECTOR_VARIANTS', 1)
+    with_numpy = RegionBasedPacker(stocks, kerf=KERF).pack(pieces)
+    monkeypatch.setattr(scoring, 'NUMPY_SCORING', False)
+    assert scoring.space_columns() is None
+    assert scoring.variant_table([{}] * 100, []) is None
+    without = RegionBasedPacker(stocks, kerf=KERF).pack(pieces)
+    assert [p['cuts'] for p in with_numpy[0]] == [p['cuts'] for p in without[0]]
+    assert len(with_numpy[1]) == len(without[1])
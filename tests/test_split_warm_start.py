@@ -0,0 +1,71 @@
+"""분할 재시도 warm start — 1차 시도 상태를 이어받아도 결과가 같은지."""
+from __future__ import annotations
+
+import random
+
+from woodcut.strategies.region_based_split import RegionBasedPackerWithSplit, SplitAttempt
+
+STOCKS = [(2440, 1220, 3)]
+
+
+def _packer():
+    packer = RegionBasedPackerWithSplit(STOCKS, kerf=5)
+    packer.pack([(100, 100, 1)])  # stats/profile 초기화
+    return packer
+
+
+def _groups(packer, pieces):
+    return packer._group_by_exact_size(packer.expand_pieces(pieces))
+
+
+def test_cached_variants_match_flatten():
+    packer = _packer()
+    rng = random.Random(3)
+    for _ in range(10):
+        pieces = [(rng.randrange(50, 900), rng.randrange(50, 600), rng.randrange(1, 30)) for _ in range(6)]
+        groups = packer._split_oversized_groups(_groups(packer, pieces))
+        expected = packer._flatten_group_options(packer._generate_group_options(groups))
+        assert packer._cached_variants(groups, SplitAttempt()) == expected
+
+
+def test_retry_skips_backtrack_when_split_opens_nothing(monkeypatch):
+    packer = _packer()
+    calls = []
+    real = packer._allocate_anchor_backtrack
+    monkeypatch.setattr(packer, '_allocate_anchor_backtrack', lambda v: calls.append(v) or real(v))
+
+    groups = _groups(packer, [(1300, 1218, 3), (2500, 100, 2)])
+    attempt = SplitAttempt()
+    assert not packer._try_pack_groups(groups, attempt)['pieces']
+    assert attempt.failed and len(calls) == 1
+
+    split = packer._split_oversized_groups(groups)
+    assert len(split) > len(groups)
+    assert not packer._try_pack_groups(split, attempt)['pieces']
+    assert len(calls) == 1
+    # 새 chunk의 variant도 캐시에 남는다
+    assert {(g['size'], g['count']) for g in split} <= set(attempt.variants)
+
+    # 차갑게 돌려도 같은 실패
+    assert not packer._try_pack_groups(split)['pieces']
+    assert len(calls) == 2
+
+
+def test_retry_backtracks_when_new_anchor_fits():
+    packer = _packer()
+    attempt = SplitAttempt()
+    attempt.failed = True
+    attempt.pruned.add((2500, 2505))
+    groups = _groups(packer, [(300, 300, 4)])
+    plate = packer._try_pack_groups(groups, attempt)
+    assert len(plate['pieces']) == 4
+    assert not attempt.pruned - {(2500, 2505)}
+
+
+def test_pack_result_unchanged():
+    order = [(2500, 100, 2), (300, 300, 5), (800, 310, 3)]
+    packer = RegionBasedPackerWithSplit(STOCKS, kerf=5)
+    plates, unplaced = packer.pack(order)
+    assert packer.stats.split_retries >= 1
+    assert sum(len(p['pieces']) for p in plates) == 8
+    assert len(unplaced) == 2
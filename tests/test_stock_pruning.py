@@ -0,0 +1,63 @@
+"""stock 후보 가지치기 — 상한이 실제 시뮬레이션을 넘지 않고, 건너뛰어도 결과가 같은지."""
+from __future__ import annotations
+
+import random
+
+from woodcut.strategies import region_based
+from woodcut.strategies.region_based import RegionBasedPacker, stock_upper_bound
+
+KERF = 5
+
+
+def _pieces(rng):
+    return [(rng.randrange(100, 1300), rng.randrange(80, 700), rng.randrange(1, 6)) for _ in range(5)]
+
+
+def test_upper_bound_covers_simulation():
+    rng = random.Random(5)
+    for _ in range(12):
+        packer = RegionBasedPacker([(2440, 1220, 1)], kerf=KERF)
+        packer.pack([(100, 100, 1)])
+        pieces = packer.expand_pieces(_pieces(rng))
+        by_area = sorted(pieces, key=lambda p: p['width'] * p['height'])
+        w, h = rng.randrange(600, 2440), rng.randrange(400, 1220)
+        packer.plate_width, packer.plate_height = w, h
+        plate = packer._pack_single_plate(pieces)
+        bound_placed, bound_util = stock_upper_bound(w, h, by_area)
+        util = sum(p.get('placed_w', p['width']) * p.get('placed_h', p['height'])
+                   for p in plate['pieces']) / (w * h)
+        assert len(plate['pieces']) <= bound_placed
+        assert util <= bound_util
+
+
+def test_pruning_keeps_selection(monkeypatch):
+    rng = random.Random(9)
+    cases = []
+    for _ in range(6):
+        stocks = [(rng.choice((1220, 1830, 2440)), rng.choice((915, 1220)), rng.randrange(1, 3))
+                  for _ in range(4)]
+        cases.append((stocks, _pieces(rng)))
+
+    pruned = []
+    for stocks, pieces in cases:
+        packer = RegionBasedPacker(stocks, kerf=KERF)
+        pruned.append((packer.pack(pieces), packer.stats.pruned_stocks))
+    assert any(n for _, n in pruned)
+
+    # 상한을 끄면 같은 치수 중복만 빼고 전부 시뮬레이션한다
+    monkeypatch.setattr(region_based, 'stock_upper_bound', lambda *a: (10 ** 9, float('inf')))
+    for (stocks, pieces), ((plates, unplaced), _) in zip(cases, pruned):
+        full, full_unplaced = RegionBasedPacker(stocks, kerf=KERF).pack(pieces)
+        assert [(p['width'], p['height'], p['cuts']) for p in full] == \
+            [(p['width'], p['height'], p['cuts']) for p in plates]
+        assert len(full_unplaced) == len(unplaced)
+
+
+def test_duplicate_stocks_simulated_once():
+    pieces = [(600, 400, 6), (300, 200, 10)]
+    merged = RegionBasedPacker([(2440, 1220, 3)], kerf=KERF)
+    split = RegionBasedPacker([(2440, 1220, 1), (2440, 1220, 1), (2440, 1220, 1)], kerf=KERF)
+    plates, _ = merged.pack(pieces)
+    assert [p['cuts'] for p in split.pack(pieces)[0]] == [p['cuts'] for p in plates]
+    assert len(split.profile.stock_sims) == len(merged.profile.stock_sims)
+    assert split.stats.pruned_stocks == 2 * len(plates)
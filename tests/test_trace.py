@@ -0,0 +1,70 @@
+"""구조화 trace — 비활성 시 무출력, 레벨 필터, JSONL/링버퍼 sink."""
+from __future__ import annotations
+
+import io
+import json
+
+from woodcut.strategies import RegionBasedPacker
+from woodcut.strategies.region_based_split import RegionBasedPackerWithSplit
+from woodcut.trace import (
+    TRACE_DEBUG,
+    TRACE_INFO,
+    TRACE_WARNING,
+    JsonlSink,
+    RingBufferSink,
+    Tracer,
+    TRACER,
+    parse_trace_level,
+)
+
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4)]
+STOCKS = [(2440, 1220, 2), (1830, 915, 1)]
+
+
+def test_solver_silent_without_sinks(capsys):
+    assert not (TRACER.debug or TRACER.info or TRACER.warning)
+    RegionBasedPacker(STOCKS, kerf=5).pack(PIECES)
+    RegionBasedPackerWithSplit(STOCKS, kerf=5).pack(PIECES)
+    assert capsys.readouterr().out == ""
+
+
+def test_capture_collects_structured_events():
+    with TRACER.capture(TRACE_DEBUG) as ring:
+        assert TRACER.debug
+        plates, _ = RegionBasedPacker(STOCKS, kerf=5).pack(PIECES)
+    assert not TRACER.debug
+
+    selected = ring.events('pack.stock_selected')
+    assert len(selected) == len(plates)
+    assert selected[0]['plate'] == 1 and selected[0]['level'] == 'INFO'
+    assert '선택' in selected[0]['msg']
+    assert len(ring.events('pack.stock_candidate')) >= len(plates) * 1
+    assert ring.events('anchor.done') and ring.events('region.start')
+
+
+def test_level_filter_and_jsonl_sink():
+    tracer = Tracer()
+    buf = io.StringIO()
+    tracer.add_sink(JsonlSink(buf), TRACE_WARNING)
+    assert tracer.warning and not tracer.info
+
+    tracer.emit(TRACE_INFO, 'a.info', 'skip')
+    tracer.emit(TRACE_WARNING, 'a.warn', 'keep', size=(1, 2))
+    lines = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert [r['event'] for r in lines] == ['a.warn']
+    assert lines[0]['size'] == [1, 2]
+
+
+def test_ring_buffer_capacity():
+    tracer = Tracer()
+    ring = tracer.add_sink(RingBufferSink(capacity=3), TRACE_DEBUG)
+    for i in range(5):
+        tracer.emit(TRACE_DEBUG, 'tick', i=i)
+    assert [r['i'] for r in ring.records] == [2, 3, 4]
+    tracer.remove_sink(ring)
+    assert not tracer.debug
+
+
+def test_parse_trace_level():
+    assert parse_trace_level('debug') == TRACE_DEBUG
+    assert parse_trace_level(' Info ') == TRACE_INFO
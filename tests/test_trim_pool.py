@@ -0,0 +1,51 @@
+"""TrimCandidatePool — 높이 인덱스 질의가 이후 region 전수 수집 + 필터와 같은지."""
+from __future__ import annotations
+
+import random
+
+from woodcut.strategies.region_based import TrimCandidatePool
+
+
+def _regions(rng, n):
+    regions = []
+    for _ in range(n):
+        if rng.random() < 0.15:
+            regions.append({'type': 'scrap', 'rows': [{'groups': [], 'height': 0}]})
+            continue
+        groups = [{'original_size': (rng.randrange(40, 900), rng.randrange(40, 600)),
+                   'rotated': rng.random() < 0.5, 'count': rng.randrange(0, 4)} for _ in range(6)]
+        regions.append({'type': 'horizontal', 'rows': [{'groups': groups, 'height': 600}]})
+    return regions
+
+
+def _rescan(regions, after, max_w, max_h):
+    """예전 `_collect_trim_candidates` + strip 크기 필터"""
+    found = []
+    for ridx in range(after + 1, len(regions)):
+        r = regions[ridx]
+        if r['type'] == 'scrap':
+            continue
+        for g in r['rows'][0]['groups']:
+            ow, oh = g['original_size']
+            pw, ph = (oh, ow) if g['rotated'] else (ow, oh)
+            if g['count'] > 0 and pw <= max_w and ph <= max_h:
+                found.append((ridx, id(g), pw, ph, g['count']))
+    return found
+
+
+def test_query_matches_rescan_while_consuming():
+    rng = random.Random(12)
+    for _ in range(20):
+        regions = _regions(rng, rng.randrange(2, 25))
+        pool = TrimCandidatePool(regions)
+        for i in range(len(regions)):
+            for _ in range(4):
+                max_w, max_h = rng.randrange(50, 1500), rng.randrange(30, 500)
+                got = pool.query(i, max_w, max_h)
+                expected = _rescan(regions, i, max_w, max_h)
+                assert [(c['region_idx'], id(c['group_ref']), c['piece_w'], c['piece_h'], c['count'])
+                        for c in got] == expected
+                for c in got:
+                    for _ in range(rng.randrange(0, c['count'] + 1)):
+                        pool.consume(c)
+                        assert c['count'] == c['group_ref']['count']
@@ -0,0 +1,117 @@
+"""woodcut.validate — 솔버 결과 통과, 위반 주입 시 코드별 검출, sweep-line ↔ 쌍별 대조."""
+from __future__ import annotations
+
+import copy
+import io
+import json
+import random
+
+from woodcut.batch import EXIT_OK, main
+from woodcut.strategies import RegionBasedPacker
+from woodcut.validate import find_close_pairs, validate_plate, validate_solution
+
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+STOCKS = [(2440, 1220, 2)]
+KERF = 5
+
+
+def _piece(x, y, w, h):
+    return {'x': x, 'y': y, 'width': w, 'height': h, 'placed_w': w, 'placed_h': h,
+            'rotated': False, 'original': (w, h)}
+
+
+def _cut(order, d, pos, start, end):
+    return {'order': order, 'direction': d, 'position': pos, 'start': start, 'end': end}
+
+
+def _codes(violations) -> set[str]:
+    return {v.code for v in violations}
+
+
+def _two_piece_plate(second_x: int) -> dict:
+    """100x100 조각 두 개를 가로로 — 사이를 V 절단 1개로 가른다"""
+    return {
+        'width': 400, 'height': 100,
+        'pieces': [_piece(0, 0, 100, 100), _piece(second_x, 0, 100, 100)],
+        'cuts': [_cut(1, 'V', 100, 0, 100)],
+    }
+
+
+def test_solver_output_is_clean():
+    plates, unplaced = RegionBasedPacker(STOCKS, kerf=KERF).pack(PIECES)
+    assert validate_solution(plates, KERF, PIECES, unplaced) == []
+
+
+def test_valid_hand_built_plate():
+    assert validate_plate(_two_piece_plate(100 + KERF), KERF) == []
+
+
+def test_overlap_and_kerf_gap():
+    overlap = validate_plate(_two_piece_plate(50), KERF, guillotine=False)
+    assert [(v.code, v.pieces) for v in overlap] == [('overlap', (0, 1))]
+
+    touching = validate_plate(_two_piece_plate(102), KERF, guillotine=False)
+    assert [(v.code, v.pieces) for v in touching] == [('kerf_gap', (0, 1))]
+
+
+def test_cut_crossing_piece_and_unseparated():
+    plate = _two_piece_plate(100 + KERF)
+    plate['cuts'][0]['position'] = 150  # 두 번째 조각 한가운데
+    violations = validate_plate(plate, KERF)
+    assert [(v.code, v.pieces, v.cuts) for v in violations] == [('cut_crosses_piece', (1,), (1,))]
+
+    plate['cuts'] = []
+    violations = validate_plate(plate, KERF)
+    assert [(v.code, v.pieces) for v in violations] == [('unseparated_pieces', (0, 1))]
+
+
+def test_guillotine_order_and_cut_records():
+    plate = _two_piece_plate(100 + KERF)
+    # 원판 전체 폭을 관통하지 못하는 H 절단이 먼저 나오면 순서 위반
+    plate['cuts'] = [_cut(1, 'H', 50, 0, 200), _cut(2, 'V', 100, 0, 100)]
+    assert 'guillotine_order' in _codes(validate_plate(plate, KERF))
+
+    plate = _two_piece_plate(100 + KERF)
+    plate['cuts'].append(dict(plate['cuts'][0], order=2))
+    plate['cuts'].append(_cut(3, 'H', 50, 0, 900))
+    assert _codes(validate_plate(plate, KERF)) == {'duplicate_cut', 'cut_bounds'}
+
+
+def test_size_bounds_and_count():
+    plates, unplaced = RegionBasedPacker(STOCKS, kerf=KERF).pack(PIECES)
+    broken = copy.deepcopy(plates)
+    broken[0]['pieces'][0]['placed_w'] += 20
+    broken[0]['pieces'][1]['x'] = 2400
+    codes = _codes(validate_solution(broken, KERF, PIECES, unplaced + [{}]))
+    assert {'size_mismatch', 'out_of_bounds', 'count_mismatch'} <= codes
+
+
+def test_sweep_matches_pairwise_check():
+    rng = random.Random(7)
+    for _ in range(50):
+        rects = [(rng.randrange(0, 500), rng.randrange(0, 500), rng.randrange(1, 80), rng.randrange(1, 80))
+                 for _ in range(rng.randrange(2, 40))]
+        gap = rng.choice((0, 3))
+        expected = set()
+        for i, (xi, yi, wi, hi) in enumerate(rects):
+            for j in range(i + 1, len(rects)):
+                xj, yj, wj, hj = rects[j]
+                if (max(xj - (xi + wi), xi - (xj + wj)) < gap
+                        and max(yj - (yi + hi), yi - (yj + hj)) < gap):
+                    expected.add((i, j))
+        found = find_close_pairs(rects, gap)
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+
+
+def test_solve_cli_validate_flag():
+    order = {'stocks': STOCKS, 'pieces': PIECES, 'kerf': KERF}
+    out = io.StringIO()
+    stdin = io.StringIO(json.dumps(order) + '\n')
+    assert main(['-', '-j', '1', '--validate', '--summary'], stdin=stdin, stdout=out) == EXIT_OK
+    line = json.loads(out.getvalue())
+    assert line['result']['violations'] == []
+
+    out = io.StringIO()
+    main(['-', '-j', '1'], stdin=io.StringIO(json.dumps(order) + '\n'), stdout=out)
+    assert 'violations' not in json.loads(out.getvalue())['result']
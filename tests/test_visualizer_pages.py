@@ -0,0 +1,40 @@
+"""visualize_solution 페이지 모드 + 한글 폰트 탐색 캐시."""
+from __future__ import annotations
+
+import json
+
+from woodcut import visualizer
+from woodcut.strategies import RegionBasedPacker
+
+PIECES = [(800, 310, 2), (644, 310, 3), (371, 270, 4), (369, 640, 2)]
+
+
+def test_page_mode_writes_numbered_files(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('WOODCUT_CACHE_DIR', str(tmp_path / 'cache'))
+    plates, _ = RegionBasedPacker([(2440, 1220, 1)], kerf=5).pack(PIECES)
+    plates = plates * 3  # 3장 → 2장씩 2페이지
+
+    paths = visualizer.visualize_solution(plates, PIECES, 'pages', per_page=2, workers=2)
+    assert [p.name[-9:] for p in paths] == ['_p001.png', '_p002.png']
+    for p in paths:
+        assert p.read_bytes()[:8] == b'\x89PNG\r\n\x1a\n'
+    assert '2페이지' in capsys.readouterr().out
+
+
+def test_font_lookup_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv('WOODCUT_CACHE_DIR', str(tmp_path))
+    visualizer._pyplot(verbose=False)
+    candidates = ['NoSuchFont-A', 'DejaVu Sans']
+    assert visualizer._find_korean_font(candidates) == 'DejaVu Sans'
+
+    cache = tmp_path / 'korean_font.json'
+    data = json.loads(cache.read_text(encoding='utf-8'))
+    assert data['font'] == 'DejaVu Sans'
+
+    # 캐시가 있으면 ttflist를 다시 스캔하지 않는다
+    data['font'] = 'FromCache'
+    cache.write_text(json.dumps(data), encoding='utf-8')
+    assert visualizer._find_korean_font(candidates) == 'FromCache'
+    # 후보가 바뀌면 키가 달라져 다시 스캔
+    assert visualizer._find_korean_font(['DejaVu Sans']) == 'DejaVu Sans'